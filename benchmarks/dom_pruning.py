@@ -0,0 +1,150 @@
+# benchmarks/dom_pruning.py
+"""
+Per-iteration cost and browser memory of long scrapes for each collection
+mode (full re-query, --prune-dom, --delta-only, both) on a synthetic
+infinite timeline (benchmarks/timeline.html).
+
+Usage: python benchmarks/dom_pruning.py [--iterations 150] [--profile lean]
+Needs the profile's browser and driver (headless Firefox by default);
+psutil (optional) adds browser RSS figures.
+Exits with status 1 if a pruned or delta-only run slows down by more than
+--max-growth between the first and last tenth of the iterations, or if a
+pruned run's DOM node count or browser RSS grows by more than
+--max-memory-share of the full mode's growth over the same iterations.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import src.scraper  # noqa: E402
+from src.scraper import TwitterScraper  # noqa: E402
+
+TIMELINE_URL = "file://" + os.path.join(ROOT, "benchmarks", "timeline.html")
+
+
+def browser_rss_mb(driver):
+    try:
+        import psutil
+    except ImportError:
+        return None
+    process = psutil.Process(driver.service.process.pid)
+    processes = [process] + process.children(recursive=True)
+    return sum(p.memory_info().rss for p in processes) / 2**20
+
+
+MODES = {
+    "full": {},
+    "prune_dom": {"prune_dom": True},
+    "delta_only": {"delta_only": True},
+    "delta+prune": {"delta_only": True, "prune_dom": True},
+}
+
+
+def memory(driver):
+    dom_nodes = driver.execute_script(
+        "return document.getElementsByTagName('*').length;"
+    )
+    return dom_nodes, browser_rss_mb(driver)
+
+
+def growth(first, last):
+    if first is None or last is None:
+        return None
+    return last / first if first else float("inf")
+
+
+def run(mode, iterations, profile):
+    scraper = TwitterScraper(profile=profile)
+    try:
+        scraper.driver.get(TIMELINE_URL)
+        scraper.max_tweets = float("inf")
+        scraper.prune_dom = mode.get("prune_dom", False)
+        scraper.delta_only = mode.get("delta_only", False)
+        if scraper.delta_only:
+            scraper._install_card_observer()
+
+        timings = []
+        baseline = None
+        for i in range(iterations):
+            start = time.perf_counter()
+            for _ in scraper._collect_tweets(False, no_tweets_limit=True):
+                pass
+            timings.append((time.perf_counter() - start) * 1000)
+            if i == max(iterations // 10, 1) - 1:
+                baseline = memory(scraper.driver)
+
+        return timings, len(scraper.data), baseline, memory(scraper.driver)
+    finally:
+        scraper.driver.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=150)
+    parser.add_argument(
+        "--profile", default=None, help="Run profile (default firefox-headless)"
+    )
+    parser.add_argument(
+        "--max-growth",
+        type=float,
+        default=1.5,
+        help="Allowed last/first-tenth per-iteration time ratio (pruned/delta modes)",
+    )
+    parser.add_argument(
+        "--max-memory-share",
+        type=float,
+        default=0.5,
+        help="Allowed share of the full mode's node and RSS growth (pruned modes)",
+    )
+    args = parser.parse_args()
+
+    # Measure the scraper's own cost, not its fixed waits for the page
+    src.scraper.sleep = lambda seconds: None
+
+    failed = False
+    tenth = max(args.iterations // 10, 1)
+    full_growth = None  # (nodes, rss) growth of the unpruned mode
+    for name, mode in MODES.items():
+        timings, tweets, baseline, end = run(mode, args.iterations, args.profile)
+        first = statistics.median(timings[:tenth])
+        last = statistics.median(timings[-tenth:])
+        time_growth = growth(first, last)
+        memory_growth = (growth(baseline[0], end[0]), growth(baseline[1], end[1]))
+        rss_text = f"{end[1]:7.0f} MB" if end[1] is not None else "    n/a"
+        rss_growth = memory_growth[1]
+        rss_growth_text = f"{rss_growth:4.2f}x" if rss_growth is not None else "n/a"
+        print(
+            f"{name:<12} tweets={tweets:<6} "
+            f"first={first:7.1f} ms last={last:7.1f} ms growth={time_growth:4.2f}x "
+            f"dom_nodes={end[0]:<8} ({memory_growth[0]:4.2f}x) "
+            f"rss={rss_text} ({rss_growth_text})"
+        )
+        if not mode:
+            full_growth = memory_growth
+        elif time_growth > args.max_growth:
+            failed = True
+        if mode.get("prune_dom"):
+            for label, pruned, full in zip(
+                ("dom_nodes", "rss"), memory_growth, full_growth
+            ):
+                if pruned is None or full is None or full <= 1:
+                    continue
+                # Compare the growth beyond the baseline, not the raw ratios
+                if pruned - 1 > (full - 1) * args.max_memory_share:
+                    print(
+                        f"{name}: {label} grew {pruned:.2f}x, "
+                        f"like the full mode's {full:.2f}x"
+                    )
+                    failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# benchmarks/driver_profiles.py
+"""
+Startup, page-load, script round-trip and scraping throughput per run profile.
+
+Each profile starts a TwitterScraper (the real driver factory path), loads
+a page several times, times small execute_script round trips, and runs
+collection iterations on the synthetic timeline (benchmarks/timeline.html).
+Use it to pick the engine for a workload: startup for many short jobs,
+page load for crawls and engagement polling, throughput for long scrapes.
+
+Usage: python benchmarks/driver_profiles.py [--profiles lean chromium-headless]
+       [--runs 3] [--url https://example.com]
+Profiles whose browser or driver is missing are reported as unavailable.
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import src.scraper  # noqa: E402
+from selenium.common.exceptions import WebDriverException  # noqa: E402
+from src.drivers import PROFILES, load_config  # noqa: E402
+from src.scraper import TwitterScraper  # noqa: E402
+
+TIMELINE_URL = "file://" + os.path.join(ROOT, "benchmarks", "timeline.html")
+
+
+def measure(profile, runs, url, round_trips, iterations):
+    """
+    :return: {'startup', 'page_load', 'round_trip' (ms), 'tweets_per_s'}
+    """
+    startups, page_loads, trips, throughputs = [], [], [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        scraper = TwitterScraper(profile=profile)
+        startups.append((time.perf_counter() - start) * 1000)
+        try:
+            start = time.perf_counter()
+            scraper.driver.get(url)
+            page_loads.append((time.perf_counter() - start) * 1000)
+
+            for _ in range(round_trips):
+                start = time.perf_counter()
+                scraper.driver.execute_script("return 1;")
+                trips.append((time.perf_counter() - start) * 1000)
+
+            scraper.driver.get(TIMELINE_URL)
+            scraper.max_tweets = float("inf")
+            start = time.perf_counter()
+            for _ in range(iterations):
+                for _ in scraper._collect_tweets(False, no_tweets_limit=True):
+                    pass
+            throughputs.append(len(scraper.data) / (time.perf_counter() - start))
+        finally:
+            scraper.driver.quit()
+
+    return {
+        "startup": statistics.median(startups),
+        "page_load": statistics.median(page_loads),
+        "round_trip": statistics.median(trips),
+        "tweets_per_s": statistics.median(throughputs),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        help="Profiles to compare (default: every headless profile)",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=3, help="Browser starts per profile"
+    )
+    parser.add_argument(
+        "--url", default=TIMELINE_URL, help="Page for the page-load timing"
+    )
+    parser.add_argument("--round-trips", type=int, default=50)
+    parser.add_argument(
+        "--iterations", type=int, default=20, help="Collection iterations per run"
+    )
+    args = parser.parse_args()
+
+    load_config()  # Registers profiles from drivers.json, if any
+    names = args.profiles or [name for name, p in PROFILES.items() if p.headless]
+
+    # Measure the scraper's own cost, not its fixed waits for the page
+    src.scraper.sleep = lambda seconds: None
+    logging.disable(logging.CRITICAL)
+
+    for name in names:
+        try:
+            result = measure(
+                name, args.runs, args.url, args.round_trips, args.iterations
+            )
+        except (WebDriverException, ValueError) as e:
+            print(f"{name:<18} unavailable: {str(e).strip().splitlines()[0]}")
+            continue
+        except SystemExit:
+            # TwitterScraper exits when its driver cannot be started
+            print(f"{name:<18} unavailable: browser or driver not found")
+            continue
+        print(
+            f"{name:<18} startup={result['startup']:7.0f} ms "
+            f"page_load={result['page_load']:6.0f} ms "
+            f"round_trip={result['round_trip']:5.1f} ms "
+            f"throughput={result['tweets_per_s']:6.1f} tweets/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# benchmarks/startup_time.py
+"""
+Startup-time guard for the CLI.
+
+Runs `main.py --help` and an offline `summarize` several times, reports the
+median wall time, and uses `python -X importtime` to check that no browser
+module (Selenium, scraper, interactions) is imported on these paths.
+
+Usage: python benchmarks/startup_time.py [--runs 10] [--budget-ms 150]
+Exits with status 1 if a command exceeds the budget or imports a browser module.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FORBIDDEN_MODULES = ("selenium", "src.scraper", "src.interaction", "src.tweet")
+
+
+def time_command(args, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "main.py", *args],
+            cwd=ROOT,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def time_python():
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def imported_modules(args):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "main.py", *args],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.append(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=150.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        export = os.path.join(tmp, "tweets.json")
+        with open(export, "w", encoding="utf-8") as f:
+            json.dump([{"content": "hello", "tweet_id": "1"}] * 100, f)
+
+        commands = {"--help": ["--help"], "summarize": ["summarize", export]}
+
+        failed = False
+        python_ms = statistics.median(time_python() for _ in range(args.runs))
+        print(f"{'python -c pass':<20} {python_ms:8.1f} ms (interpreter floor)")
+        for name, command in commands.items():
+            median_ms = time_command(command, args.runs)
+            heavy = [
+                m
+                for m in imported_modules(command)
+                if m.split(".")[0] == "selenium" or m in FORBIDDEN_MODULES
+            ]
+            status = "ok"
+            if median_ms > args.budget_ms:
+                status = f"over budget ({args.budget_ms:.0f} ms)"
+                failed = True
+            if heavy:
+                status = f"imports {', '.join(sorted(set(heavy))[:5])}"
+                failed = True
+            print(f"{name:<20} {median_ms:8.1f} ms  {status}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,9 @@ from src.argument_parser import parse_arguments
 
 
 def main():
-    args = parse_arguments()
-    if args:
-        print(f"Received arguments: {args}")
-        # Logic triggered by each argument is handled inside argument_parser.py
-    else:
-        print("No arguments provided or invalid input.")
+    # Logic triggered by each argument is handled inside argument_parser.py;
+    # nothing else is printed, so command output (e.g. query --json) stays clean
+    parse_arguments()
 
 
 if __name__ == "__main__":
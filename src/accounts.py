@@ -0,0 +1,312 @@
+# src/accounts.py
+import csv
+import json
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ACCOUNT_BUDGET = 50  # Jobs an account may run per balancer lifetime
+MAX_ACCOUNT_FAILURES = 3  # Failures before an account is taken out of rotation
+CHALLENGE_PENALTY = 2  # Weight of an unusual-activity challenge in the score
+
+
+class Account:
+    """
+    One set of credentials plus its health and budget bookkeeping.
+    """
+
+    def __init__(self, email, password, budget=DEFAULT_ACCOUNT_BUDGET):
+        self.email = email
+        self.password = password
+        self.budget = int(budget)
+        self.used = 0
+        self.failures = 0
+        self.challenges = 0
+        self.busy = False
+        self.session = None  # Pinned scraper (driver + cookie jar)
+
+    @property
+    def remaining(self):
+        return max(self.budget - self.used, 0)
+
+    @property
+    def healthy(self):
+        return self.failures < MAX_ACCOUNT_FAILURES and self.remaining > 0
+
+    def score(self):
+        """
+        Higher is better: remaining budget, discounted by recent trouble.
+        """
+        return self.remaining / (
+            1 + self.failures + CHALLENGE_PENALTY * self.challenges
+        )
+
+    def cookie_file(self, cookie_dir):
+        """
+        Returns the path of this account's cookie jar inside `cookie_dir`.
+        """
+        if not cookie_dir:
+            return None
+        safe_name = re.sub(r"[^\w.-]", "_", self.email)
+        return os.path.join(cookie_dir, f"{safe_name}.json")
+
+    def __repr__(self):
+        return (
+            f"Account({self.email!r}, remaining={self.remaining}, "
+            f"failures={self.failures}, challenges={self.challenges})"
+        )
+
+
+def load_accounts(accounts_file):
+    """
+    Load accounts from a JSON list or a CSV file with an
+    `email,password[,budget]` header.
+    """
+    with open(accounts_file, encoding="utf-8") as f:
+        if accounts_file.lower().endswith(".json"):
+            rows = json.load(f)
+        else:
+            rows = list(csv.DictReader(f))
+
+    accounts = []
+    for row in rows:
+        if not row.get("email") or not row.get("password"):
+            raise ValueError(f"Account entry is missing email or password: {row}")
+        accounts.append(
+            Account(
+                row["email"],
+                row["password"],
+                budget=row.get("budget") or DEFAULT_ACCOUNT_BUDGET,
+            )
+        )
+
+    logger.info("Loaded %s accounts from %s.", len(accounts), accounts_file)
+    return accounts
+
+
+def login_session(
+    account, cookie_dir=None, headless=None, max_restarts=3, profile=None
+):
+    """
+    Default session factory: a supervised TwitterScraper pinned to `account`,
+    restored from its cookie jar when possible and logged in otherwise.
+
+    :param headless: Override the run profile's headless setting
+    :param profile: Run profile name (see src/drivers.py)
+    """
+    from src.scraper import TwitterScraper
+    from src.supervisor import DriverSupervisor
+
+    scraper = TwitterScraper(
+        email=account.email,
+        password=account.password,
+        headless=headless,
+        profile=profile,
+        exit_on_failure=False,  # A failed start must not end the whole batch
+    )
+    cookie_file = account.cookie_file(cookie_dir)
+    try:
+        if not (cookie_file and scraper.load_cookies(cookie_file)):
+            scraper.login(exit_on_failure=False)
+            if cookie_file:
+                os.makedirs(cookie_dir, exist_ok=True)
+                scraper.save_cookies(cookie_file)
+        return DriverSupervisor(
+            scraper, max_restarts=max_restarts, cookie_file=cookie_file
+        )
+    except Exception:
+        scraper.driver.quit()
+        raise
+
+
+class AccountBalancer:
+    """
+    Routes jobs across several accounts, each pinned to its own session.
+
+    A job is a callable taking a logged-in session (a TwitterScraper) and
+    returning a result. Jobs go to the idle, healthy account with the best
+    score; login failures and unusual-activity challenges lower an account's
+    score, and repeated failures take it out of rotation.
+    """
+
+    def __init__(
+        self,
+        accounts,
+        session_factory=None,
+        cookie_dir=None,
+        max_restarts=3,
+        profile=None,
+        headless=None,
+    ):
+        """
+        :param accounts: List of Account objects
+        :param session_factory: Callable(account) -> session; defaults to
+            `login_session`. Pass a fake factory to test without a browser.
+        :param cookie_dir: Directory for per-account cookie jars
+        :param max_restarts: Driver restarts allowed per default session
+        :param profile: Run profile of the default sessions' browsers
+        :param headless: Override the run profile's headless setting
+        """
+        if not accounts:
+            raise ValueError("AccountBalancer needs at least one account.")
+        self.accounts = accounts
+        self.cookie_dir = cookie_dir
+        self.session_factory = session_factory or (
+            lambda account: login_session(
+                account,
+                cookie_dir=cookie_dir,
+                headless=headless,
+                max_restarts=max_restarts,
+                profile=profile,
+            )
+        )
+        self._condition = threading.Condition()
+
+    def acquire(self, avoid=()):
+        """
+        Block until an account is idle and return it, marked busy.
+
+        :param avoid: Accounts to skip while any other healthy account exists
+            (e.g. the ones a job already failed on)
+        :return: The best idle, healthy account, or None if none are healthy
+        """
+        with self._condition:
+            while True:
+                healthy = [a for a in self.accounts if a.healthy]
+                if not healthy:
+                    return None
+                candidates = [a for a in healthy if a not in avoid] or healthy
+                idle = [a for a in candidates if not a.busy]
+                if idle:
+                    account = max(idle, key=lambda a: a.score())
+                    account.busy = True
+                    account.used += 1  # Reserved now, refunded if the run fails
+                    return account
+                self._condition.wait()
+
+    def release(self, account, ok=True):
+        """
+        Return `account` to the pool. If `ok` is False (the session could
+        not be started or died), record a failure and refund the job's budget.
+        """
+        with self._condition:
+            account.busy = False
+            if not ok:
+                account.failures += 1
+                account.used -= 1
+                if not account.healthy:
+                    logger.warning("Taking %s out of rotation.", account.email)
+            self._condition.notify_all()
+
+    def _session(self, account):
+        if account.session is None:
+            logger.info("Starting session for %s...", account.email)
+            account.session = self.session_factory(account)
+            if getattr(account.session, "challenged", False):
+                account.challenges += 1
+        return account.session
+
+    def _drop_dead_session(self, account):
+        session = account.session
+        if session is None or not hasattr(session, "is_alive") or session.is_alive():
+            return
+        logger.warning("Session for %s is dead; it will be recreated.", account.email)
+        try:
+            session.driver.quit()
+        except Exception:
+            pass
+        account.session = None
+
+    def _session_lost(self, account, error):
+        """
+        Returns True if `error` means the account's session is unusable (as
+        opposed to a problem with the job itself, e.g. a bad tweet ID).
+        """
+        from src.supervisor import SessionLostError
+
+        if isinstance(error, SessionLostError):
+            return True
+        session = account.session
+        return hasattr(session, "is_alive") and not session.is_alive()
+
+    def _run_job(self, job, max_attempts):
+        """
+        Run `job`, retrying on another account when the session could not be
+        started (login failure) or died. Other errors are the job's own: they
+        are logged, the job is dropped and the account stays healthy.
+        """
+        failed_on = []
+        for attempt in range(max_attempts):
+            account = self.acquire(avoid=failed_on)
+            if account is None:
+                logger.error("No healthy accounts left; dropping job.")
+                return None
+            try:
+                session = self._session(account)
+            except Exception as e:
+                logger.error(
+                    "Session for %s could not be started (attempt %s): %s",
+                    account.email,
+                    attempt + 1,
+                    e,
+                    exc_info=True,
+                )
+                self.release(account, ok=False)
+                failed_on.append(account)
+                continue
+            try:
+                result = job(session)
+            except Exception as e:
+                if not self._session_lost(account, e):
+                    logger.error(
+                        "Job failed on %s: %s", account.email, e, exc_info=True
+                    )
+                    self.release(account)
+                    return None
+                logger.error(
+                    "Session lost on %s (attempt %s): %s",
+                    account.email,
+                    attempt + 1,
+                    e,
+                    exc_info=True,
+                )
+                self._drop_dead_session(account)
+                self.release(account, ok=False)
+                failed_on.append(account)
+                continue
+            self.release(account)
+            return result
+        return None
+
+    def run(self, jobs, max_attempts=3):
+        """
+        Run `jobs` concurrently, one worker per account.
+
+        :param jobs: List of callables taking a session
+        :param max_attempts: Attempts per job, each on the best account available
+        :return: Results in job order (None for jobs that never succeeded)
+        """
+        if not jobs:
+            return []
+        workers = min(len(jobs), len(self.accounts))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(self._run_job, job, max_attempts) for job in jobs]
+            return [future.result() for future in futures]
+
+    def close(self):
+        """
+        Quit every pinned session.
+        """
+        for account in self.accounts:
+            if account.session is None:
+                continue
+            try:
+                account.session.driver.quit()
+            except Exception as e:
+                logger.warning("Error closing session for %s: %s", account.email, e)
+            account.session = None
+        logger.info("All account sessions closed.")
@@ -0,0 +1,447 @@
+# src/archive.py
+import ast
+import csv
+import glob
+import heapq
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import zlib
+from multiprocessing import Pool
+
+logger = logging.getLogger(__name__)
+
+INPUT_EXTENSIONS = (".csv", ".json", ".jsonl", ".ndjson")
+
+# Fields stored as lists; CSV exports keep them as their string representation
+LIST_FIELDS = ("tags", "mentions", "emojis", "media")
+
+PARTITION_BATCH = 10000  # Records a worker buffers before appending to buckets
+RESERVED_FILES = 64  # Descriptors left free when capping buckets to the limit
+
+
+def iter_json_array(f, chunk_size=1 << 16):
+    """
+    Yield the items of the JSON array in text file `f` one by one, reading
+    it in chunks, so the whole array is never loaded.
+    """
+    decoder = json.JSONDecoder()
+    chunk = f.read(chunk_size)
+    buffer = chunk.lstrip()
+    while chunk and not buffer:
+        # Leading whitespace longer than a chunk
+        chunk = f.read(chunk_size)
+        buffer = chunk.lstrip()
+    if not buffer.startswith("["):
+        raise ValueError("Expected a JSON array.")
+    position = 1
+    eof = False
+
+    while True:
+        # Skip whitespace and separators up to the next item
+        while position < len(buffer) and buffer[position] in " \t\r\n,":
+            position += 1
+        if position < len(buffer) and buffer[position] == "]":
+            return
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            end = None
+        # An item that ends the buffer may be cut off (a number, for example)
+        if end is None or (end == len(buffer) and not eof):
+            if eof:
+                raise ValueError("Truncated JSON array.")
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        yield item
+        position = end
+
+
+def normalize(record):
+    """
+    Convert the string forms of a CSV export back to JSON types: list
+    fields to lists and `verified` to a bool.
+    """
+    for field in LIST_FIELDS:
+        value = record.get(field)
+        if isinstance(value, str):
+            if value.startswith("["):
+                try:
+                    record[field] = ast.literal_eval(value)
+                except (ValueError, SyntaxError):
+                    pass
+            elif not value:
+                record[field] = []
+    if isinstance(record.get("verified"), str):
+        record["verified"] = record["verified"] == "True"
+    return record
+
+
+def iter_records(input_file):
+    """
+    Stream the tweets of a CSV, JSON (array) or JSONL export.
+    """
+    with open(input_file, encoding="utf-8", newline="") as f:
+        if input_file.lower().endswith(".csv"):
+            for row in csv.DictReader(f):
+                yield normalize(row)
+            return
+
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        f.seek(0)
+        if first == "[":
+            yield from iter_json_array(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def find_exports(paths):
+    """
+    Expand files, directories (searched recursively) and glob patterns into
+    a sorted, de-duplicated list of export files.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files += [
+                    os.path.join(root, name)
+                    for name in names
+                    if name.lower().endswith(INPUT_EXTENSIONS)
+                ]
+        elif os.path.exists(path):
+            files.append(path)
+        else:
+            files += glob.glob(path)
+    return sorted(set(files))
+
+
+def _record_key(record):
+    tweet_id = record.get("tweet_id")
+    if tweet_id:
+        return str(tweet_id)
+    # No ID to go by: only identical records are duplicates
+    return "record:" + json.dumps(record, sort_keys=True, default=str)
+
+
+def _is_empty(value):
+    return value is None or value == "" or value == []
+
+
+def _bucket_file(tmp_dir, bucket, group):
+    return os.path.join(tmp_dir, f"{bucket:04d}-{group:04d}.jsonl")
+
+
+def _flush_buckets(pending, tmp_dir, group):
+    # One file open at a time, however many buckets there are
+    for bucket, lines in pending.items():
+        with open(_bucket_file(tmp_dir, bucket, group), "a", encoding="utf-8") as f:
+            f.writelines(lines)
+    pending.clear()
+
+
+def _partition(task):
+    """
+    Pool worker: stream a group of exports into hash-partitioned bucket files.
+    Records are buffered and appended to the buckets in batches of
+    PARTITION_BATCH, so a worker never holds one file open per bucket.
+
+    :return: (records read, field names in first-seen order)
+    """
+    group, files, tmp_dir, buckets = task
+    pending = {}  # bucket -> lines not written yet
+    fields = {}
+    count = 0
+    for file_index, input_file in files:
+        for line_index, record in enumerate(iter_records(input_file)):
+            fields.update(dict.fromkeys(record))
+            key = _record_key(record)
+            bucket = zlib.crc32(key.encode("utf-8")) % buckets
+            pending.setdefault(bucket, []).append(
+                json.dumps(
+                    [file_index, line_index, key, record],
+                    ensure_ascii=False,
+                    default=str,
+                )
+                + "\n"
+            )
+            count += 1
+            if count % PARTITION_BATCH == 0:
+                _flush_buckets(pending, tmp_dir, group)
+    _flush_buckets(pending, tmp_dir, group)
+    return count, list(fields)
+
+
+def _open_file_limit():
+    """
+    Returns the soft limit on open files, or None if there is none (or it
+    cannot be read, e.g. on Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    return None if soft == resource.RLIM_INFINITY else soft
+
+
+def _dedupe_bucket(task):
+    """
+    Pool worker: merge the records of one bucket that share a key, filling
+    fields that are empty in the first occurrence from later ones, and
+    write the survivors sorted by their position in the inputs.
+
+    :return: Number of unique records in the bucket
+    """
+    tmp_dir, bucket, groups = task
+    merged = {}  # key -> [file_index, line_index, record]
+    for group in range(groups):
+        path = _bucket_file(tmp_dir, bucket, group)
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                file_index, line_index, key, record = json.loads(line)
+                entry = [file_index, line_index, record]
+                if key not in merged:
+                    merged[key] = entry
+                    continue
+                # Groups are read in any order; the earliest copy is the base
+                first, later = sorted([merged[key], entry], key=lambda e: e[:2])
+                for field, value in later[2].items():
+                    if _is_empty(first[2].get(field)) and not _is_empty(value):
+                        first[2][field] = value
+                merged[key] = first
+        os.remove(path)
+
+    with open(os.path.join(tmp_dir, f"{bucket:04d}.jsonl"), "w", encoding="utf-8") as f:
+        for entry in sorted(merged.values(), key=lambda entry: entry[:2]):
+            f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+    return len(merged)
+
+
+def _iter_bucket(path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def _write_jsonl(records, f, fields):
+    for record in records:
+        f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+
+def _write_json(records, f, fields):
+    f.write("[")
+    for index, record in enumerate(records):
+        f.write(",\n" if index else "\n")
+        f.write(json.dumps(record, ensure_ascii=False, default=str))
+    f.write("\n]\n")
+
+
+def _write_csv(records, f, fields):
+    writer = csv.DictWriter(f, fieldnames=fields)
+    writer.writeheader()
+    writer.writerows(records)
+
+
+def _write_sqlite(records, path, fields, batch_size=1000):
+    columns = ", ".join(f'"{field}"' for field in fields)
+    placeholders = ", ".join("?" for _ in fields)
+    insert = f"INSERT INTO tweets ({columns}) VALUES ({placeholders})"
+
+    def row(record):
+        values = []
+        for field in fields:
+            value = record.get(field)
+            if isinstance(value, (list, dict)):
+                value = json.dumps(value, ensure_ascii=False)
+            values.append(value)
+        return values
+
+    connection = sqlite3.connect(path)
+    try:
+        connection.execute(f"CREATE TABLE tweets ({columns})")
+        batch = []
+        for record in records:
+            batch.append(row(record))
+            if len(batch) >= batch_size:
+                connection.executemany(insert, batch)
+                batch = []
+        connection.executemany(insert, batch)
+        if "tweet_id" in fields:
+            connection.execute("CREATE INDEX tweets_tweet_id ON tweets (tweet_id)")
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def _write_parquet(records, path, fields, batch_size=10000):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "Parquet output needs pyarrow (pip install pyarrow); "
+            "use a .jsonl, .csv or .db output instead."
+        ) from None
+
+    schema = pa.schema(
+        [
+            (
+                field,
+                (
+                    pa.list_(pa.string())
+                    if field in LIST_FIELDS
+                    else pa.bool_() if field == "verified" else pa.string()
+                ),
+            )
+            for field in fields
+        ]
+    )
+
+    def column(field, batch):
+        values = [record.get(field) for record in batch]
+        if field in LIST_FIELDS:
+            return [[str(v) for v in value] if value else [] for value in values]
+        if field == "verified":
+            return [bool(value) if value is not None else None for value in values]
+        return [str(value) if value is not None else None for value in values]
+
+    def write(writer, batch):
+        writer.write_table(
+            pa.table({field: column(field, batch) for field in fields}, schema=schema)
+        )
+
+    with pq.ParquetWriter(path, schema) as writer:
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                write(writer, batch)
+                batch = []
+        if batch:
+            write(writer, batch)
+
+
+# extension -> (writer, opens a text file for it)
+WRITERS = {
+    ".jsonl": (_write_jsonl, True),
+    ".ndjson": (_write_jsonl, True),
+    ".json": (_write_json, True),
+    ".csv": (_write_csv, True),
+    ".db": (_write_sqlite, False),
+    ".sqlite": (_write_sqlite, False),
+    ".parquet": (_write_parquet, False),
+}
+
+
+def merge_exports(inputs, output_file, workers=None, buckets=64):
+    """
+    Merge CSV/JSON/JSONL exports into one deduplicated file.
+
+    Inputs are streamed and hash-partitioned by tweet_id into `buckets`
+    temporary files, each bucket is deduplicated on its own (so memory use
+    is about one bucket), and the unique tweets are written in input order
+    with the union of all fields. The final merge reads every bucket at
+    once, so `buckets` is capped below the open-file limit. Partitioning and deduplication run in
+    `workers` processes. The output format follows the extension: .jsonl,
+    .json, .csv, .db/.sqlite (table `tweets`) or .parquet (needs pyarrow).
+
+    :return: {'files', 'read', 'written', 'duplicates'}
+    """
+    extension = os.path.splitext(output_file)[1].lower()
+    if extension not in WRITERS:
+        raise ValueError(
+            f"Unsupported output format '{extension}'; "
+            f"use one of {', '.join(sorted(WRITERS))}."
+        )
+    writer, text_file = WRITERS[extension]
+    if buckets < 1:
+        raise ValueError("buckets must be at least 1.")
+    limit = _open_file_limit()
+    if limit is not None and buckets > limit - RESERVED_FILES:
+        capped = max(limit - RESERVED_FILES, 1)
+        logger.warning(
+            "Using %s buckets instead of %s to stay below the open-file limit (%s).",
+            capped,
+            buckets,
+            limit,
+        )
+        buckets = capped
+
+    files = find_exports(inputs)
+    if not files:
+        raise ValueError("No CSV/JSON/JSONL exports found in the given inputs.")
+    workers = max(1, min(workers or os.cpu_count() or 1, len(files)))
+    logger.info(
+        "Merging %s exports into %s (%s buckets, %s workers)...",
+        len(files),
+        output_file,
+        buckets,
+        workers,
+    )
+
+    with tempfile.TemporaryDirectory(prefix="merge-") as tmp_dir:
+        indexed = list(enumerate(files))
+        tasks = [
+            (group, indexed[group::workers], tmp_dir, buckets)
+            for group in range(workers)
+        ]
+        dedupe_tasks = [(tmp_dir, bucket, workers) for bucket in range(buckets)]
+        if workers > 1:
+            with Pool(workers) as pool:
+                partitioned = pool.map(_partition, tasks)
+                written = sum(pool.map(_dedupe_bucket, dedupe_tasks))
+        else:
+            partitioned = [_partition(task) for task in tasks]
+            written = sum(_dedupe_bucket(task) for task in dedupe_tasks)
+
+        read = sum(count for count, _ in partitioned)
+        # Schema union, in first-seen order of the (round-robin) groups
+        fields = list(
+            dict.fromkeys(field for _, group in partitioned for field in group)
+        )
+
+        streams = [
+            _iter_bucket(os.path.join(tmp_dir, f"{bucket:04d}.jsonl"))
+            for bucket in range(buckets)
+        ]
+        records = (
+            entry[2] for entry in heapq.merge(*streams, key=lambda entry: entry[:2])
+        )
+
+        tmp_file = f"{output_file}.tmp"
+        if text_file:
+            with open(tmp_file, "w", encoding="utf-8", newline="") as f:
+                writer(records, f, fields)
+        else:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            writer(records, tmp_file, fields)
+        os.replace(tmp_file, output_file)
+
+    stats = {
+        "files": len(files),
+        "read": read,
+        "written": written,
+        "duplicates": read - written,
+    }
+    logger.info(
+        "Merged %s tweets from %s files into %s unique tweets (%s duplicates) in %s.",
+        read,
+        len(files),
+        written,
+        read - written,
+        output_file,
+    )
+    return stats
@@ -1,34 +1,68 @@
 # src/argument_parser.py
 import argparse
 import logging
+import sys
 
-from src.search import search_for_term
-from src.interaction import like_tweet, comment_on_tweet, retweet_tweet, quote_tweet
-from src.user import TwitterUser
-from src.scraper import TwitterScraper
-from src.summarizer import summarize_scraped_data
-from src import utils
+from src.log import configure_logging, parse_levels
 
-# Set up logging configuration
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
+logger = logging.getLogger(__name__)
 
+# Browser-backed modules (Selenium, scraper, interactions) are imported inside
+# the functions that need them, so --help and offline commands start fast.
+
+# Offline commands work on existing export files and never start a browser.
+# Each maps to (help text, function adding its arguments, handler).
+OFFLINE_COMMANDS = {}
+
+
+def offline_command(name, help_text, add_arguments):
+    """
+    Register the decorated function as the handler of offline command `name`.
+    """
+
+    def register(handler):
+        OFFLINE_COMMANDS[name] = (help_text, add_arguments, handler)
+        return handler
+
+    return register
+
+
+def parse_arguments(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    # Set up logging configuration; replaced below once the logging options are parsed
+    configure_logging(queued=False)
+
+    if argv and argv[0] in OFFLINE_COMMANDS:
+        return run_offline_command(argv)
 
-def parse_arguments():
     parser = argparse.ArgumentParser(
-        description="Selenium Twitter Automation - Automate Twitter interactions"
+        description="Selenium Twitter Automation - Automate Twitter interactions",
+        epilog="Offline commands (no browser, no login): "
+        + ", ".join(sorted(OFFLINE_COMMANDS))
+        + ". Run 'main.py <command> -h' for details.",
     )
 
     # General user authentication arguments
-    parser.add_argument(
-        "-e", "--email", type=str, required=True, help="Your Twitter account email"
-    )
+    parser.add_argument("-e", "--email", type=str, help="Your Twitter account email")
     parser.add_argument(
         "-p",
         "--password",
         type=str,
-        required=True,
         help="Your Twitter account password",
     )
+    parser.add_argument(
+        "-acc",
+        "--accounts",
+        type=str,
+        help="JSON/CSV file of accounts (email,password[,budget]) to balance work across",
+    )
+    parser.add_argument(
+        "-ck",
+        "--cookie-dir",
+        type=str,
+        help="Directory for per-account cookie jars (used with --accounts)",
+    )
 
     # Actions for different interactions
     parser.add_argument(
@@ -37,6 +71,44 @@ def parse_arguments():
         type=str,
         help="Search Twitter for a specific term or hashtag (e.g., 'selenium')",
     )
+    parser.add_argument(
+        "--since",
+        type=str,
+        help="Search from this date (YYYY-MM-DD); with --until, shards the search by time",
+    )
+    parser.add_argument(
+        "--until",
+        type=str,
+        help="Search up to this date (YYYY-MM-DD, exclusive)",
+    )
+    parser.add_argument(
+        "--from-user",
+        type=str,
+        help="Only search tweets posted by this username (used with --search)",
+    )
+    parser.add_argument(
+        "--min-faves",
+        type=int,
+        help="Only search tweets with at least this many likes (used with --search)",
+    )
+    parser.add_argument(
+        "--lang",
+        type=str,
+        help="Only search tweets in this language code, e.g. 'en' (used with --search)",
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=500,
+        help="Tweets per time shard before it is split (used with --since/--until)",
+    )
+    parser.add_argument(
+        "--min-window",
+        type=float,
+        default=1.0,
+        help="Smallest time shard in hours; shards still full at this size are "
+        "reported as incomplete (used with --since/--until)",
+    )
     parser.add_argument(
         "-lk", "--like", type=str, help="Like a specific tweet by tweet ID"
     )
@@ -61,13 +133,242 @@ def parse_arguments():
         "-out", "--output", type=str, help="Output file for results (CSV, JSON, etc.)"
     )
 
+    # Conversation crawling
+    parser.add_argument(
+        "-conv",
+        "--conversation",
+        type=str,
+        help="Comma-separated tweet IDs whose reply trees should be crawled",
+    )
+    parser.add_argument(
+        "--max-depth",
+        type=int,
+        default=2,
+        help="Reply levels to expand below each tweet (used with --conversation)",
+    )
+    parser.add_argument(
+        "--max-replies",
+        type=int,
+        default=20,
+        help="Replies collected per tweet (used with --conversation)",
+    )
+    parser.add_argument(
+        "--crawl-state",
+        type=str,
+        help="Checkpoint file to resume an interrupted --conversation crawl",
+    )
+
+    # Bulk follow/unfollow
+    parser.add_argument(
+        "-fl",
+        "--follow-list",
+        type=str,
+        help="File of usernames to follow; only missing follows are added",
+    )
+    parser.add_argument(
+        "--unfollow-extra",
+        action="store_true",
+        help="With --follow-list, also unfollow every account not in the file",
+    )
+    parser.add_argument(
+        "--handle",
+        type=str,
+        help="Your own username (required with --follow-list)",
+    )
+    parser.add_argument(
+        "--follow-state",
+        type=str,
+        help="Checkpoint file to resume an interrupted --follow-list run",
+    )
+
+    # Batch scraping
+    parser.add_argument(
+        "-man",
+        "--manifest",
+        type=str,
+        help="JSON/YAML/CSV list of profiles, hashtags and queries to scrape in one session",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default="output",
+        help="Directory for per-target results (used with --manifest)",
+    )
+    parser.add_argument(
+        "--format",
+        type=str,
+        choices=["json", "csv"],
+        default="json",
+        help="Per-target output format (used with --manifest)",
+    )
+
+    # Long-run scraping
+    parser.add_argument(
+        "--prune-dom",
+        action="store_true",
+        help="Replace tweet cards with placeholders after extraction to keep per-scroll cost and memory flat",
+    )
+
+    parser.add_argument(
+        "--delta-only",
+        action="store_true",
+        help="Fetch only newly rendered tweet cards each scroll (MutationObserver)",
+    )
+
+    # Browser
+    parser.add_argument(
+        "--run-profile",
+        type=str,
+        help="Browser run profile: firefox-headless (default), chromium-headless, "
+        "lean (eager page loads, no images), firefox (windowed), or one from "
+        "drivers.json",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_const",
+        const=True,
+        help="Run the browser headless even if the run profile is windowed",
+    )
+    parser.add_argument(
+        "--no-headless",
+        dest="headless",
+        action="store_const",
+        const=False,
+        help="Show the browser window (e.g. to solve a login challenge)",
+    )
+
+    # Recovery
+    parser.add_argument(
+        "--max-restarts",
+        type=int,
+        default=3,
+        help="Browser restarts allowed if the WebDriver session dies (default 3)",
+    )
+
+    # Engagement tracking
+    parser.add_argument(
+        "-trk",
+        "--track",
+        type=str,
+        help="Export (CSV/JSON) of tweets to add to the engagement tracker and poll",
+    )
+    parser.add_argument(
+        "--track-store",
+        type=str,
+        default="engagement.csv",
+        help="Time-series file for tracked engagement counts (default engagement.csv)",
+    )
+    parser.add_argument(
+        "--track-cycles",
+        type=int,
+        default=1,
+        help="Polling cycles to run, waiting for due tweets in between (default 1)",
+    )
+
+    # Post queue
+    parser.add_argument(
+        "-pq",
+        "--post-queue",
+        type=str,
+        help="JSON list of posts/threads (text or thread, optional publish_at ISO time, local unless it has an offset) to publish",
+    )
+
+    # Local index
+    parser.add_argument(
+        "-idx",
+        "--index",
+        type=str,
+        help="SQLite index file that scraped tweets are added to as they are collected",
+    )
+
+    # Media
+    parser.add_argument(
+        "-dm",
+        "--download-media",
+        type=str,
+        help="Download images, GIFs and avatars of scraped tweets into this cache "
+        "directory (videos: poster image only)",
+    )
+
     # Summarize scraped tweets
     parser.add_argument(
         "-sum", "--summarize", action="store_true", help="Summarize scraped tweets"
     )
 
+    # Logging
+    parser.add_argument(
+        "--log-level",
+        type=str,
+        default="INFO",
+        help="Root log level: DEBUG, INFO, WARNING or ERROR (default INFO)",
+    )
+    parser.add_argument(
+        "--log-levels",
+        type=str,
+        help="Per-module log levels, e.g. 'src.scroller=DEBUG,src.scraper=DEBUG'",
+    )
+    parser.add_argument(
+        "--log-json",
+        action="store_true",
+        help="Write logs as one JSON object per line",
+    )
+    parser.add_argument("--log-file", type=str, help="Also write logs to this file")
+    parser.add_argument(
+        "--log-sample",
+        type=int,
+        default=1,
+        help="Keep one in N repeats of each per-scroll DEBUG message (default 1)",
+    )
+    parser.add_argument(
+        "--log-interval",
+        type=float,
+        default=0.0,
+        help="Keep each per-scroll DEBUG message at most once per N seconds",
+    )
+
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    if not args.accounts and not (args.email and args.password):
+        parser.error("either --email and --password, or --accounts, is required")
+    if args.follow_list and not args.handle:
+        parser.error("--follow-list requires --handle")
+    if args.min_window <= 0:
+        parser.error("--min-window must be greater than 0")
+    if args.shard_size < 1:
+        parser.error("--shard-size must be at least 1")
+    if args.since or args.until:
+        from src.query import parse_date
+
+        try:
+            since, until = parse_date(args.since), parse_date(args.until)
+        except ValueError as e:
+            parser.error(f"--since/--until: {e}")
+        if since and until and since >= until:
+            parser.error("--since must be before --until")
+
+    # Profiles can come from drivers.json, so they are checked once it is read
+    from src.drivers import PROFILES, load_config
+
+    try:
+        load_config()
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+    if args.run_profile and args.run_profile not in PROFILES:
+        parser.error(
+            f"unknown --run-profile '{args.run_profile}'; "
+            f"use one of {', '.join(PROFILES)}"
+        )
+    try:
+        configure_logging(
+            level=args.log_level,
+            json_format=args.log_json,
+            log_file=args.log_file,
+            levels=parse_levels(args.log_levels),
+            sample_every=args.log_sample,
+            min_interval=args.log_interval,
+        )
+    except ValueError as e:
+        parser.error(str(e))
 
     # Handle actions
     handle_actions(args)
@@ -75,94 +376,547 @@ def parse_arguments():
     return args
 
 
-def handle_actions(args):
+def build_jobs(args, index=None):
     """
-    Handles each action based on the arguments.
-    We create a single scraper instance if needed, and close it after the actions.
+    Returns (description, job) pairs for the browser actions requested in `args`.
+    Each job takes a logged-in TwitterScraper and returns any scraped tweets.
+
+    :param index: TweetIndex that scraping jobs add tweets to as they go
     """
-    scraper = None
-    user_actions = None
+    from src.user import TwitterUser
 
-    # Because search, follow, tweet, etc., require login, create the scraper and log in once if needed
-    if any(
-        [
-            args.search,
-            args.like,
-            args.comment,
-            args.retweet,
-            args.quote,
-            args.follow,
-            args.unfollow,
-            args.profile,
-            args.tweet,
-        ]
-    ):
-
-        # Initialize the scraper and log in
-        scraper = TwitterScraper(email=args.email, password=args.password)
-        scraper.login()
-        user_actions = TwitterUser(scraper.driver, scraper.actions)
+    jobs = []
 
     # 1. SEARCH
-    if args.search:
-        logging.info(f"Searching for: {args.search}")
-        search_for_term(scraper, args.search)
+    if args.search and args.since and args.until:
+        from datetime import timedelta
+
+        from src.query import SearchQuery, ShardPlanner
+
+        query = SearchQuery(
+            args.search,
+            from_user=args.from_user,
+            min_faves=args.min_faves,
+            lang=args.lang,
+        )
+
+        def planner():
+            return ShardPlanner(
+                query,
+                args.since,
+                args.until,
+                max_tweets_per_shard=args.shard_size,
+                min_window=timedelta(hours=args.min_window),
+                prune_dom=args.prune_dom,
+                delta_only=args.delta_only,
+                index=index,
+            )
+
+        def sharded_search(scraper):
+            return planner().run(scraper)
+
+        # With --accounts, the shards are spread over the whole account pool
+        sharded_search.run_parallel = lambda balancer: planner().run_parallel(balancer)
+        jobs.append(
+            (
+                f"Searching for: {query} ({args.since} to {args.until}, sharded)",
+                sharded_search,
+            )
+        )
+    elif args.search:
+        from src.query import SearchQuery
+        from src.search import search_for_term
+
+        if args.from_user or args.since or args.until or args.min_faves or args.lang:
+            args.search = SearchQuery(
+                args.search,
+                from_user=args.from_user,
+                since=args.since,
+                until=args.until,
+                min_faves=args.min_faves,
+                lang=args.lang,
+            ).build()
+
+        jobs.append(
+            (
+                f"Searching for: {args.search}",
+                lambda scraper: search_for_term(
+                    scraper,
+                    args.search,
+                    prune_dom=args.prune_dom,
+                    delta_only=args.delta_only,
+                    index=index,
+                ),
+            )
+        )
 
     # 2. LIKE
     if args.like:
-        logging.info(f"Liking tweet with ID: {args.like}")
-        like_tweet(scraper.driver, tweet_id=args.like)
+        from src.interaction import like_tweet
+
+        jobs.append(
+            (
+                f"Liking tweet with ID: {args.like}",
+                lambda scraper: like_tweet(scraper.driver, tweet_id=args.like),
+            )
+        )
 
     # 3. TWEET
     if args.tweet:
-        logging.info(f"Posting tweet: {args.tweet}")
-        user_actions.create_new_tweet(args.tweet)
+        jobs.append(
+            (
+                f"Posting tweet: {args.tweet}",
+                lambda scraper: TwitterUser(
+                    scraper.driver, scraper.actions
+                ).create_new_tweet(args.tweet),
+            )
+        )
 
     # 4. COMMENT
     if args.comment:
-        logging.info(f"Commenting on tweet with ID: {args.comment}")
-        comment_on_tweet(
-            scraper.driver,
-            scraper.actions,
-            tweet_id=args.comment,
-            text="This is a comment!",
+        from src.interaction import comment_on_tweet
+
+        jobs.append(
+            (
+                f"Commenting on tweet with ID: {args.comment}",
+                lambda scraper: comment_on_tweet(
+                    scraper.driver,
+                    scraper.actions,
+                    tweet_id=args.comment,
+                    text="This is a comment!",
+                ),
+            )
         )
 
     # 5. RETWEET
     if args.retweet:
-        logging.info(f"Retweeting tweet with ID: {args.retweet}")
-        retweet_tweet(scraper.driver, tweet_id=args.retweet)
+        from src.interaction import retweet_tweet
+
+        jobs.append(
+            (
+                f"Retweeting tweet with ID: {args.retweet}",
+                lambda scraper: retweet_tweet(scraper.driver, tweet_id=args.retweet),
+            )
+        )
 
     # 6. QUOTE
     if args.quote:
-        logging.info(f"Quoting tweet with ID: {args.quote}")
-        quote_tweet(scraper.driver, tweet_id=args.quote, quote_text="My thoughts...")
+        from src.interaction import quote_tweet
+
+        jobs.append(
+            (
+                f"Quoting tweet with ID: {args.quote}",
+                lambda scraper: quote_tweet(
+                    scraper.driver, tweet_id=args.quote, quote_text="My thoughts..."
+                ),
+            )
+        )
 
     # 7. FOLLOW
     if args.follow:
-        logging.info(f"Following user: {args.follow}")
-        user_actions.follow_user(args.follow)
+        jobs.append(
+            (
+                f"Following user: {args.follow}",
+                lambda scraper: TwitterUser(
+                    scraper.driver, scraper.actions
+                ).follow_user(args.follow),
+            )
+        )
 
     # 8. UNFOLLOW
     if args.unfollow:
-        logging.info(f"Unfollowing user: {args.unfollow}")
-        user_actions.unfollow_user(args.unfollow)
+        jobs.append(
+            (
+                f"Unfollowing user: {args.unfollow}",
+                lambda scraper: TwitterUser(
+                    scraper.driver, scraper.actions
+                ).unfollow_user(args.unfollow),
+            )
+        )
 
     # 9. PROFILE
     if args.profile:
-        logging.info("Opening user profile page...")
-        user_actions.open_profile_page()
+        jobs.append(
+            (
+                "Opening user profile page...",
+                lambda scraper: TwitterUser(
+                    scraper.driver, scraper.actions
+                ).open_profile_page(),
+            )
+        )
+
+    # 10. CONVERSATION
+    if args.conversation:
+        from src.conversation import ConversationCrawler
+
+        tweet_ids = [t.strip() for t in args.conversation.split(",") if t.strip()]
+        jobs.append(
+            (
+                f"Crawling conversations of: {', '.join(tweet_ids)}",
+                lambda scraper: ConversationCrawler(
+                    scraper,
+                    max_depth=args.max_depth,
+                    max_replies=args.max_replies,
+                    state_file=args.crawl_state,
+                ).crawl(tweet_ids),
+            )
+        )
+
+    # 11. FOLLOW LIST
+    if args.follow_list:
+        from src.reconciler import FollowReconciler, load_follow_targets
+
+        targets = load_follow_targets(args.follow_list)
+        jobs.append(
+            (
+                f"Reconciling follows with: {args.follow_list}",
+                lambda scraper: FollowReconciler(
+                    TwitterUser(scraper.driver, scraper.actions),
+                    args.handle,
+                    unfollow_extra=args.unfollow_extra,
+                    state_file=args.follow_state,
+                ).reconcile(targets),
+            )
+        )
+
+    # 12. BATCH MANIFEST
+    if args.manifest:
+        from src.batch import load_manifest, scrape_target
+
+        for target in load_manifest(args.manifest):
+            jobs.append(
+                (
+                    f"Scraping manifest target: {target.name}",
+                    lambda scraper, target=target: scrape_target(
+                        scraper,
+                        target,
+                        args.output_dir,
+                        args.format,
+                        prune_dom=args.prune_dom,
+                        delta_only=args.delta_only,
+                        index=index,
+                    ),
+                )
+            )
+
+    # 13. ENGAGEMENT TRACKING
+    if args.track:
+        from src.tracker import EngagementTracker
+        from src import utils
+
+        tracked = utils.load_data(args.track)
+
+        def track_job(scraper):
+            tracker = EngagementTracker(scraper, store_file=args.track_store)
+            tracker.track(tracked)
+            tracker.run(cycles=args.track_cycles)
+
+        jobs.append((f"Tracking engagement of: {args.track}", track_job))
+
+    # 14. POST QUEUE
+    if args.post_queue:
+        from src.composer import PostPublisher, load_post_queue, run_post_queue
+
+        posts = load_post_queue(args.post_queue)
+        jobs.append(
+            (
+                f"Publishing post queue: {args.post_queue}",
+                lambda scraper: run_post_queue(PostPublisher(scraper), posts),
+            )
+        )
+
+    return jobs
+
+
+def run_jobs(args, jobs):
+    """
+    Run `jobs` in a single logged-in session, or across every account in
+    `args.accounts` when an accounts file is given.
+
+    :return: The tweets scraped by all jobs
+    """
+    data = []
+
+    if args.accounts:
+        from src.accounts import AccountBalancer, load_accounts
+
+        balancer = AccountBalancer(
+            load_accounts(args.accounts),
+            cookie_dir=args.cookie_dir,
+            max_restarts=args.max_restarts,
+            profile=args.run_profile,
+            headless=args.headless,
+        )
+        for description, _ in jobs:
+            logger.info("Queued: %s", description)
+        # Jobs that drive the balancer themselves (sharded searches) run on
+        # their own; the rest are spread across the accounts together
+        parallel = [hasattr(job, "run_parallel") for _, job in jobs]
+        try:
+            pooled = iter(
+                balancer.run([job for (_, job), p in zip(jobs, parallel) if not p])
+            )
+            results = []
+            for (description, job), p in zip(jobs, parallel):
+                if p:
+                    logger.info(description)
+                    results.append(job.run_parallel(balancer))
+                else:
+                    results.append(next(pooled))
+        finally:
+            balancer.close()
+    else:
+        from src.scraper import TwitterScraper
+        from src.supervisor import DriverSupervisor
+
+        # Initialize the scraper and log in once for every action
+        scraper = TwitterScraper(
+            email=args.email,
+            password=args.password,
+            headless=args.headless,
+            profile=args.run_profile,
+        )
+        scraper.login()
+        session = DriverSupervisor(scraper, max_restarts=args.max_restarts)
+        results = []
+        try:
+            for description, job in jobs:
+                logger.info(description)
+                results.append(session.run(job))
+        finally:
+            # Quit the driver once all actions ran
+            scraper.driver.quit()
+            logger.info("WebDriver closed.")
+
+    for result in results:
+        if isinstance(result, list):
+            data.extend(result)
+    return data
+
+
+def handle_actions(args):
+    """
+    Handles each action based on the arguments.
+    All requested actions share one logged-in session (or the account pool),
+    which is closed after the actions.
+    """
+    index = None
+    if args.index:
+        from src.index import TweetIndex
+
+        index = TweetIndex(args.index)
+
+    jobs = build_jobs(args, index=index)
+    if not jobs:
+        if index is not None:
+            index.close()
+        return
+
+    from src.summarizer import summarize_scraped_data
+    from src import utils
+
+    try:
+        data = run_jobs(args, jobs)
+        # Tweets from jobs that do not scrape through scrape_tweets (e.g. crawls)
+        if index is not None and data:
+            logger.info(
+                "Indexed %s more tweets in %s.", index.add_all(data), args.index
+            )
+    finally:
+        if index is not None:
+            index.close()
 
     # Summarize any scraped tweets so far
-    if args.summarize and scraper:
-        summarize_scraped_data(scraper.data)
-
-    # 10. OUTPUT
-    if args.output and scraper and scraper.data:
-        logging.info(f"Saving output to: {args.output}")
-        scraper.save_data(output_file=args.output)
-
-    # Quit the driver if it was created
-    if scraper:
-        scraper.driver.quit()
-        logging.info("WebDriver closed.")
+    if args.summarize:
+        summarize_scraped_data(data)
+
+    # 15. OUTPUT
+    if args.output and data:
+        logger.info("Saving output to: %s", args.output)
+        utils.save_data(data, output_file=args.output)
+
+    # 16. MEDIA
+    if args.download_media and data:
+        from src.media import MediaCache, collect_media_urls, download_media
+
+        download_media(collect_media_urls(data), MediaCache(args.download_media))
+
+
+def run_offline_command(argv):
+    """
+    Parse and run an offline command such as `summarize` or `convert`.
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Selenium Twitter Automation - offline commands",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, (help_text, add_arguments, handler) in OFFLINE_COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        add_arguments(subparser)
+        subparser.set_defaults(handler=handler)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+    return args
+
+
+def _summarize_arguments(parser):
+    parser.add_argument("input", type=str, help="Exported tweets (CSV or JSON)")
+
+
+@offline_command("summarize", "Summarize an existing export", _summarize_arguments)
+def summarize_command(args):
+    from src.summarizer import summarize_scraped_data
+    from src import utils
+
+    summarize_scraped_data(utils.load_data(args.input))
+
+
+def _convert_arguments(parser):
+    parser.add_argument("input", type=str, help="Exported tweets (CSV, JSON or JSONL)")
+    parser.add_argument("output", type=str, help="Output file (CSV, JSON or JSONL)")
+
+
+@offline_command(
+    "convert", "Convert an export between CSV, JSON and JSONL", _convert_arguments
+)
+def convert_command(args):
+    from src import utils
+
+    utils.save_data(utils.load_data(args.input), output_file=args.output)
+
+
+def _merge_arguments(parser):
+    parser.add_argument(
+        "output",
+        type=str,
+        help="Merged file: .jsonl, .json, .csv, .db/.sqlite or .parquet (needs pyarrow)",
+    )
+    parser.add_argument(
+        "inputs",
+        type=str,
+        nargs="+",
+        help="Exports (CSV, JSON or JSONL), directories or glob patterns",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Worker processes (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--buckets",
+        type=int,
+        default=64,
+        help="Temporary hash partitions; more buckets use less memory (default 64)",
+    )
+
+
+@offline_command(
+    "merge",
+    "Merge and deduplicate many exports into one file",
+    _merge_arguments,
+)
+def merge_command(args):
+    from src.archive import merge_exports
+
+    merge_exports(args.inputs, args.output, workers=args.workers, buckets=args.buckets)
+
+
+def _index_arguments(parser):
+    parser.add_argument("index", type=str, help="Index file (created if missing)")
+    parser.add_argument(
+        "inputs",
+        type=str,
+        nargs="+",
+        help="Exports (CSV, JSON or JSONL), directories or glob patterns",
+    )
+
+
+@offline_command("index", "Add existing exports to a local index", _index_arguments)
+def index_command(args):
+    from src.archive import find_exports, iter_records
+    from src.index import TweetIndex
+
+    index = TweetIndex(args.index, commit_every=10000)
+    try:
+        for input_file in find_exports(args.inputs):
+            added = index.add_all(iter_records(input_file))
+            logger.info("Indexed %s new tweets from %s.", added, input_file)
+        logger.info("%s holds %s tweets.", args.index, index.count())
+    finally:
+        index.close()
+
+
+def _query_arguments(parser):
+    parser.add_argument(
+        "index", type=str, help="Index file built by 'index' or --index"
+    )
+    parser.add_argument(
+        "query",
+        type=str,
+        nargs="?",
+        default="",
+        help='Terms with AND/OR/NOT, "phrases", prefix*, #tags, @mentions, '
+        "from:user, since:YYYY-MM-DD, until:YYYY-MM-DD",
+    )
+    parser.add_argument(
+        "--top", action="store_true", help="Order by engagement instead of newest"
+    )
+    parser.add_argument(
+        "--limit", type=int, default=20, help="Tweets to show (default 20)"
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print matching tweets as JSON Lines"
+    )
+
+
+@offline_command("query", "Search a local index", _query_arguments)
+def query_command(args):
+    import json
+    import time
+    from src.index import TweetIndex, parse_query
+
+    index = TweetIndex(args.index)
+    try:
+        start = time.perf_counter()
+        tweets = index.search(top=args.top, limit=args.limit, **parse_query(args.query))
+        elapsed = time.perf_counter() - start
+    except ValueError as e:
+        logger.error("%s", e)
+        return
+    finally:
+        index.close()
+
+    for tweet in tweets:
+        if args.json:
+            print(json.dumps(tweet, ensure_ascii=False))
+        else:
+            content = " ".join((tweet.get("content") or "").split())
+            print(
+                f"{tweet.get('date_time', '')[:10]}  {tweet.get('handle', '')}  "
+                f"[{tweet.get('like_count', '')} likes]  {content[:100]}"
+            )
+    logger.info("%s tweets in %.1f ms.", len(tweets), elapsed * 1000)
+
+
+def _download_media_arguments(parser):
+    parser.add_argument("input", type=str, help="Exported tweets (CSV or JSON)")
+    parser.add_argument("cache_dir", type=str, help="Media cache directory")
+    parser.add_argument(
+        "--workers", type=int, default=8, help="Concurrent downloads (default 8)"
+    )
+    parser.add_argument("--no-avatars", action="store_true", help="Skip profile images")
+
+
+@offline_command(
+    "download-media",
+    "Download the media referenced by an export",
+    _download_media_arguments,
+)
+def download_media_command(args):
+    from src.media import MediaCache, collect_media_urls, download_media
+    from src import utils
+
+    urls = collect_media_urls(
+        utils.load_data(args.input), include_avatars=not args.no_avatars
+    )
+    download_media(urls, MediaCache(args.cache_dir), max_workers=args.workers)
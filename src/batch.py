@@ -0,0 +1,177 @@
+# src/batch.py
+import csv
+import json
+import logging
+import os
+import re
+import time
+
+from src import utils
+
+logger = logging.getLogger(__name__)
+
+TARGET_TYPES = ("profile", "hashtag", "query", "home")
+MANIFEST_KEYS = (
+    "type",
+    "value",
+    "max_tweets",
+    "latest",
+    "top",
+    "poster_details",
+    "name",
+)
+
+
+def _as_bool(value, default):
+    if value is None or value == "":
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "yes", "y")
+
+
+class ScrapeTarget:
+    """
+    One manifest entry: what to scrape and the `scrape_tweets` options for it.
+    """
+
+    def __init__(
+        self,
+        kind,
+        value=None,
+        max_tweets=50,
+        latest=True,
+        top=False,
+        poster_details=False,
+        name=None,
+    ):
+        if kind not in TARGET_TYPES:
+            raise ValueError(
+                f"Unknown target type '{kind}'; expected one of {TARGET_TYPES}."
+            )
+        if kind != "home" and not value:
+            raise ValueError(f"Target of type '{kind}' needs a value.")
+        self.kind = kind
+        self.value = value
+        self.max_tweets = int(max_tweets)
+        self.latest = _as_bool(latest, True)
+        self.top = _as_bool(top, False)
+        self.poster_details = _as_bool(poster_details, False)
+        self.name = name or re.sub(
+            r"[^\w.-]+", "_", f"{kind}-{(value or 'home').lstrip('@#')}"
+        )
+
+    @classmethod
+    def from_dict(cls, entry):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Expected a mapping of {', '.join(MANIFEST_KEYS)}.")
+        unknown = [key for key in entry if key not in MANIFEST_KEYS]
+        if unknown:
+            raise ValueError(
+                f"Unknown keys {', '.join(map(repr, unknown))}; "
+                f"expected {', '.join(MANIFEST_KEYS)}."
+            )
+        entry = {k: v for k, v in entry.items() if v not in (None, "")}
+        return cls(entry.pop("type", None), **entry)
+
+    def scrape_kwargs(self):
+        """
+        Returns the keyword arguments for `TwitterScraper.scrape_tweets`.
+        """
+        return {
+            "max_tweets": self.max_tweets,
+            "scrape_username": self.value if self.kind == "profile" else None,
+            "scrape_hashtag": self.value if self.kind == "hashtag" else None,
+            "scrape_query": self.value if self.kind == "query" else None,
+            "scrape_latest": self.latest,
+            "scrape_top": self.top,
+            "scrape_poster_details": self.poster_details,
+        }
+
+    def __repr__(self):
+        return f"ScrapeTarget({self.name!r}, max_tweets={self.max_tweets})"
+
+
+def load_manifest(manifest_file):
+    """
+    Load scrape targets from a JSON, YAML or CSV manifest.
+
+    JSON/YAML: a list of entries, or a mapping with a `targets` list. Each
+    entry has `type` (profile, hashtag, query or home), `value` and optional
+    `max_tweets`, `latest`, `top`, `poster_details` and `name`.
+    CSV: the same keys as column headers.
+    """
+    lower = manifest_file.lower()
+    with open(manifest_file, encoding="utf-8", newline="") as f:
+        if lower.endswith(".csv"):
+            entries = list(csv.DictReader(f))
+        elif lower.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError(
+                    "YAML manifests need PyYAML (pip install pyyaml); "
+                    "use a JSON or CSV manifest instead."
+                ) from None
+            entries = yaml.safe_load(f)
+        else:
+            entries = json.load(f)
+
+    if isinstance(entries, dict):
+        entries = entries.get("targets", [])
+
+    csv_file = lower.endswith(".csv")
+    targets = []
+    names = set()
+    for position, entry in enumerate(entries or [], start=1):
+        try:
+            target = ScrapeTarget.from_dict(entry)
+        except ValueError as e:
+            where = f"line {position + 1}" if csv_file else f"target {position}"
+            raise ValueError(f"{manifest_file}, {where}: {e}") from None
+
+        # Targets that differ only in their options (e.g. latest/top) would
+        # write the same output file
+        name, suffix = target.name, 2
+        while name in names:
+            name = f"{target.name}-{suffix}"
+            suffix += 1
+        if name != target.name:
+            logger.info("Target name %s is taken; using %s.", target.name, name)
+            target.name = name
+        names.add(name)
+        targets.append(target)
+
+    logger.info("Loaded %s targets from %s.", len(targets), manifest_file)
+    return targets
+
+
+def scrape_target(scraper, target, output_dir, output_format="json", **scrape_options):
+    """
+    Scrape one target with an already logged-in `scraper`, save the tweets
+    to `<output_dir>/<target name>.<format>` and log its throughput.
+    Extra keyword arguments are passed on to `scrape_tweets`.
+
+    :return: The scraped tweet dictionaries, tagged with the target name
+    """
+    logger.info("Scraping target %s...", target.name)
+    start = time.perf_counter()
+    data = scraper.scrape_tweets(**target.scrape_kwargs(), **scrape_options)
+    elapsed = time.perf_counter() - start
+
+    for tweet in data:
+        tweet["target"] = target.name
+
+    os.makedirs(output_dir, exist_ok=True)
+    output_file = os.path.join(output_dir, f"{target.name}.{output_format}")
+    utils.save_data(data, output_file=output_file)
+
+    rate = len(data) / elapsed if elapsed > 0 else 0.0
+    logger.info(
+        "Target %s: %s tweets in %.1fs (%.2f tweets/s).",
+        target.name,
+        len(data),
+        elapsed,
+        rate,
+    )
+    return data
@@ -0,0 +1,252 @@
+# src/composer.py
+import json
+import logging
+import time
+from datetime import datetime
+from time import sleep
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from selenium.webdriver.support.ui import WebDriverWait
+
+from src.locators import SELECTORS
+from src.user import TWITTER_POST_URL
+
+logger = logging.getLogger(__name__)
+
+# Replaces the editor's content with arguments[1] as a single input event, which
+# the compose editor handles like a paste instead of one event per key.
+SET_TEXT_SCRIPT = """
+const box = arguments[0];
+box.focus();
+document.execCommand('selectAll', false, null);
+document.execCommand('insertText', false, arguments[1]);
+"""
+
+# Returned by PostPublisher.publish when the post was sent but its status ID
+# could not be read; such a post must not be queued again.
+UNCONFIRMED = "unconfirmed"
+FAILED = "failed"  # Result of a post that was not sent
+
+# Errors of the compose page itself; anything else (e.g. a dead browser) is
+# left to the caller's session recovery.
+PAGE_ERRORS = (
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    JavascriptException,
+    IndexError,  # The notification linked to an unexpected URL
+)
+
+
+class ScheduledPost:
+    """
+    A post (one part) or thread (several parts) with an optional publish time.
+    """
+
+    def __init__(self, parts, publish_at=None, name=None):
+        if isinstance(parts, str):
+            parts = [parts]
+        if not parts or not all(
+            isinstance(part, str) and part.strip() for part in parts
+        ):
+            raise ValueError("A post needs at least one non-empty text part.")
+        self.parts = parts
+        self.publish_at = publish_at  # Unix timestamp, or None for "now"
+        self.name = name or parts[0][:30]
+        self.result = None  # Status ID, UNCONFIRMED or FAILED once handled
+
+    @classmethod
+    def from_dict(cls, entry):
+        """
+        :raises ValueError: if the entry has no text or an invalid `publish_at`
+        """
+        if not isinstance(entry, dict):
+            raise ValueError("A post must be a mapping with `text` or `thread`.")
+        parts = entry.get("thread") or entry.get("text")
+        if not isinstance(parts, (str, list)):
+            raise ValueError("A post needs `text` or a `thread` list.")
+        publish_at = entry.get("publish_at")
+        if isinstance(publish_at, str):
+            try:
+                # Times without a UTC offset are local time
+                publish_at = datetime.fromisoformat(publish_at).timestamp()
+            except ValueError:
+                raise ValueError(
+                    f"Invalid publish_at {publish_at!r}; use an ISO time such as "
+                    "2024-05-01T09:30:00+02:00."
+                ) from None
+        elif publish_at is not None and not isinstance(publish_at, (int, float)):
+            raise ValueError(f"Invalid publish_at {publish_at!r}.")
+        return cls(parts, publish_at=publish_at, name=entry.get("name"))
+
+    def __repr__(self):
+        return f"ScheduledPost({self.name!r}, parts={len(self.parts)})"
+
+
+def load_post_queue(queue_file):
+    """
+    Load posts from a JSON list of entries with either `text` (one post) or
+    `thread` (list of parts), plus optional `publish_at` (ISO time; local
+    time unless it has a UTC offset) and `name`.
+
+    Invalid entries are logged and skipped; the rest of the queue is loaded.
+    """
+    with open(queue_file, encoding="utf-8") as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError(f"{queue_file}: expected a JSON list of posts.")
+
+    posts = []
+    for position, entry in enumerate(entries, start=1):
+        try:
+            posts.append(ScheduledPost.from_dict(entry))
+        except ValueError as e:
+            logger.error("%s, post %s skipped: %s", queue_file, position, e)
+    logger.info("Loaded %s posts from %s.", len(posts), queue_file)
+    return posts
+
+
+class PostPublisher:
+    """
+    Publishes posts and threads through the compose dialog.
+
+    Each part's text is inserted in one step, thread parts are added in the
+    same dialog without reloading it, and every publish is confirmed by
+    reading the new status ID from the "sent" notification.
+    """
+
+    def __init__(self, scraper, confirm_timeout=10):
+        """
+        :param scraper: Logged-in TwitterScraper (or DriverSupervisor)
+        :param confirm_timeout: Seconds to wait for the page and the
+            "sent" notification
+        """
+        self.scraper = scraper
+        self.confirm_timeout = confirm_timeout
+
+    @property
+    def driver(self):
+        # Read on each use: a supervisor replaces the driver when it restarts it
+        return self.scraper.driver
+
+    def publish(self, post):
+        """
+        Publish `post` and return its status ID, UNCONFIRMED if it was sent
+        but the confirmation could not be read, or None if it was not sent.
+
+        Errors other than page errors, and page errors from a dead browser
+        before the post was sent, are raised so the session can be recovered.
+        """
+        logger.info("Publishing %r...", post)
+        sent = False
+        try:
+            self.driver.get(TWITTER_POST_URL)
+            self._wait_for(lambda d: SELECTORS.find_all(d, "compose.textareas"))
+
+            for index, text in enumerate(post.parts):
+                if index:
+                    SELECTORS.find(self.driver, "compose.add_part").click()
+                    self._wait_for(
+                        lambda d: len(SELECTORS.find_all(d, "compose.textareas"))
+                        > index
+                    )
+                textarea = SELECTORS.find_all(self.driver, "compose.textareas")[index]
+                self.driver.execute_script(SET_TEXT_SCRIPT, textarea, text)
+
+            SELECTORS.find(self.driver, "compose.post_button").click()
+            sent = True
+            link = self._wait_for(
+                lambda d: SELECTORS.find_all(d, "compose.sent_status_link")
+            )[0]
+            href = link.get_attribute("href") or ""
+            status_id = href.split("/status/")[1].split("/")[0]
+        except PAGE_ERRORS as e:
+            if sent:
+                logger.warning("%r was sent but could not be confirmed: %s", post, e)
+                return UNCONFIRMED
+            if not self.scraper.is_alive():
+                raise
+            logger.error("Could not publish %r: %s", post, e, exc_info=True)
+            return None
+        except Exception:
+            if sent:
+                logger.warning("%r was sent but could not be confirmed.", post)
+                return UNCONFIRMED
+            raise
+
+        logger.info("Published %r as status %s.", post, status_id)
+        return status_id
+
+    def _wait_for(self, condition):
+        return WebDriverWait(self.driver, self.confirm_timeout).until(condition)
+
+
+def run_post_queue(publisher, posts, pace=5):
+    """
+    Publish `posts` in publish-time order, waiting for scheduled ones, and
+    log a throughput report.
+
+    Each post records its result, so running the queue again (e.g. after a
+    supervisor restarted a dead session) only publishes the pending posts.
+
+    :param pace: Minimum seconds between two publishes
+    :return: {'published': [(name, status_id)], 'unconfirmed': [name],
+        'failed': [name], 'posts_per_minute'}; unconfirmed posts were sent
+    """
+    queue = sorted(posts, key=lambda post: post.publish_at or 0)
+    report = {"published": [], "unconfirmed": [], "failed": []}
+    busy_time = 0.0
+    last_publish = None
+
+    for post in queue:
+        if post.result is not None:
+            continue
+        now = time.time()
+        wait = max(
+            (post.publish_at or now) - now,
+            (last_publish + pace - now) if last_publish else 0,
+        )
+        if wait > 0:
+            logger.info("Waiting %.0fs before publishing %r...", wait, post)
+            sleep(wait)
+
+        start = time.perf_counter()
+        status_id = publisher.publish(post)
+        busy_time += time.perf_counter() - start
+        last_publish = time.time()
+
+        post.result = status_id or FAILED
+
+    for post in queue:
+        if post.result == UNCONFIRMED:
+            report["unconfirmed"].append(post.name)
+        elif post.result == FAILED:
+            report["failed"].append(post.name)
+        else:
+            report["published"].append((post.name, post.result))
+
+    published = len(report["published"]) + len(report["unconfirmed"])
+    report["posts_per_minute"] = published / busy_time * 60 if busy_time else 0.0
+    logger.info(
+        "Post queue done: %s published (%s unconfirmed), %s failed, "
+        "%.1f posts/min while publishing.",
+        published,
+        len(report["unconfirmed"]),
+        len(report["failed"]),
+        report["posts_per_minute"],
+    )
+    if report["unconfirmed"]:
+        logger.warning(
+            "Sent without confirmation (check before re-queueing): %s",
+            ", ".join(report["unconfirmed"]),
+        )
+    return report
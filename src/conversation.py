@@ -0,0 +1,202 @@
+# src/conversation.py
+import json
+import logging
+import os
+from collections import deque
+from time import sleep
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+from src.locators import SELECTORS
+from src.tweet import Tweet
+
+logger = logging.getLogger(__name__)
+
+TWITTER_STATUS_URL = "https://twitter.com/anyuser/status/{}"
+
+
+def is_status_card(card, tweet_id):
+    """
+    Returns True if `card` is the tweet `tweet_id` itself (it links to its
+    own status page), as opposed to an ancestor or a reply.
+    """
+    return bool(
+        SELECTORS.find_all(card, "conversation.own_status_link", tweet_id=tweet_id)
+    )
+
+
+class ConversationCrawler:
+    """
+    Breadth-first crawler that expands tweets into their reply trees.
+
+    Each status page is visited once; its replies are parsed with `Tweet` and
+    queued one level deeper until `max_depth` is reached. The frontier,
+    visited set and collected replies can be checkpointed to `state_file` so
+    an interrupted crawl resumes where it stopped.
+    """
+
+    def __init__(
+        self,
+        scraper,
+        max_depth=2,
+        max_replies=20,
+        max_tweets=500,
+        max_idle_scrolls=2,
+        state_file=None,
+    ):
+        """
+        :param scraper: Logged-in TwitterScraper
+        :param max_depth: Reply levels to expand below the seed tweets
+        :param max_replies: Fan-out limit: replies collected per status page
+        :param max_tweets: Stop once this many replies were collected
+        :param max_idle_scrolls: Scrolls without new replies before leaving a page
+        :param state_file: Optional JSON checkpoint for resuming
+        """
+        self.scraper = scraper
+        self.driver = scraper.driver
+        self.max_depth = max_depth
+        self.max_replies = max_replies
+        self.max_tweets = max_tweets
+        self.max_idle_scrolls = max_idle_scrolls
+        self.state_file = state_file
+
+        self.frontier = deque()  # (tweet_id, depth) pairs still to visit
+        self.visited = set()
+        self.collected = set()
+        self.data = []
+
+        if state_file and os.path.exists(state_file):
+            self._load_state()
+
+    def crawl(self, tweet_ids):
+        """
+        Crawl the conversations below `tweet_ids`.
+
+        :return: Reply dictionaries with added 'reply_to' and 'depth' keys
+        """
+        for tweet_id in tweet_ids:
+            if tweet_id not in self.visited:
+                self.frontier.append((tweet_id, 0))
+
+        while self.frontier and len(self.data) < self.max_tweets:
+            tweet_id, depth = self.frontier.popleft()
+            if tweet_id in self.visited:
+                continue
+            self.visited.add(tweet_id)
+
+            try:
+                replies = self._collect_replies(tweet_id)
+            except KeyboardInterrupt:
+                logger.info("Conversation crawl interrupted by user.")
+                self.frontier.appendleft((tweet_id, depth))
+                self.visited.discard(tweet_id)
+                break
+
+            for reply in replies:
+                if reply["tweet_id"] in self.collected:
+                    continue
+                self.collected.add(reply["tweet_id"])
+                reply["reply_to"] = tweet_id
+                reply["depth"] = depth + 1
+                self.data.append(reply)
+                if depth + 1 < self.max_depth:
+                    self.frontier.append((reply["tweet_id"], depth + 1))
+                if len(self.data) >= self.max_tweets:
+                    break
+
+            logger.info(
+                "Visited %s (depth %s): %s replies, %s queued, %s collected.",
+                tweet_id,
+                depth,
+                len(replies),
+                len(self.frontier),
+                len(self.data),
+            )
+            self._save_state()
+
+        logger.info(
+            "Conversation crawl complete. Collected %s replies.", len(self.data)
+        )
+        return self.data
+
+    def _collect_replies(self, tweet_id):
+        """
+        Visit a status page and return up to `max_replies` reply dictionaries.
+        Cards above the focal tweet (its ancestors) are skipped, and so is
+        everything from the first section heading below it ("Discover more"
+        recommendations, "More replies").
+        """
+        self.driver.get(TWITTER_STATUS_URL.format(tweet_id))
+        sleep(2)
+
+        replies = {}
+        seen_cards = set()
+        focal_found = False
+        section_ended = False
+        idle_scrolls = 0
+
+        while len(replies) < self.max_replies and idle_scrolls < self.max_idle_scrolls:
+            found_new = False
+            for card in SELECTORS.find_all(self.driver, "conversation.items"):
+                if card.id in seen_cards:
+                    continue
+                seen_cards.add(card.id)
+                try:
+                    if card.tag_name != "article":
+                        # A section heading: below the focal tweet, replies end here
+                        section_ended = focal_found
+                        if section_ended:
+                            break
+                        continue
+                    if not focal_found:
+                        focal_found = is_status_card(card, tweet_id)
+                        continue
+
+                    tweet_obj = Tweet(
+                        card=card, driver=self.driver, actions=self.scraper.actions
+                    )
+                except StaleElementReferenceException:
+                    continue
+                if tweet_obj.error or tweet_obj.is_ad or not tweet_obj.tweet_id:
+                    continue
+
+                if tweet_obj.tweet_id not in replies:
+                    replies[tweet_obj.tweet_id] = tweet_obj.to_dict()
+                    found_new = True
+                    if len(replies) >= self.max_replies:
+                        break
+
+            if section_ended:
+                break
+            idle_scrolls = 0 if found_new else idle_scrolls + 1
+            self.scraper.scroller.scroll_to_bottom()
+            sleep(2)
+
+        return list(replies.values())
+
+    def _save_state(self):
+        if not self.state_file:
+            return
+        state = {
+            "frontier": list(self.frontier),
+            "visited": sorted(self.visited),
+            "data": self.data,
+        }
+        tmp_file = f"{self.state_file}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_file, self.state_file)
+
+    def _load_state(self):
+        with open(self.state_file, encoding="utf-8") as f:
+            state = json.load(f)
+        self.frontier = deque(tuple(item) for item in state["frontier"])
+        self.visited = set(state["visited"])
+        self.data = state["data"]
+        self.collected = {reply["tweet_id"] for reply in self.data}
+        logger.info(
+            "Resumed crawl from %s: %s queued, %s collected.",
+            self.state_file,
+            len(self.frontier),
+            len(self.data),
+        )
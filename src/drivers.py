@@ -0,0 +1,225 @@
+# src/drivers.py
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Selenium is imported where a driver is built, so the CLI can validate
+# profiles without loading it.
+
+# Driver executables: environment variable, then the config file, then the
+# project's webdriver/ folder; otherwise Selenium Manager finds or fetches one.
+DRIVER_PATH_VARIABLES = {"firefox": "GECKODRIVER_PATH", "chrome": "CHROMEDRIVER_PATH"}
+BROWSER_BINARY_VARIABLES = {"firefox": "FIREFOX_BINARY", "chrome": "CHROME_BINARY"}
+DRIVER_NAMES = {"firefox": "geckodriver", "chrome": "chromedriver"}
+WEBDRIVER_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "webdriver")
+
+CONFIG_VARIABLE = "TWITTER_DRIVER_CONFIG"
+DEFAULT_CONFIG_FILE = "drivers.json"
+DEFAULT_PROFILE = "firefox-headless"
+
+_config = None  # Result of the last load_config call, reused by create_driver
+
+
+class RunProfile:
+    """
+    A named browser setup: engine, headless mode, page-load strategy and
+    extra command-line arguments or (Firefox) preferences.
+    """
+
+    def __init__(
+        self,
+        name,
+        browser,
+        headless=True,
+        page_load_strategy="normal",
+        arguments=(),
+        preferences=None,
+        description="",
+    ):
+        if browser not in DRIVER_NAMES:
+            raise ValueError(
+                f"Unknown browser '{browser}'; use one of {', '.join(DRIVER_NAMES)}."
+            )
+        self.name = name
+        self.browser = browser
+        self.headless = headless
+        self.page_load_strategy = page_load_strategy
+        self.arguments = list(arguments)
+        self.preferences = preferences or {}
+        self.description = description
+
+    @classmethod
+    def from_dict(cls, name, entry):
+        return cls(
+            name,
+            entry["browser"],
+            headless=entry.get("headless", True),
+            page_load_strategy=entry.get("page_load_strategy", "normal"),
+            arguments=entry.get("arguments", ()),
+            preferences=entry.get("preferences"),
+            description=entry.get("description", ""),
+        )
+
+    def __repr__(self):
+        return f"RunProfile({self.name!r}, {self.browser}, headless={self.headless})"
+
+
+PROFILES = {}
+
+
+def register_profile(profile):
+    PROFILES[profile.name] = profile
+    return profile
+
+
+register_profile(
+    RunProfile(
+        "firefox-headless",
+        "firefox",
+        description="Headless Firefox (default)",
+    )
+)
+register_profile(
+    RunProfile(
+        "chromium-headless",
+        "chrome",
+        arguments=["--disable-gpu", "--disable-dev-shm-usage"],
+        description="Headless Chromium/Chrome",
+    )
+)
+register_profile(
+    RunProfile(
+        "lean",
+        "firefox",
+        page_load_strategy="eager",
+        # Image files are not downloaded; their URLs are still in the page
+        preferences={"permissions.default.image": 2},
+        description="Headless Firefox that returns at DOMContentLoaded and skips images",
+    )
+)
+register_profile(
+    RunProfile(
+        "firefox",
+        "firefox",
+        headless=False,
+        description="Windowed Firefox, for watching or debugging a run",
+    )
+)
+
+
+def load_config(config_file=None):
+    """
+    Read the driver config (JSON): {"drivers": {browser: path},
+    "binaries": {browser: path}, "profiles": {name: {...}}}. Profiles in it
+    are registered. Without `config_file`, $TWITTER_DRIVER_CONFIG or
+    ./drivers.json is used if present.
+    """
+    global _config
+    config_file = config_file or os.environ.get(CONFIG_VARIABLE)
+    if not config_file:
+        if not os.path.exists(DEFAULT_CONFIG_FILE):
+            _config = {}
+            return _config
+        config_file = DEFAULT_CONFIG_FILE
+
+    with open(config_file, encoding="utf-8") as f:
+        try:
+            config = json.load(f)
+        except ValueError as e:
+            raise ValueError(f"Invalid driver config {config_file}: {e}") from None
+    if not isinstance(config, dict):
+        raise ValueError(f"Invalid driver config {config_file}: expected an object.")
+    for name, entry in config.get("profiles", {}).items():
+        try:
+            register_profile(RunProfile.from_dict(name, entry))
+        except (KeyError, TypeError, AttributeError):
+            raise ValueError(
+                f"Invalid run profile '{name}' in {config_file}: "
+                f"expected an object with a 'browser' key."
+            ) from None
+    _config = config
+    return config
+
+
+def driver_path(browser, config):
+    """
+    Returns the driver executable for `browser`, or None to let Selenium
+    Manager resolve it.
+    """
+    path = os.environ.get(DRIVER_PATH_VARIABLES[browser])
+    path = path or config.get("drivers", {}).get(browser)
+    if path:
+        return path
+    for name in (DRIVER_NAMES[browser], DRIVER_NAMES[browser] + ".exe"):
+        candidate = os.path.join(WEBDRIVER_DIR, name)
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def _options(profile, headless, binary):
+    from selenium import webdriver
+
+    if profile.browser == "firefox":
+        options = webdriver.FirefoxOptions()
+        for name, value in profile.preferences.items():
+            options.set_preference(name, value)
+    else:
+        options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument(
+            "--headless" if profile.browser == "firefox" else "--headless=new"
+        )
+    for argument in profile.arguments:
+        options.add_argument(argument)
+    options.page_load_strategy = profile.page_load_strategy
+    if binary:
+        options.binary_location = binary
+    return options
+
+
+def create_driver(profile=DEFAULT_PROFILE, headless=None, config=None):
+    """
+    Start a WebDriver for a run profile.
+
+    :param profile: Profile name or RunProfile
+    :param headless: Override the profile's headless setting
+    :param config: Driver config (see `load_config`); the one already
+        loaded, or read now, if None
+    :raises ValueError: for an unknown profile or an invalid config file
+    """
+    if config is None:
+        config = load_config() if _config is None else _config
+    if isinstance(profile, str):
+        if profile not in PROFILES:
+            raise ValueError(
+                f"Unknown run profile '{profile}'; use one of {', '.join(PROFILES)}."
+            )
+        profile = PROFILES[profile]
+    headless = profile.headless if headless is None else headless
+
+    binary = os.environ.get(BROWSER_BINARY_VARIABLES[profile.browser])
+    binary = binary or config.get("binaries", {}).get(profile.browser)
+    options = _options(profile, headless, binary)
+    path = driver_path(profile.browser, config)
+
+    logger.info(
+        "Starting %s (%s, %s, page load '%s', driver %s)...",
+        profile.name,
+        profile.browser,
+        "headless" if headless else "windowed",
+        profile.page_load_strategy,
+        path or "from Selenium Manager",
+    )
+    from selenium import webdriver
+
+    if profile.browser == "firefox":
+        from selenium.webdriver.firefox.service import Service
+
+        return webdriver.Firefox(service=Service(path), options=options)
+
+    from selenium.webdriver.chrome.service import Service
+
+    return webdriver.Chrome(service=Service(path), options=options)
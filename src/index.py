@@ -0,0 +1,323 @@
+# src/index.py
+import json
+import logging
+import re
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+from src.utils import parse_count, parse_timestamp
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tweets (
+    id INTEGER PRIMARY KEY,
+    tweet_id TEXT UNIQUE,
+    handle TEXT,
+    posted INTEGER,
+    engagement INTEGER,
+    data TEXT
+);
+CREATE INDEX IF NOT EXISTS tweets_posted ON tweets (posted);
+CREATE INDEX IF NOT EXISTS tweets_engagement ON tweets (engagement);
+CREATE INDEX IF NOT EXISTS tweets_handle ON tweets (handle, posted);
+CREATE TABLE IF NOT EXISTS labels (
+    label TEXT,
+    tweet INTEGER,
+    PRIMARY KEY (label, tweet)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS label_counts (
+    label TEXT PRIMARY KEY,
+    tweets INTEGER
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE IF NOT EXISTS terms USING fts5(
+    content, content='', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS terms_vocab USING fts5vocab(terms, 'row');
+"""
+
+# Tokens of a query: parentheses, quoted phrases and bare words
+QUERY_TOKEN = re.compile(r'\(|\)|"[^"]*"|[^\s()]+')
+OPERATORS = {"AND", "OR", "NOT"}
+
+
+def _normalize_label(value, prefix):
+    return prefix + str(value).lstrip(prefix).lower()
+
+
+def _parse_date(value):
+    if value is None or isinstance(value, (int, float)):
+        return value
+    value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def parse_query(text):
+    """
+    Split a query such as 'selenium OR scraping #python @user from:someone
+    since:2024-01-01' into search keyword arguments: free-text terms (with
+    AND/OR/NOT, parentheses, "phrases" and prefix*) go to `terms`; `#tag`,
+    `@mention`, `from:`, `since:` and `until:` become filters.
+    """
+    options = {"terms": [], "tags": [], "mentions": []}
+    for token in QUERY_TOKEN.findall(text):
+        if token.startswith("#") and len(token) > 1:
+            options["tags"].append(token)
+        elif token.startswith("@") and len(token) > 1:
+            options["mentions"].append(token)
+        elif token.startswith(("from:", "since:", "until:")):
+            name, _, value = token.partition(":")
+            options["handle" if name == "from" else name] = value
+        else:
+            options["terms"].append(token)
+    options["terms"] = " ".join(options["terms"])
+    return options
+
+
+def _match_expression(terms):
+    """
+    Turn a free-text query into an FTS5 expression, quoting every word so
+    punctuation in it is not read as FTS5 syntax.
+    """
+    parts = []
+    for token in QUERY_TOKEN.findall(terms):
+        if token in OPERATORS or token in "()":
+            parts.append(token)
+        elif token.startswith('"'):
+            parts.append(token)
+        elif token.endswith("*") and len(token) > 1:
+            parts.append('"' + token[:-1].replace('"', '""') + '"*')
+        else:
+            parts.append('"' + token.replace('"', '""') + '"')
+    return " ".join(parts)
+
+
+class TweetIndex:
+    """
+    On-disk index (SQLite) over scraped tweets for fast local queries.
+
+    Tweet text goes into a contentless FTS5 inverted index; hashtags and
+    mentions are postings in a (label, tweet) B-tree; handle, posting time
+    and engagement (likes + retweets + replies) are indexed columns, and
+    postings sizes are kept to pick a query plan. The
+    full tweet is stored once, as JSON, and returned by `search`. Tweets
+    are deduplicated by tweet_id, so adding the same tweet again is cheap.
+
+    One index can be shared by several scraping threads; writes are
+    batched and committed every `commit_every` tweets.
+    """
+
+    def __init__(self, index_file, commit_every=500):
+        self.index_file = index_file
+        self.commit_every = commit_every
+        self.pending = 0
+        self._lock = threading.Lock()
+
+        self.connection = sqlite3.connect(index_file, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+
+    def add(self, tweet):
+        """
+        Index one tweet dictionary (scraped, or read from an export).
+
+        :return: True if it was new
+        """
+        tweet_id = tweet.get("tweet_id")
+        engagement = sum(
+            parse_count(str(tweet.get(field) or ""))
+            for field in ("like_count", "retweet_count", "reply_count")
+        )
+        posted = parse_timestamp(tweet.get("date_time"))
+        handle = (tweet.get("handle") or "").lstrip("@").lower() or None
+
+        with self._lock:
+            cursor = self.connection.execute(
+                "INSERT OR IGNORE INTO tweets (tweet_id, handle, posted, engagement, data) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    tweet_id or None,
+                    handle,
+                    int(posted) if posted is not None else None,
+                    engagement,
+                    json.dumps(tweet, ensure_ascii=False, default=str),
+                ),
+            )
+            if not cursor.rowcount:
+                return False
+
+            row_id = cursor.lastrowid
+            self.connection.execute(
+                "INSERT INTO terms (rowid, content) VALUES (?, ?)",
+                (row_id, tweet.get("content") or ""),
+            )
+            labels = {_normalize_label(tag, "#") for tag in tweet.get("tags") or []}
+            labels |= {
+                _normalize_label(mention, "@")
+                for mention in tweet.get("mentions") or []
+            }
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO labels (label, tweet) VALUES (?, ?)",
+                [(label, row_id) for label in labels],
+            )
+            self.connection.executemany(
+                "INSERT INTO label_counts (label, tweets) VALUES (?, 1) "
+                "ON CONFLICT (label) DO UPDATE SET tweets = tweets + 1",
+                [(label,) for label in labels],
+            )
+
+            self.pending += 1
+            if self.pending >= self.commit_every:
+                self._commit()
+        return True
+
+    def add_all(self, tweets):
+        """
+        Index `tweets` and commit.
+
+        :return: Number of new tweets
+        """
+        added = sum(1 for tweet in tweets if self.add(tweet))
+        self.commit()
+        return added
+
+    def commit(self):
+        with self._lock:
+            self._commit()
+
+    def _commit(self):
+        self.connection.commit()
+        self.pending = 0
+
+    def count(self):
+        return self.connection.execute("SELECT COUNT(*) FROM tweets").fetchone()[0]
+
+    def search(
+        self,
+        terms="",
+        tags=(),
+        mentions=(),
+        handle=None,
+        since=None,
+        until=None,
+        top=False,
+        limit=20,
+    ):
+        """
+        Find indexed tweets.
+
+        :param terms: Free-text query; words are ANDed unless joined with OR,
+            and support NOT, parentheses, "phrases" and prefix*
+        :param tags: Hashtags the tweet must all have
+        :param mentions: Users the tweet must all mention
+        :param handle: Only tweets posted by this user
+        :param since: Posted at or after this date (ISO date/time or Unix time)
+        :param until: Posted before this date
+        :param top: Order by engagement instead of newest first
+        :param limit: Maximum number of tweets returned
+        :return: Tweet dictionaries
+        """
+        labels = [_normalize_label(tag, "#") for tag in tags]
+        labels += [_normalize_label(mention, "@") for mention in mentions]
+        order = "engagement DESC" if top else "posted DESC"
+
+        # Postings filters as (estimated matches, lookup, per-tweet probe, param);
+        # a MATCH is too costly to repeat per tweet, so terms are never probed
+        postings = []
+        if terms.strip():
+            postings.append(
+                (
+                    self._estimate_terms(terms),
+                    "{id} IN (SELECT rowid FROM terms WHERE terms MATCH ?)",
+                    None,
+                    _match_expression(terms),
+                )
+            )
+        for label in labels:
+            postings.append(
+                (
+                    self._label_count(label),
+                    "{id} IN (SELECT tweet FROM labels WHERE label = ?)",
+                    "EXISTS (SELECT 1 FROM labels WHERE label = ? AND tweet = id)",
+                    label,
+                )
+            )
+        # Terms without an estimate (OR/NOT...) usually match few tweets: lead
+        postings.sort(key=lambda p: -1 if p[0] is None else p[0])
+
+        # The smallest postings list (or the handle index) drives the query
+        # and the other postings are probed per tweet. When even the smallest
+        # list is large, walking the `order` index and probing each tweet
+        # finds `limit` matches sooner (`+id` keeps SQLite from using the
+        # lookups to drive it).
+        fewest = postings[0][0] if postings else None
+        scan = (
+            fewest is not None and not handle and fewest * fewest > limit * self._size()
+        )
+
+        conditions, params = [], []
+        for position, (_, lookup, probe, param) in enumerate(postings):
+            driver = position == 0 and not scan and not handle
+            if probe and not driver:
+                conditions.append(probe)
+            else:
+                conditions.append(lookup.format(id="+id" if scan else "id"))
+            params.append(param)
+        if handle:
+            conditions.append("handle = ?")
+            params.append(handle.lstrip("@").lower())
+        if since is not None:
+            conditions.append("posted >= ?")
+            params.append(_parse_date(since))
+        if until is not None:
+            conditions.append("posted < ?")
+            params.append(_parse_date(until))
+
+        # Rank IDs only, then load the `limit` winning rows
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        sql = (
+            f"SELECT data FROM tweets WHERE id IN "
+            f"(SELECT id FROM tweets{where} ORDER BY {order} LIMIT ?) ORDER BY {order}"
+        )
+        params.append(limit)
+
+        try:
+            with self._lock:
+                rows = self.connection.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid query '{terms}': {e}") from None
+        return [json.loads(data) for (data,) in rows]
+
+    def _size(self):
+        # IDs are never reused, so the largest one bounds the row count in O(log n)
+        return self.connection.execute("SELECT MAX(id) FROM tweets").fetchone()[0] or 0
+
+    def _label_count(self, label):
+        row = self.connection.execute(
+            "SELECT tweets FROM label_counts WHERE label = ?", (label,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def _estimate_terms(self, terms):
+        """
+        Upper bound of the tweets matching a plain AND of words (the rarest
+        word's document count); None for OR/NOT, phrases or punctuation.
+        """
+        counts = []
+        for word in QUERY_TOKEN.findall(terms):
+            if not word.isalnum() or word in OPERATORS:
+                return None
+            row = self.connection.execute(
+                "SELECT doc FROM terms_vocab WHERE term = ?", (word.lower(),)
+            ).fetchone()
+            counts.append(row[0] if row else 0)
+        return min(counts)
+
+    def close(self):
+        self.commit()
+        self.connection.close()
+        logger.info("Index %s closed.", self.index_file)
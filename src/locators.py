@@ -0,0 +1,432 @@
+# src/locators.py
+import logging
+import threading
+from collections import Counter
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+logger = logging.getLogger(__name__)
+
+
+class SelectorRegistry:
+    """
+    Central registry of named element locators with ordered fallbacks.
+
+    Each name maps to a list of (By, value) variants. Lookups try the variant
+    that matched last time first, then the rest in order, and use
+    `find_elements` so a miss costs an empty list instead of an exception.
+
+    Variants are for different DOM versions. States of the same element
+    (like/unlike) belong in one CSS selector list, so they don't make the
+    preferred variant flip. Lookups may come from several threads.
+    """
+
+    def __init__(self):
+        self._variants = {}
+        self._preferred = {}
+        self._optional = set()
+        self._lock = threading.Lock()
+        self.hits = Counter()
+        self.misses = Counter()
+
+    def register(self, name, *variants, optional=False):
+        """
+        Register the locator variants for `name`, most preferred first.
+
+        :param name: Logical selector name (e.g. 'tweet.card')
+        :param variants: (By, value) tuples; values may contain `{placeholders}`
+            filled from the lookup's keyword arguments
+        :param optional: The element is often legitimately absent (e.g. photos),
+            so finding nothing is not counted as a miss
+        """
+        if not variants:
+            raise ValueError(f"Selector '{name}' needs at least one variant.")
+        self._variants[name] = list(variants)
+        self._preferred[name] = 0
+        if optional:
+            self._optional.add(name)
+        else:
+            self._optional.discard(name)
+
+    def variants(self, name):
+        """
+        Returns the variants for `name`, with the last working one first.
+        """
+        try:
+            variants = self._variants[name]
+        except KeyError:
+            raise KeyError(f"Unknown selector '{name}'.") from None
+        preferred = self._preferred[name]
+        return [variants[preferred]] + [
+            v for i, v in enumerate(variants) if i != preferred
+        ]
+
+    def find_all(self, parent, name, **params):
+        """
+        Returns the elements matched by the first working variant of `name`
+        under `parent` (a driver or element), or an empty list.
+
+        :param params: Values for the variants' placeholders
+        """
+        variants = self._variants.get(name)
+        if variants is None:
+            raise KeyError(f"Unknown selector '{name}'.")
+
+        preferred = self._preferred[name]
+        order = [preferred] + [i for i in range(len(variants)) if i != preferred]
+        for index in order:
+            by, value = variants[index]
+            if params:
+                value = value.format(**params)
+            elements = parent.find_elements(by, value)
+            if elements:
+                with self._lock:
+                    self.hits[name] += 1
+                    switched = index != self._preferred[name]
+                    self._preferred[name] = index
+                if switched:
+                    logger.info("Selector '%s' switched to variant %s.", name, index)
+                return elements
+
+        if name not in self._optional:
+            with self._lock:
+                self.misses[name] += 1
+        return []
+
+    def find(self, parent, name, **params):
+        """
+        Returns the first element matched by `name` under `parent`.
+
+        :raises NoSuchElementException: if no variant matches
+        """
+        elements = self.find_all(parent, name, **params)
+        if not elements:
+            raise NoSuchElementException(f"No variant of selector '{name}' matched.")
+        return elements[0]
+
+    def css(self, name):
+        """
+        Returns the first CSS variant of `name`, for use in injected scripts.
+        """
+        for by, value in self.variants(name):
+            if by == By.CSS_SELECTOR:
+                return value
+        raise KeyError(f"Selector '{name}' has no CSS variant.")
+
+    def stats(self):
+        """
+        Returns {name: {'hits', 'misses', 'hit_rate', 'variant'}} for every
+        selector that has been looked up at least once.
+        """
+        stats = {}
+        with self._lock:
+            counts = {
+                name: (self.hits[name], self.misses[name]) for name in self._variants
+            }
+        for name, (hits, misses) in counts.items():
+            if hits + misses == 0:
+                continue
+            stats[name] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses),
+                "variant": self._preferred[name],
+            }
+        return stats
+
+    def log_stats(self):
+        """
+        Logs the hit/miss counters, flagging selectors that never matched.
+        """
+        for name, s in sorted(self.stats().items()):
+            # Selectors that never matched are warnings
+            level = logging.WARNING if s["hits"] == 0 else logging.INFO
+            logger.log(
+                level,
+                "Selector '%s': %d hits, %d misses (%.0f%%), variant %s",
+                name,
+                s["hits"],
+                s["misses"],
+                s["hit_rate"] * 100,
+                s["variant"],
+            )
+
+
+SELECTORS = SelectorRegistry()
+
+# Timeline
+SELECTORS.register(
+    "timeline.tweet_card",
+    (By.CSS_SELECTOR, 'article[data-testid="tweet"]:not([disabled])'),
+    (By.XPATH, '//article[@data-testid="tweet" and not(@disabled)]'),
+    (By.XPATH, '//div[@data-testid="cellInnerDiv"]//article'),
+)
+SELECTORS.register(
+    "timeline.unpruned_tweet_card",
+    (
+        By.CSS_SELECTOR,
+        'article[data-testid="tweet"]:not([disabled]):not([data-sta-pruned])',
+    ),
+    (
+        By.XPATH,
+        '//article[@data-testid="tweet" and not(@disabled) and not(@data-sta-pruned)]',
+    ),
+)
+SELECTORS.register(
+    "page.cookie_refuse",
+    (By.XPATH, "//span[text()='Refuse non-essential cookies']/../../.."),
+    optional=True,
+)
+
+# Login flow
+SELECTORS.register(
+    "login.username",
+    (By.CSS_SELECTOR, "input[autocomplete='username']"),
+    (By.CSS_SELECTOR, "input[name='text']"),
+)
+SELECTORS.register(
+    "login.unusual_activity",
+    (By.CSS_SELECTOR, "input[data-testid='ocfEnterTextTextInput']"),
+    optional=True,
+)
+SELECTORS.register(
+    "login.password",
+    (By.CSS_SELECTOR, "input[autocomplete='current-password']"),
+    (By.CSS_SELECTOR, "input[name='password']"),
+)
+
+# Tweet card fields (relative to an article element)
+SELECTORS.register(
+    "tweet.user_name",
+    (By.CSS_SELECTOR, 'div[data-testid="User-Name"] span'),
+    (By.XPATH, './/div[@data-testid="User-Name"]//span'),
+)
+SELECTORS.register(
+    "tweet.handle",
+    (By.XPATH, './/span[contains(text(), "@")]'),
+)
+SELECTORS.register(
+    "tweet.time",
+    (By.CSS_SELECTOR, "time"),
+)
+SELECTORS.register(
+    "tweet.verified",
+    (By.CSS_SELECTOR, 'svg[data-testid="icon-verified"]'),
+    (By.XPATH, './/*[local-name()="svg" and @data-testid="icon-verified"]'),
+    optional=True,
+)
+SELECTORS.register(
+    "tweet.text_parts",
+    (
+        By.XPATH,
+        '(.//div[@data-testid="tweetText"])[1]/span | (.//div[@data-testid="tweetText"])[1]/a',
+    ),
+    optional=True,  # Media-only tweets have no text
+)
+SELECTORS.register(
+    "tweet.reply_count",
+    (By.CSS_SELECTOR, 'button[data-testid="reply"] span'),
+    (By.XPATH, './/button[@data-testid="reply"]//span'),
+)
+SELECTORS.register(
+    "tweet.retweet_count",
+    (
+        By.CSS_SELECTOR,
+        'button[data-testid="retweet"] span, button[data-testid="unretweet"] span',
+    ),
+)
+SELECTORS.register(
+    "tweet.like_count",
+    (
+        By.CSS_SELECTOR,
+        'button[data-testid="like"] span, button[data-testid="unlike"] span',
+    ),
+)
+SELECTORS.register(
+    "tweet.analytics_count",
+    (By.CSS_SELECTOR, 'a[href*="/analytics"] span'),
+    optional=True,
+)
+SELECTORS.register(
+    "tweet.hashtags",
+    (By.CSS_SELECTOR, 'a[href*="src=hashtag_click"]'),
+    optional=True,
+)
+SELECTORS.register(
+    "tweet.mentions",
+    (By.XPATH, '(.//div[@data-testid="tweetText"])[1]//a[contains(text(), "@")]'),
+    optional=True,
+)
+SELECTORS.register(
+    "tweet.emojis",
+    (By.XPATH, '(.//div[@data-testid="tweetText"])[1]/img[contains(@src, "emoji")]'),
+    optional=True,
+)
+SELECTORS.register(
+    "tweet.avatar",
+    (By.CSS_SELECTOR, 'div[data-testid="Tweet-User-Avatar"] img'),
+)
+SELECTORS.register(
+    "tweet.photos",
+    (By.CSS_SELECTOR, 'div[data-testid="tweetPhoto"] img'),
+    optional=True,
+)
+SELECTORS.register(
+    "tweet.videos",
+    # Video players and GIFs
+    (By.CSS_SELECTOR, "video"),
+    optional=True,
+)
+SELECTORS.register(
+    "tweet.status_link",
+    (By.CSS_SELECTOR, 'a[href*="/status/"]'),
+)
+
+# Conversation (status) pages
+SELECTORS.register(
+    "conversation.items",
+    # Tweet cards and section headings ("Discover more", "More replies") in
+    # page order; the replies end at the first heading below the focal tweet
+    (
+        By.XPATH,
+        '//div[@data-testid="cellInnerDiv"]//*[self::article[@data-testid="tweet"'
+        " and not(@disabled)] or (self::h2 and not(ancestor::article))]",
+    ),
+    (By.CSS_SELECTOR, 'article[data-testid="tweet"]:not([disabled])'),
+)
+SELECTORS.register(
+    "conversation.own_status_link",
+    # Exact path: a prefix match would also accept longer IDs
+    (By.CSS_SELECTOR, 'a[href$="/status/{tweet_id}"]'),
+    optional=True,
+)
+
+# Poster hover card
+SELECTORS.register(
+    "hover.card",
+    (By.CSS_SELECTOR, 'div[data-testid="hoverCardParent"]'),
+)
+SELECTORS.register(
+    "hover.follow_button",
+    (By.CSS_SELECTOR, 'div[data-testid$="-follow"], div[data-testid$="-unfollow"]'),
+    (
+        By.XPATH,
+        '(.//div[contains(@data-testid, "-follow")]) | (.//div[contains(@data-testid, "-unfollow")])',
+    ),
+)
+SELECTORS.register(
+    "hover.following_count",
+    (By.CSS_SELECTOR, 'a[href*="/following"] span'),
+)
+SELECTORS.register(
+    "hover.followers_count",
+    (By.CSS_SELECTOR, 'a[href*="/verified_followers"] span'),
+    (By.CSS_SELECTOR, 'a[href*="/followers"] span'),
+)
+
+# Tweet interactions
+SELECTORS.register(
+    "action.like",
+    (By.CSS_SELECTOR, '[data-testid="like"]'),
+)
+SELECTORS.register(
+    "action.reply_field",
+    (
+        By.XPATH,
+        '//div[contains(@class,"public-DraftEditorPlaceholder-inner") '
+        'and contains(text(),"Post your reply")]',
+    ),
+    (By.CSS_SELECTOR, 'div[data-testid="tweetTextarea_0"]'),
+)
+SELECTORS.register(
+    "action.retweet",
+    (By.CSS_SELECTOR, 'div[data-testid="retweet"], button[data-testid="retweet"]'),
+)
+SELECTORS.register(
+    "action.retweet_confirm",
+    (By.CSS_SELECTOR, 'div[data-testid="retweetConfirm"]'),
+)
+SELECTORS.register(
+    "action.quote_option",
+    (By.CSS_SELECTOR, 'div[data-testid="retweetWithComment"]'),
+    (By.CSS_SELECTOR, 'a[href="/compose/post"]'),
+)
+SELECTORS.register(
+    "action.tweet_textarea",
+    (By.CSS_SELECTOR, 'div[data-testid="tweetTextarea_0"]'),
+)
+
+# User actions
+# The profile's own button, matched by handle: the page also shows follow
+# buttons of suggested accounts. Use with handle=<username>.
+SELECTORS.register(
+    "user.follow",
+    (
+        By.CSS_SELECTOR,
+        'div[data-testid="primaryColumn"] '
+        'button[data-testid$="-follow"][aria-label*="@{handle}" i]',
+    ),
+    (
+        By.CSS_SELECTOR,
+        'div[data-testid="primaryColumn"] '
+        'div[role="button"][data-testid$="-follow"][aria-label*="@{handle}" i]',
+    ),
+)
+SELECTORS.register(
+    "user.unfollow",
+    (
+        By.CSS_SELECTOR,
+        'div[data-testid="primaryColumn"] '
+        'button[data-testid$="-unfollow"][aria-label*="@{handle}" i]',
+    ),
+    (
+        By.CSS_SELECTOR,
+        'div[data-testid="primaryColumn"] '
+        'div[role="button"][data-testid$="-unfollow"][aria-label*="@{handle}" i]',
+    ),
+)
+SELECTORS.register(
+    "user.unfollow_confirm",
+    (By.CSS_SELECTOR, 'div[data-testid="confirmationSheetConfirm"]'),
+    (By.CSS_SELECTOR, 'button[data-testid="confirmationSheetConfirm"]'),
+)
+
+# Follow lists
+SELECTORS.register(
+    "user.cell",
+    # The primary column only: the sidebar lists "Who to follow" cells too
+    (
+        By.CSS_SELECTOR,
+        'div[data-testid="primaryColumn"] button[data-testid="UserCell"], '
+        'div[data-testid="primaryColumn"] div[data-testid="UserCell"]',
+    ),
+    (By.XPATH, '//*[@data-testid="primaryColumn"]//*[@data-testid="UserCell"]'),
+)
+SELECTORS.register(
+    "user.cell_profile_link",
+    (By.CSS_SELECTOR, 'a[role="link"][href^="/"]'),
+    (By.CSS_SELECTOR, 'a[href^="/"]'),
+)
+
+# Compose dialog
+SELECTORS.register(
+    "compose.textareas",
+    (By.CSS_SELECTOR, 'div[data-testid^="tweetTextarea_"][contenteditable="true"]'),
+    (By.CSS_SELECTOR, 'div[data-testid^="tweetTextarea_"][role="textbox"]'),
+)
+SELECTORS.register(
+    "compose.add_part",
+    (By.CSS_SELECTOR, 'button[data-testid="addButton"]'),
+    (By.CSS_SELECTOR, '[data-testid="addButton"]'),
+)
+SELECTORS.register(
+    "compose.post_button",
+    (By.CSS_SELECTOR, 'button[data-testid="tweetButton"]'),
+    (By.CSS_SELECTOR, 'button[data-testid="tweetButtonInline"]'),
+)
+SELECTORS.register(
+    "compose.sent_status_link",
+    (By.CSS_SELECTOR, 'div[data-testid="toast"] a[href*="/status/"]'),
+    (By.CSS_SELECTOR, '[role="alert"] a[href*="/status/"]'),
+)
@@ -0,0 +1,189 @@
+# src/log.py
+import atexit
+import logging
+import sys
+import threading
+import time
+
+TEXT_FORMAT = "%(asctime)s - %(message)s"
+
+# Third-party loggers that are too chatty at INFO/DEBUG
+DEFAULT_LEVELS = {"selenium": "WARNING", "urllib3": "WARNING"}
+
+# Attributes every LogRecord has; anything else was passed with `extra=`
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_listener = None
+_level_overrides = set()
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats each record as one JSON object per line with `time`, `level`,
+    `logger` and `message`, plus any fields passed with `extra=`.
+    """
+
+    def __init__(self):
+        super().__init__()
+        import json  # Only needed when JSON output is on
+
+        self._dumps = json.dumps
+
+    def format(self, record):
+        entry = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+            + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return self._dumps(entry, default=str, ensure_ascii=False)
+
+
+class HotPathFilter(logging.Filter):
+    """
+    Thins out repetitive messages from hot loops.
+
+    Records at or below `level` pass once every `every` calls of the same
+    message template (per logger), and at most once per `min_interval`
+    seconds. The number of records dropped in between is attached to the
+    next one that passes as `suppressed`. Templates are compared before
+    formatting, so dropped records are never formatted.
+    """
+
+    def __init__(self, every=1, min_interval=0.0, level=logging.DEBUG):
+        super().__init__()
+        self.every = max(every, 1)
+        self.min_interval = min_interval
+        self.level = level
+        self._state = {}  # (logger, template) -> [calls, last_passed, suppressed]
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno > self.level:
+            return True
+        with self._lock:
+            state = self._state.setdefault((record.name, record.msg), [0, None, 0])
+            state[0] += 1
+            if (state[0] - 1) % self.every or (
+                state[1] is not None and record.created - state[1] < self.min_interval
+            ):
+                state[2] += 1
+                return False
+            if state[2]:
+                record.suppressed = state[2]
+            state[1], state[2] = record.created, 0
+        return True
+
+
+class _QueueHandler(logging.Handler):
+    """
+    Hands records to the listener thread. The message arguments are merged
+    here (they may change later); formatting, including tracebacks, is left
+    to the listener.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__()
+        self.queue = log_queue
+
+    def emit(self, record):
+        record.msg = record.getMessage()
+        record.args = None
+        self.queue.put_nowait(record)
+
+
+def parse_levels(spec):
+    """
+    Parse per-module levels such as 'src.scroller=DEBUG,selenium=WARNING'.
+
+    :return: {logger name: level name}
+    """
+    levels = {}
+    for item in filter(None, (part.strip() for part in (spec or "").split(","))):
+        name, _, level = item.partition("=")
+        if not level:
+            raise ValueError(f"Expected <logger>=<level>, got '{item}'.")
+        levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def configure_logging(
+    level="INFO",
+    json_format=False,
+    log_file=None,
+    levels=None,
+    sample_every=1,
+    min_interval=0.0,
+    queued=True,
+):
+    """
+    Route all logging through a queue to a background thread that formats
+    and writes the records, so callers never wait on I/O. Calling it again
+    replaces the previous configuration.
+
+    :param level: Root level
+    :param json_format: Write one JSON object per line instead of plain text
+    :param log_file: Also write the logs to this file
+    :param levels: {logger name: level} overrides, e.g. {'src.scroller': 'DEBUG'}
+    :param sample_every: Let through one in N repeats of each DEBUG message
+    :param min_interval: Let through each DEBUG message at most once per N seconds
+    :param queued: Use the background thread; False writes synchronously and
+        skips importing `logging.handlers` (for short-lived commands)
+    """
+    global _listener
+    _stop_listener()
+
+    formatter = JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT)
+    handlers = [logging.StreamHandler(sys.stderr)]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file, encoding="utf-8"))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+
+    hot_path_filter = HotPathFilter(sample_every, min_interval)
+    if queued:
+        import queue
+        from logging.handlers import QueueListener
+
+        log_queue = queue.SimpleQueue()
+        queue_handler = _QueueHandler(log_queue)
+        queue_handler.addFilter(hot_path_filter)
+        root.addHandler(queue_handler)
+        _listener = QueueListener(log_queue, *handlers)
+        _listener.start()
+    else:
+        for handler in handlers:
+            handler.addFilter(hot_path_filter)
+            root.addHandler(handler)
+
+    root.setLevel(level.upper() if isinstance(level, str) else level)
+    for name in _level_overrides:
+        logging.getLogger(name).setLevel(logging.NOTSET)
+    _level_overrides.clear()
+    for name, module_level in {**DEFAULT_LEVELS, **(levels or {})}.items():
+        logging.getLogger(name).setLevel(module_level)
+        _level_overrides.add(name)
+
+
+def _stop_listener():
+    # Flush the records still queued (at exit, or before reconfiguring)
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(_stop_listener)
@@ -0,0 +1,182 @@
+# src/media.py
+import ast
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.json"
+
+# Extensions kept in object file names; anything else is stored without one
+MEDIA_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".mp4"}
+
+
+class MediaCache:
+    """
+    Content-addressed on-disk store for downloaded media.
+
+    Files are stored as `objects/<sha256[:2]>/<sha256><ext>`, so identical
+    content is kept once. `index.json` maps each URL to its object, so a URL
+    fetched in any earlier run is never downloaded again.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.index_file = os.path.join(cache_dir, INDEX_FILE)
+        self._lock = threading.Lock()
+        self.index = {}
+
+        os.makedirs(cache_dir, exist_ok=True)
+        if os.path.exists(self.index_file):
+            with open(self.index_file, encoding="utf-8") as f:
+                self.index = json.load(f)
+
+    def path_for(self, url):
+        """
+        Returns the cached file for `url`, or None if it was never stored.
+        """
+        relative_path = self.index.get(url)
+        if relative_path is None:
+            return None
+        path = os.path.join(self.cache_dir, relative_path)
+        return path if os.path.exists(path) else None
+
+    def store(self, url, content, content_type=None):
+        """
+        Store `content` under its SHA-256 digest and record it for `url`.
+
+        :return: Path of the stored object
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        extension = _guess_extension(url, content_type)
+        relative_path = os.path.join("objects", digest[:2], digest + extension)
+        path = os.path.join(self.cache_dir, relative_path)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+
+        with self._lock:
+            self.index[url] = relative_path
+        return path
+
+    def save_index(self):
+        with self._lock:
+            tmp_file = f"{self.index_file}.tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self.index, f)
+            os.replace(tmp_file, self.index_file)
+
+
+def _guess_extension(url, content_type):
+    candidates = []
+    if content_type:
+        candidates.append(
+            mimetypes.guess_extension(content_type.split(";")[0].strip()) or ""
+        )
+    candidates.append(os.path.splitext(url.split("?", 1)[0])[1])
+    # Twitter image URLs carry the format as a query parameter (?format=jpg)
+    if "format=" in url:
+        candidates.append("." + url.split("format=", 1)[1].split("&", 1)[0])
+    for extension in candidates:
+        if extension.lower() in MEDIA_EXTENSIONS:
+            return extension.lower()
+    return ""
+
+
+def collect_media_urls(tweets, include_avatars=True):
+    """
+    Returns the unique http(s) media URLs referenced by `tweets`, in order.
+    Accepts freshly scraped dictionaries and CSV exports (where lists are
+    stored as their string representation).
+
+    Videos are covered by their poster image only (GIFs by their .mp4): the
+    player streams them from blob: URLs, which are skipped.
+    """
+    urls = {}
+    for tweet in tweets:
+        media = tweet.get("media") or []
+        if isinstance(media, str):
+            try:
+                media = ast.literal_eval(media) if media.startswith("[") else [media]
+            except (ValueError, SyntaxError):
+                logger.warning("Skipping malformed media cell: %r", media[:80])
+                media = []
+        candidates = list(media) if isinstance(media, (list, tuple)) else []
+        if include_avatars and tweet.get("profile_img"):
+            candidates.append(tweet["profile_img"])
+        for url in candidates:
+            if isinstance(url, str) and url.startswith(("http://", "https://")):
+                urls[url] = None
+    return list(urls)
+
+
+def download_media(urls, cache, max_workers=8, timeout=30):
+    """
+    Download `urls` into `cache` with a bounded pool of connections.
+    URLs already in the cache are skipped.
+
+    :return: {url: local path} for every URL that is now cached
+    """
+    paths = {}
+    pending = []
+    for url in urls:
+        path = cache.path_for(url)
+        if path:
+            paths[url] = path
+        else:
+            pending.append(url)
+
+    logger.info(
+        "Media: %s cached, %s to download with %s workers.",
+        len(paths),
+        len(pending),
+        max_workers,
+    )
+    if not pending:
+        return paths
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    def fetch(url):
+        response = session.get(url, timeout=timeout)
+        response.raise_for_status()
+        return cache.store(url, response.content, response.headers.get("Content-Type"))
+
+    failed = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(fetch, url): url for url in pending}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    paths[url] = future.result()
+                except (requests.RequestException, OSError) as e:
+                    # OSError: the object could not be written (disk full...)
+                    failed += 1
+                    logger.warning("Could not download %s: %s", url, e)
+    finally:
+        session.close()
+        cache.save_index()
+
+    logger.info(
+        "Media: downloaded %s, failed %s, cache at %s.",
+        len(pending) - failed,
+        failed,
+        cache.cache_dir,
+    )
+    return paths
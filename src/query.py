@@ -0,0 +1,311 @@
+# src/query.py
+import logging
+import threading
+from datetime import date, datetime, time, timedelta, timezone
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+TWITTER_SEARCH_URL = "https://twitter.com/search"
+
+
+def parse_date(value):
+    """
+    Returns `value` (datetime, date or ISO string) as a naive UTC datetime;
+    times with a UTC offset are converted, naive ones are taken as UTC.
+
+    :raises ValueError: if a string is not an ISO date or time
+    """
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        if isinstance(value, date):
+            return datetime.combine(value, time())
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            raise ValueError(
+                f"invalid date {value!r}; use YYYY-MM-DD or an ISO time"
+            ) from None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class SearchQuery:
+    """
+    Builds advanced search queries (`from:`, `since:`, `until:`,
+    `min_faves:`, `lang:`) and their properly encoded search URLs.
+
+    Dates are UTC. Window bounds on a day boundary use `since:`/`until:`;
+    anything finer uses `since_time:`/`until_time:` (Unix seconds).
+    """
+
+    def __init__(
+        self,
+        terms="",
+        from_user=None,
+        since=None,
+        until=None,
+        min_faves=None,
+        lang=None,
+    ):
+        self.terms = terms
+        self.from_user = from_user
+        self.since = parse_date(since)
+        self.until = parse_date(until)
+        self.min_faves = min_faves
+        self.lang = lang
+
+    def build(self):
+        """
+        Returns the query string, e.g. 'python from:user since:2024-01-01'.
+        """
+        parts = [self.terms.strip()] if self.terms else []
+        if self.from_user:
+            parts.append(f"from:{self.from_user.lstrip('@')}")
+        if self.since:
+            parts.append(_date_operator("since", self.since))
+        if self.until:
+            parts.append(_date_operator("until", self.until))
+        if self.min_faves:
+            parts.append(f"min_faves:{int(self.min_faves)}")
+        if self.lang:
+            parts.append(f"lang:{self.lang}")
+        return " ".join(parts)
+
+    def url(self, latest=True):
+        """
+        Returns the search URL for this query, URL-encoded.
+        """
+        params = {"q": self.build(), "src": "typed_query"}
+        if latest:
+            params["f"] = "live"
+        return f"{TWITTER_SEARCH_URL}?{urlencode(params)}"
+
+    def window(self, since, until):
+        """
+        Returns a copy of this query restricted to [since, until).
+        """
+        return SearchQuery(
+            terms=self.terms,
+            from_user=self.from_user,
+            since=since,
+            until=until,
+            min_faves=self.min_faves,
+            lang=self.lang,
+        )
+
+    def __str__(self):
+        return self.build()
+
+
+def _date_operator(name, value):
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    if value.time() == time():
+        return f"{name}:{value.date().isoformat()}"
+    epoch = int(value.replace(tzinfo=timezone.utc).timestamp())
+    return f"{name}_time:{epoch}"
+
+
+class ShardPlanner:
+    """
+    Splits a search over [since, until) into time-window shards so each
+    shard stays below the point where infinite-scroll search stalls.
+
+    A shard that comes back full (`max_tweets_per_shard` results) probably
+    missed tweets, so it is split in half and scraped again, down to
+    `min_window`. A shard that is still full at that size is kept, logged as
+    truncated and listed in `truncated`; a shard whose scrape failed is
+    logged and listed in `failed`. After each shard the next window is
+    sized from the observed result density, aiming at about half of
+    `max_tweets_per_shard`. Results of all shards are merged and
+    deduplicated by tweet_id.
+    """
+
+    def __init__(
+        self,
+        query,
+        since,
+        until,
+        max_tweets_per_shard=500,
+        initial_window=timedelta(days=1),
+        min_window=timedelta(hours=1),
+        max_window=timedelta(days=30),
+        **scrape_options,
+    ):
+        """
+        :param query: SearchQuery to shard; its own since/until are replaced
+        :param max_tweets_per_shard: Tweets scraped per shard; a shard that
+            reaches it is considered saturated
+        :param initial_window: Size of the first shard(s)
+        :param min_window: Saturated shards are not split into halves
+            smaller than this
+        :param max_window: Sparse results never grow a shard beyond this size
+        :param scrape_options: Passed on to `scrape_tweets` (e.g. prune_dom)
+        """
+        self.query = query
+        self.since = parse_date(since)
+        self.until = parse_date(until)
+        self.max_tweets_per_shard = max_tweets_per_shard
+        self.initial_window = initial_window
+        self.min_window = min_window
+        self.max_window = max_window
+        self.scrape_options = scrape_options
+
+        self.data = []
+        self.collected_ids = set()
+        self.shards_run = 0
+        self.truncated = []  # (since, until) of shards full at the minimum size
+        self.failed = []  # (since, until) of shards whose scrape failed
+        self._lock = threading.Lock()  # Shards may be scraped in parallel
+
+    def _scrape(self, scraper, since, until):
+        shard_query = self.query.window(since, until)
+        logger.info("Scraping shard %s -> %s: %s", since, until, shard_query)
+        with self._lock:
+            self.shards_run += 1
+        tweets = scraper.scrape_tweets(
+            max_tweets=self.max_tweets_per_shard,
+            scrape_query=shard_query.build(),
+            scrape_latest=True,
+            **self.scrape_options,
+        )
+        if scraper.last_error is not None:
+            # Ended early: keep what was collected, but the window is incomplete
+            self._fail(since, until, scraper.last_error)
+        return tweets
+
+    def _fail(self, since, until, error):
+        logger.warning(
+            "Shard %s -> %s failed and is incomplete: %s", since, until, error
+        )
+        with self._lock:
+            self.failed.append((since, until))
+
+    def _split(self, count, since, until):
+        """
+        Returns the two halves of a full shard, [] if the shard is not full,
+        or [] after recording it as truncated when halving it would go below
+        `min_window`.
+        """
+        if count < self.max_tweets_per_shard:
+            return []
+        if until - since < 2 * self.min_window:
+            logger.warning(
+                "Shard %s -> %s is full at the minimum window; "
+                "tweets beyond the first %s are missing.",
+                since,
+                until,
+                count,
+            )
+            with self._lock:
+                self.truncated.append((since, until))
+            return []
+        middle = since + (until - since) / 2
+        return [(since, middle), (middle, until)]
+
+    def _merge(self, tweets):
+        for tweet in tweets:
+            tweet_id = tweet.get("tweet_id")
+            if tweet_id and tweet_id in self.collected_ids:
+                continue
+            if tweet_id:
+                self.collected_ids.add(tweet_id)
+            self.data.append(tweet)
+
+    def _next_window(self, window, count):
+        target = self.max_tweets_per_shard / 2
+        scaled = window * (target / count) if count else window * 2
+        return min(max(scaled, self.min_window), self.max_window)
+
+    def run(self, scraper):
+        """
+        Scrape the shards one after another with one scraper, sizing each
+        window from the density of the previous one.
+
+        :return: Merged, deduplicated tweet dictionaries
+        """
+        since, window = self.since, self.initial_window
+        pending = []  # Halves of saturated shards, scraped before moving on
+        while pending or since < self.until:
+            if pending:
+                shard_since, shard_until = pending.pop()
+            else:
+                shard_since, shard_until = since, min(since + window, self.until)
+                since = shard_until
+
+            tweets = self._scrape(scraper, shard_since, shard_until)
+            halves = self._split(len(tweets), shard_since, shard_until)
+            if halves:
+                pending += reversed(halves)
+                window = halves[0][1] - halves[0][0]
+                logger.info("Shard is full; splitting it in half.")
+            else:
+                window = self._next_window(shard_until - shard_since, len(tweets))
+            # Keep a full shard's tweets too; its halves only add what it missed
+            self._merge(tweets)
+
+        self._log_summary()
+        return self.data
+
+    def run_parallel(self, balancer):
+        """
+        Scrape the shards concurrently through an AccountBalancer, in rounds:
+        the first round uses `initial_window` shards, and every full shard is
+        split in half for the next round.
+
+        :return: Merged, deduplicated tweet dictionaries
+        """
+        shards = []
+        since = self.since
+        while since < self.until:
+            shards.append((since, min(since + self.initial_window, self.until)))
+            since = shards[-1][1]
+
+        while shards:
+            results = balancer.run(
+                [
+                    lambda scraper, s=s, u=u: self._scrape(scraper, s, u)
+                    for s, u in shards
+                ]
+            )
+            next_round = []
+            for (s, u), tweets in zip(shards, results):
+                if tweets is None:
+                    # The balancer gave up on the job (see its log for why)
+                    self._fail(s, u, "no account could scrape it")
+                    continue
+                self._merge(tweets)
+                next_round += self._split(len(tweets), s, u)
+            if next_round:
+                logger.info("Splitting %s full shards.", len(next_round) // 2)
+            shards = next_round
+
+        self._log_summary()
+        return self.data
+
+    def _log_summary(self):
+        logger.info(
+            "Sharded search %s: %s unique tweets from %s shards "
+            "(%s failed, %s truncated).",
+            "incomplete" if self.failed or self.truncated else "complete",
+            len(self.data),
+            self.shards_run,
+            len(self.failed),
+            len(self.truncated),
+        )
+        if self.failed:
+            logger.warning(
+                "%s shards failed; rerun the search over these windows: %s",
+                len(self.failed),
+                ", ".join(f"{since} -> {until}" for since, until in self.failed),
+            )
+        if self.truncated:
+            logger.warning(
+                "%s shards were still full at the minimum window (%s) and are "
+                "incomplete; lower --min-window or raise --shard-size to cover them.",
+                len(self.truncated),
+                self.min_window,
+            )
@@ -0,0 +1,182 @@
+# src/reconciler.py
+import csv
+import hashlib
+import json
+import logging
+import os
+import random
+from time import sleep
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+from src.locators import SELECTORS
+from src.scroller import Scroller
+
+logger = logging.getLogger(__name__)
+
+# First-column names taken as a CSV header row (only in the first row)
+CSV_HEADERS = ("username", "handle", "screen_name")
+
+
+def load_follow_targets(target_file):
+    """
+    Load the desired follow set from a text file (one username per line,
+    '#' comments allowed) or from the first column of a CSV file, whose
+    first row may be a header.
+    """
+    with open(target_file, encoding="utf-8") as f:
+        if target_file.lower().endswith(".csv"):
+            names = [row[0] for row in csv.reader(f) if row]
+            if names and _normalize(names[0]) in CSV_HEADERS:
+                names = names[1:]
+        else:
+            names = [line.split("#", 1)[0] for line in f]
+
+    targets = {_normalize(name) for name in names if name.strip()}
+    logger.info("Loaded %s follow targets from %s.", len(targets), target_file)
+    return targets
+
+
+def _normalize(username):
+    return username.strip().lstrip("@").lower()
+
+
+def _targets_key(targets):
+    # Identifies a target list, so a checkpoint is not reused for another one
+    names = "\n".join(sorted(_normalize(name) for name in targets))
+    return hashlib.sha1(names.encode("utf-8")).hexdigest()
+
+
+class FollowReconciler:
+    """
+    Brings the logged-in account's following list in line with a target set.
+
+    The current following list is scraped once; only the difference is then
+    applied, one paced follow/unfollow per user. Finished operations are
+    checkpointed so an interrupted batch does not repeat them.
+    """
+
+    def __init__(
+        self,
+        user,
+        handle,
+        unfollow_extra=False,
+        pace=(2, 5),
+        max_changes=None,
+        state_file=None,
+    ):
+        """
+        :param user: TwitterUser bound to the logged-in driver
+        :param handle: The logged-in account's username
+        :param unfollow_extra: Also unfollow accounts that are not in the target set
+        :param pace: (min, max) seconds to wait between operations
+        :param max_changes: Cap on operations applied in one run
+        :param state_file: Optional JSON checkpoint of finished operations
+        """
+        self.user = user
+        self.driver = user.driver
+        self.scroller = Scroller(self.driver)
+        self.handle = handle.lstrip("@")
+        self.unfollow_extra = unfollow_extra
+        self.pace = pace
+        self.max_changes = max_changes
+        self.state_file = state_file
+        self.done = set()
+        self.targets_key = None  # Target list the checkpoint belongs to
+
+        if state_file and os.path.exists(state_file):
+            with open(state_file, encoding="utf-8") as f:
+                state = json.load(f)
+            self.done = set(state["done"])
+            self.targets_key = state.get("targets")
+
+    def scrape_following(self, max_idle_scrolls=3):
+        """
+        Scrape the usernames the account currently follows. Only the list in
+        the primary column is read, not the "Who to follow" suggestions.
+        """
+        self.driver.get(f"https://twitter.com/{self.handle}/following")
+        sleep(3)
+
+        following = set()
+        idle_scrolls = 0
+        while idle_scrolls < max_idle_scrolls:
+            count = len(following)
+            for cell in SELECTORS.find_all(self.driver, "user.cell"):
+                try:
+                    link = SELECTORS.find_all(cell, "user.cell_profile_link")
+                    if link:
+                        href = link[0].get_attribute("href") or ""
+                        following.add(_normalize(href.rstrip("/").split("/")[-1]))
+                except StaleElementReferenceException:
+                    continue
+
+            idle_scrolls = 0 if len(following) > count else idle_scrolls + 1
+            self.scroller.scroll_to_bottom()
+            sleep(2)
+
+        following.discard("")
+        logger.info("@%s currently follows %s accounts.", self.handle, len(following))
+        return following
+
+    def plan(self, targets, following):
+        """
+        Returns the (operation, username) pairs needed to turn `following`
+        into `targets`, skipping operations already checkpointed.
+        """
+        targets = {_normalize(name) for name in targets}
+        operations = [("follow", name) for name in sorted(targets - following)]
+        if self.unfollow_extra:
+            operations += [("unfollow", name) for name in sorted(following - targets)]
+        return [op for op in operations if f"{op[0]}:{op[1]}" not in self.done]
+
+    def reconcile(self, targets):
+        """
+        Scrape the following list once, then apply only the needed changes.
+
+        :return: {'follow': [...], 'unfollow': [...], 'failed': [...]}
+        """
+        key = _targets_key(targets)
+        if key != self.targets_key:
+            if self.done:
+                logger.info("Checkpoint is for another target list; starting over.")
+            self.done = set()
+            self.targets_key = key
+        elif self.done:
+            logger.info("Resuming reconcile: %s operations done.", len(self.done))
+
+        operations = self.plan(targets, self.scrape_following())
+        if self.max_changes is not None:
+            operations = operations[: self.max_changes]
+        logger.info("Reconcile plan: %s operations.", len(operations))
+
+        report = {"follow": [], "unfollow": [], "failed": []}
+        for i, (operation, username) in enumerate(operations):
+            if i:
+                sleep(random.uniform(*self.pace))
+
+            if operation == "follow":
+                ok = self.user.follow_user(username)
+            else:
+                ok = self.user.unfollow_user(username)
+
+            if ok:
+                report[operation].append(username)
+                self.done.add(f"{operation}:{username}")
+                self._save_state()
+            else:
+                report["failed"].append(username)
+
+        logger.info(
+            "Reconcile complete: %s followed, %s unfollowed, %s failed.",
+            len(report["follow"]),
+            len(report["unfollow"]),
+            len(report["failed"]),
+        )
+        return report
+
+    def _save_state(self):
+        if not self.state_file:
+            return
+        with open(self.state_file, "w", encoding="utf-8") as f:
+            json.dump({"targets": self.targets_key, "done": sorted(self.done)}, f)
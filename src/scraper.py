@@ -1,77 +1,192 @@
 # src/scraper.py
+import json
 import logging
+import os
 import sys
 from time import sleep
+from urllib.parse import quote
 
-from selenium import webdriver
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import (
     NoSuchElementException,
     StaleElementReferenceException,
     WebDriverException,
 )
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.common.action_chains import ActionChains
 
+from src.drivers import DEFAULT_PROFILE, create_driver
+from src.locators import SELECTORS
+from src.query import SearchQuery
 from src.scroller import Scroller
+from src.supervisor import SESSION_ERRORS
 from src.tweet import Tweet
 from src import utils
 
+logger = logging.getLogger(__name__)
+
 TWITTER_LOGIN_URL = "https://twitter.com/i/flow/login"
 
+# Swaps processed tweet cards for empty placeholders of the same height, so the
+# scroll position and the timeline's layout stay put while the cards' subtrees
+# leave the document. React still owns the cards and may later move or remove
+# them: the parent's child-list methods are redirected to the placeholder, so
+# those updates land on it instead of failing. Cards React doesn't own (plain
+# DOM timelines) are emptied as well, since Selenium keeps a reference to them.
+PRUNE_CARDS_SCRIPT = """
+const placeholders = window.__staPlaceholders || (window.__staPlaceholders = new WeakMap());
+const swap = (node) => (node && placeholders.get(node)) || node;
+const dom = Node.prototype;
+for (const card of arguments[0]) {
+    const parent = card.parentNode;
+    if (!parent || placeholders.has(card)) continue;
+    if (!parent.__staRedirected) {
+        parent.__staRedirected = true;
+        parent.appendChild = (node) => (dom.appendChild.call(parent, swap(node)), node);
+        parent.insertBefore = (node, ref) => (dom.insertBefore.call(parent, swap(node), swap(ref)), node);
+        parent.removeChild = (child) => {
+            dom.removeChild.call(parent, swap(child));
+            placeholders.delete(child);
+            return child;
+        };
+        parent.replaceChild = (node, old) => {
+            dom.replaceChild.call(parent, swap(node), swap(old));
+            placeholders.delete(old);
+            return old;
+        };
+    }
+    const placeholder = document.createElement('div');
+    placeholder.style.height = card.offsetHeight + 'px';
+    placeholder.setAttribute('data-sta-pruned', '1');
+    placeholders.set(card, placeholder);
+    card.replaceWith(placeholder);
+    if (!Object.keys(card).some((key) => key.startsWith('__react'))) card.replaceChildren();
+}
+"""
+
+# Queues tweet cards as the timeline inserts them; arguments[0] is the card selector.
+# The queue is seeded with the cards already on the page.
+INSTALL_CARD_OBSERVER_SCRIPT = """
+const selector = arguments[0];
+window.__staQueue = Array.from(document.querySelectorAll(selector));
+if (window.__staObserver) window.__staObserver.disconnect();
+window.__staObserver = new MutationObserver((mutations) => {
+    for (const mutation of mutations) {
+        for (const node of mutation.addedNodes) {
+            if (node.nodeType !== Node.ELEMENT_NODE) continue;
+            if (node.matches(selector)) window.__staQueue.push(node);
+            else window.__staQueue.push(...node.querySelectorAll(selector));
+        }
+    }
+});
+window.__staObserver.observe(document.body, {childList: true, subtree: true});
+"""
+
+# Returns and clears the queued cards still attached to the page, or null if the
+# observer is gone (e.g. after a navigation).
+DRAIN_CARD_QUEUE_SCRIPT = """
+if (!window.__staObserver) return null;
+const cards = window.__staQueue.filter((card) => card.isConnected);
+window.__staQueue = [];
+return cards;
+"""
+
 
 class TwitterScraper:
     """
     Main class for logging into Twitter and (optionally) scraping tweets.
     """
 
-    def __init__(self, email=None, password=None, max_tweets=50, headless=False):
-        logging.info("Initializing TwitterScraper...")
+    def __init__(
+        self,
+        email=None,
+        password=None,
+        max_tweets=50,
+        headless=None,
+        profile=None,
+        exit_on_failure=True,
+    ):
+        """
+        :param headless: Override the run profile's headless setting
+        :param profile: Run profile name (see src/drivers.py); headless
+            Firefox if None
+        :param exit_on_failure: Exit the process if the browser cannot be
+            started (CLI behaviour); otherwise raise
+        """
+        logger.info("Initializing TwitterScraper...")
         self.email = email
         self.password = password
         self.max_tweets = max_tweets
         self.interrupted = False
+        self.challenged = False  # Set when the login flow asked for extra confirmation
+        self.headless = headless
+        self.profile = profile or DEFAULT_PROFILE
         self.tweet_ids = set()
+        self.collected_ids = set()  # tweet_id of every tweet in self.data
         self.data = []  # Store scraped tweet dictionaries
+        self.last_error = None  # Exception that ended the last scrape, if any
+        self.prune_dom = False
+        self.delta_only = False
+        self.index = None
 
         # Initialize driver
-        self.driver = self._get_driver(headless)
+        self.driver = self._get_driver(headless, exit_on_failure)
         self.actions = ActionChains(self.driver)
         self.scroller = Scroller(self.driver)
 
-    def _get_driver(self, headless=False):
-        """
-        Set up and return the Selenium WebDriver (Firefox) using Selenium 4 syntax.
+    def _get_driver(self, headless=None, exit_on_failure=True):
         """
-        logging.info("Setting up WebDriver with Firefox...")
-        options = FirefoxOptions()
-
-        if headless:
-            options.add_argument("--headless")
-
-        # Import the Service class here
-        from selenium.webdriver.firefox.service import Service
-
-        # Provide the path to your geckodriver.exe
-        service = Service("webdriver/geckodriver.exe")
+        Set up and return the Selenium WebDriver for `self.profile`.
 
+        :param headless: Override the run profile's headless setting
+        :param exit_on_failure: Exit the process on failure; otherwise re-raise
+        """
         try:
-            # Note: 'executable_path' is deprecated; use the Service object instead.
-            driver = webdriver.Firefox(service=service, options=options)
-            logging.info("WebDriver Setup Complete.")
+            driver = create_driver(self.profile, headless=headless)
+            logger.info("WebDriver Setup Complete.")
             return driver
-        except WebDriverException as e:
-            logging.error(f"Error setting up WebDriver: {e}", exc_info=True)
-            sys.exit(1)
+        except (WebDriverException, ValueError, OSError) as e:
+            # ValueError: unknown profile or invalid drivers.json
+            logger.error("Error setting up WebDriver: %s", e, exc_info=True)
+            if exit_on_failure:
+                sys.exit(1)
+            raise
+
+    def is_alive(self):
+        """
+        Returns False if the browser crashed or the WebDriver session is gone.
+        """
+        try:
+            self.driver.window_handles
+            return True
+        except SESSION_ERRORS:
+            return False
+
+    def restart_driver(self):
+        """
+        Replace the current driver with a fresh one. The caller is responsible
+        for restoring the login afterwards.
+        """
+        logger.info("Restarting WebDriver...")
+        try:
+            self.driver.quit()
+        except SESSION_ERRORS:
+            pass  # Already dead
+        self.driver = self._get_driver(self.headless, exit_on_failure=False)
+        self.actions = ActionChains(self.driver)
+        self.scroller = Scroller(self.driver)
 
-    def login(self):
+    def login(self, exit_on_failure=True):
         """
         Log into Twitter using the provided email & password.
+
+        :param exit_on_failure: Exit the process on failure (CLI behaviour);
+            otherwise re-raise so callers such as the account balancer can
+            mark the account unhealthy and carry on.
         """
         if not self.email or not self.password:
             raise ValueError("Email and password must be provided for login.")
 
-        logging.info("Logging into Twitter...")
+        logger.info("Logging into Twitter...")
         try:
             self.driver.maximize_window()
             self.driver.get(TWITTER_LOGIN_URL)
@@ -93,24 +208,58 @@ class TwitterScraper:
             if not auth_token:
                 raise ValueError("Login failed: Could not find auth_token cookie.")
 
-            logging.info("Login successful.")
+            logger.info("Login successful.")
 
         except Exception as e:
-            logging.error(f"Login Failed: {e}", exc_info=True)
-            sys.exit(1)
+            logger.error("Login Failed: %s", e, exc_info=True)
+            if exit_on_failure:
+                sys.exit(1)
+            raise
+
+    def save_cookies(self, cookie_file):
+        """
+        Save the session's cookie jar so the next run can skip the login flow.
+        """
+        with open(cookie_file, "w", encoding="utf-8") as f:
+            json.dump(self.driver.get_cookies(), f)
+        logger.info("Cookies saved to %s.", cookie_file)
+
+    def load_cookies(self, cookie_file):
+        """
+        Restore a cookie jar saved by `save_cookies`.
+
+        :return: True if the restored jar contains an auth_token cookie
+        """
+        if not os.path.exists(cookie_file):
+            return False
+
+        with open(cookie_file, encoding="utf-8") as f:
+            cookies = json.load(f)
+
+        # Cookies can only be added for the domain currently loaded
+        self.driver.get("https://twitter.com")
+        for cookie in cookies:
+            cookie.pop("sameSite", None)
+            try:
+                self.driver.add_cookie(cookie)
+            except WebDriverException:
+                logger.warning("Could not restore cookie %s.", cookie.get("name"))
+
+        restored = any(cookie["name"] == "auth_token" for cookie in cookies)
+        if restored:
+            logger.info("Session restored from %s.", cookie_file)
+        return restored
 
     def _input_username(self):
         for attempt in range(3):
             try:
-                username_field = self.driver.find_element(
-                    "xpath", "//input[@autocomplete='username']"
-                )
+                username_field = SELECTORS.find(self.driver, "login.username")
                 username_field.send_keys(self.email)
                 username_field.send_keys(Keys.RETURN)
                 sleep(3)
                 return
             except NoSuchElementException:
-                logging.warning(f"Failed to find username field, attempt {attempt+1}")
+                logger.warning("Failed to find username field, attempt %s", attempt + 1)
                 sleep(2)
         raise NoSuchElementException("Failed to input username after 3 attempts.")
 
@@ -119,11 +268,13 @@ class TwitterScraper:
         Handle second prompt if Twitter demands additional confirmation.
         """
         try:
-            unusual_activity_field = self.driver.find_element(
-                "xpath", "//input[@data-testid='ocfEnterTextTextInput']"
+            unusual_activity_field = SELECTORS.find(
+                self.driver, "login.unusual_activity"
             )
             unusual_activity_field.send_keys(self.email)
             unusual_activity_field.send_keys(Keys.RETURN)
+            self.challenged = True
+            logger.warning("Twitter asked to confirm unusual login activity.")
             sleep(3)
         except NoSuchElementException:
             pass  # No prompt
@@ -131,15 +282,13 @@ class TwitterScraper:
     def _input_password(self):
         for attempt in range(3):
             try:
-                password_field = self.driver.find_element(
-                    "xpath", "//input[@autocomplete='current-password']"
-                )
+                password_field = SELECTORS.find(self.driver, "login.password")
                 password_field.send_keys(self.password)
                 password_field.send_keys(Keys.RETURN)
                 sleep(3)
                 return
             except NoSuchElementException:
-                logging.warning(f"Password field not found, attempt {attempt+1}")
+                logger.warning("Password field not found, attempt %s", attempt + 1)
                 sleep(2)
         raise NoSuchElementException("Failed to input password after 3 attempts.")
 
@@ -153,13 +302,75 @@ class TwitterScraper:
         scrape_top=False,
         scrape_poster_details=False,
         no_tweets_limit=False,
+        resume=False,
+        prune_dom=False,
+        delta_only=False,
+        index=None,
+    ):
+        """
+        Scrape tweets (see `iter_tweets` for the options) and return them
+        all once the scrape ends.
+        """
+        for _ in self.iter_tweets(
+            max_tweets=max_tweets,
+            scrape_username=scrape_username,
+            scrape_hashtag=scrape_hashtag,
+            scrape_query=scrape_query,
+            scrape_latest=scrape_latest,
+            scrape_top=scrape_top,
+            scrape_poster_details=scrape_poster_details,
+            no_tweets_limit=no_tweets_limit,
+            resume=resume,
+            prune_dom=prune_dom,
+            delta_only=delta_only,
+            index=index,
+        ):
+            pass
+        return self.data
+
+    def iter_tweets(
+        self,
+        max_tweets=50,
+        scrape_username=None,
+        scrape_hashtag=None,
+        scrape_query=None,
+        scrape_latest=True,
+        scrape_top=False,
+        scrape_poster_details=False,
+        no_tweets_limit=False,
+        resume=False,
+        prune_dom=False,
+        delta_only=False,
+        index=None,
     ):
         """
         General scraping logic for home, profile, hashtag, or search query.
+
+        Yields each tweet dictionary as soon as it is extracted (it is also
+        appended to `self.data`). The browser only moves on when the next
+        tweet is requested, so a slow consumer holds the scrape back instead
+        of tweets piling up; stopping the iteration (break, or `close()`)
+        ends the scrape and commits the index.
+
+        :param resume: Keep the tweets collected so far (e.g. after a driver
+            restart) and skip them when they show up again
+        :param prune_dom: Replace tweet cards with empty placeholders once
+            they are extracted, so long scrapes keep a flat per-iteration
+            cost, node count and memory
+        :param delta_only: Have the page queue newly inserted tweet cards
+            (MutationObserver) and fetch only that batch each iteration
+        :param index: TweetIndex that every tweet is added to as it is collected
         """
         self.max_tweets = max_tweets
-        self.data = []
+        self.prune_dom = prune_dom
+        self.delta_only = delta_only
+        self.index = index
         self.tweet_ids = set()
+        self.last_error = None
+        self.scroller.scrolling = True
+        if not resume:
+            self.data = []
+            self.collected_ids = set()
 
         # Navigate
         if scrape_username:
@@ -171,42 +382,81 @@ class TwitterScraper:
         else:
             self._go_to_home()
 
-        logging.info("Starting tweet scraping...")
+        logger.info("Starting tweet scraping...")
 
         # Try to dismiss cookies
         self._dismiss_cookies_banner()
 
+        if delta_only:
+            self._install_card_observer()
+
         # Main scraping loop
-        while self.scroller.scrolling:
-            try:
-                self._collect_tweets(scrape_poster_details, no_tweets_limit)
-                # If we reached our max, or no_tweets_limit is True, stop
-                if len(self.data) >= max_tweets and not no_tweets_limit:
+        try:
+            while self.scroller.scrolling:
+                try:
+                    yield from self._collect_tweets(
+                        scrape_poster_details, no_tweets_limit
+                    )
+                    # If we reached our max, or no_tweets_limit is True, stop
+                    if len(self.data) >= max_tweets and not no_tweets_limit:
+                        break
+                except KeyboardInterrupt:
+                    logger.info("Scraping interrupted by user.")
+                    self.interrupted = True
                     break
-            except KeyboardInterrupt:
-                logging.info("Scraping interrupted by user.")
-                self.interrupted = True
-                break
-            except Exception as e:
-                logging.error(f"Error while scraping: {e}", exc_info=True)
-                break
-
-        logging.info(f"Scraping complete. Collected {len(self.data)} tweets.")
-        return self.data
+                except Exception as e:
+                    logger.error("Error while scraping: %s", e, exc_info=True)
+                    self.last_error = e
+                    break
+        finally:
+            # Also reached when the consumer stops early (GeneratorExit)
+            self.scroller.scrolling = False
+            if self.index is not None:
+                self.index.commit()
+            logger.info("Scraping complete. Collected %s tweets.", len(self.data))
+            SELECTORS.log_stats()
+
+    def aiter_tweets(self, max_pending=100, **kwargs):
+        """
+        `iter_tweets` as an async iterator: the browser runs in a background
+        thread and at most `max_pending` tweets wait for the consumer.
+
+        async with scraper.aiter_tweets(scrape_query="python") as tweets:
+            async for tweet in tweets:
+                ...
+        """
+        from src.stream import AsyncTweetStream
+
+        return AsyncTweetStream(self.iter_tweets(**kwargs), max_pending)
 
     def _collect_tweets(self, scrape_poster_details, no_tweets_limit):
-        tweet_cards = self.driver.find_elements(
-            "xpath", '//article[@data-testid="tweet" and not(@disabled)]'
-        )
+        """
+        One collection pass: extract the unprocessed tweet cards, yielding
+        each new tweet, then scroll to load more.
+        """
+        if self.delta_only:
+            tweet_cards = self._drain_new_cards()
+        elif self.prune_dom:
+            # Pruned cards are excluded, so only unprocessed cards come back
+            tweet_cards = SELECTORS.find_all(
+                self.driver, "timeline.unpruned_tweet_card"
+            )
+        else:
+            tweet_cards = SELECTORS.find_all(self.driver, "timeline.tweet_card")
         if not tweet_cards:
+            if self.delta_only:
+                # Nothing new was rendered; scroll to load the next batch
+                self.scroller.scroll_to_bottom()
             sleep(1)
             return
 
+        processed = []
         for card in tweet_cards:
             try:
                 card_id = str(card.id)  # or str(card._id) in older Selenium
                 if card_id not in self.tweet_ids:
                     self.tweet_ids.add(card_id)
+                    processed.append(card)
                     # Scroll into view for stability
                     self.driver.execute_script("arguments[0].scrollIntoView();", card)
 
@@ -217,22 +467,68 @@ class TwitterScraper:
                         scrape_poster_details=scrape_poster_details,
                     )
                     if tweet_obj and not tweet_obj.error and not tweet_obj.is_ad:
-                        self.data.append(tweet_obj.to_dict())
+                        if tweet_obj.tweet_id in self.collected_ids:
+                            continue  # Already collected before a restart
+                        if tweet_obj.tweet_id:
+                            self.collected_ids.add(tweet_obj.tweet_id)
+                        tweet = tweet_obj.to_dict()
+                        self.data.append(tweet)
+                        if self.index is not None:
+                            self.index.add(tweet)
+                        yield tweet
                         if len(self.data) >= self.max_tweets and not no_tweets_limit:
                             self.scroller.scrolling = False
                             break
             except StaleElementReferenceException:
                 continue
 
+        if self.prune_dom and processed:
+            self._prune_cards(processed)
+        logger.debug(
+            "Processed %d new cards of %d; %d tweets collected.",
+            len(processed),
+            len(tweet_cards),
+            len(self.data),
+        )
+
         # Scroll to load more
         self.scroller.scroll_to_bottom()
         sleep(2)
 
+    def _install_card_observer(self):
+        self.driver.execute_script(
+            INSTALL_CARD_OBSERVER_SCRIPT, SELECTORS.css("timeline.tweet_card")
+        )
+
+    def _drain_new_cards(self):
+        """
+        Returns the tweet cards inserted since the last call, in one round trip.
+        """
+        cards = self.driver.execute_script(DRAIN_CARD_QUEUE_SCRIPT)
+        if cards is None:
+            logger.info("Card observer missing; reinstalling it.")
+            self._install_card_observer()
+            cards = self.driver.execute_script(DRAIN_CARD_QUEUE_SCRIPT)
+        return cards or []
+
+    def _prune_cards(self, cards):
+        """
+        Take already-extracted tweet cards out of the document (see
+        PRUNE_CARDS_SCRIPT), so node count and browser memory stay flat.
+        """
+        try:
+            self.driver.execute_script(PRUNE_CARDS_SCRIPT, cards)
+        except StaleElementReferenceException:
+            # The timeline already recycled some of them; prune the rest one by one
+            for card in cards:
+                try:
+                    self.driver.execute_script(PRUNE_CARDS_SCRIPT, [card])
+                except StaleElementReferenceException:
+                    continue
+
     def _dismiss_cookies_banner(self):
         try:
-            cookies_btn = self.driver.find_element(
-                "xpath", "//span[text()='Refuse non-essential cookies']/../../.."
-            )
+            cookies_btn = SELECTORS.find(self.driver, "page.cookie_refuse")
             cookies_btn.click()
         except NoSuchElementException:
             pass
@@ -248,27 +544,18 @@ class TwitterScraper:
 
     def _go_to_hashtag(self, hashtag, scrape_latest, scrape_top):
         hashtag = hashtag.lstrip("#")
-        url = f"https://twitter.com/hashtag/{hashtag}?src=hashtag_click"
+        url = f"https://twitter.com/hashtag/{quote(hashtag)}?src=hashtag_click"
         if scrape_latest:
             url += "&f=live"
         self.driver.get(url)
         sleep(2)
 
     def _go_to_search(self, query, scrape_latest, scrape_top):
-        url = f"https://twitter.com/search?q={query}&src=typed_query"
-        if scrape_latest:
-            url += "&f=live"
-        self.driver.get(url)
+        self.driver.get(SearchQuery(query).url(latest=scrape_latest))
         sleep(2)
 
     def save_data(self, output_file="tweets.csv"):
         """
         Save the scraped data to CSV or JSON.
         """
-        if output_file.lower().endswith(".csv"):
-            utils.save_to_csv(self.data, output_file=output_file)
-        elif output_file.lower().endswith(".json"):
-            utils.save_to_json(self.data, output_file=output_file)
-        else:
-            logging.warning("Unrecognized file extension, defaulting to .csv")
-            utils.save_to_csv(self.data, output_file=output_file)
+        utils.save_data(self.data, output_file=output_file)
@@ -1,8 +1,8 @@
 # src/scroller.py
 import logging
 
-# Set up logging configuration
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
+# Called on every scroll: log at DEBUG with lazy arguments
+logger = logging.getLogger(__name__)
 
 
 class Scroller:
@@ -33,21 +33,21 @@ class Scroller:
         self.current_position = 0
         self.last_position = self.get_current_scroll_position()
         self.scroll_count = 0
-        logging.info("Scroller reset.")
+        logger.debug("Scroller reset.")
 
     def scroll_to_top(self) -> None:
         """
         Scrolls the page to the top.
         """
         self.driver.execute_script("window.scrollTo(0, 0);")
-        logging.info("Scrolled to top.")
+        logger.debug("Scrolled to top.")
 
     def scroll_to_bottom(self) -> None:
         """
         Scrolls the page to the bottom.
         """
         self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        logging.info("Scrolled to bottom.")
+        logger.debug("Scrolled to bottom.")
 
     def update_scroll_position(self) -> None:
         """
@@ -57,6 +57,8 @@ class Scroller:
         if new_position != self.current_position:
             self.current_position = new_position
             self.scroll_count += 1
-            logging.info(
-                f"Scroll position updated: {self.current_position} (Scroll count: {self.scroll_count})"
+            logger.debug(
+                "Scroll position updated: %d (Scroll count: %d)",
+                self.current_position,
+                self.scroll_count,
             )
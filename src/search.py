@@ -2,16 +2,21 @@
 import logging
 from src.scraper import TwitterScraper
 
+logger = logging.getLogger(__name__)
 
-def search_for_term(scraper: TwitterScraper, term: str):
+
+def search_for_term(scraper: TwitterScraper, term: str, **scrape_options):
     """
     Uses the existing `scraper` to search for a term or hashtag,
-    scraping some tweets in the process.
+    scraping some tweets in the process. Extra keyword arguments are passed
+    on to `scrape_tweets` (e.g. max_tweets, prune_dom).
+
+    :return: The scraped tweet dictionaries
     """
-    logging.info(f"Performing search for term: {term}")
-    if term.startswith("#"):
+    logger.info("Performing search for term: %s", term)
+    if term.startswith("#") and " " not in term.strip():
         # hashtag
-        scraper.scrape_tweets(scrape_hashtag=term)
+        return scraper.scrape_tweets(scrape_hashtag=term, **scrape_options)
     else:
         # general query
-        scraper.scrape_tweets(scrape_query=term)
+        return scraper.scrape_tweets(scrape_query=term, **scrape_options)
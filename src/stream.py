@@ -0,0 +1,96 @@
+# src/stream.py
+import asyncio
+import threading
+
+_DONE = object()
+
+
+class AsyncTweetStream:
+    """
+    Async iterator over a blocking tweet generator (e.g.
+    `TwitterScraper.iter_tweets`).
+
+    The generator runs in a background thread, so the event loop keeps
+    serving other tasks while the browser works. Tweets are passed through
+    a bounded asyncio.Queue: once `max_pending` tweets are waiting, the
+    thread blocks until the consumer takes one. `aclose()` (or leaving an
+    `async with` block) stops the scrape after the tweet in progress and
+    waits for the generator to finish its cleanup. Exceptions raised by
+    the generator are re-raised in the consumer.
+    """
+
+    def __init__(self, tweets, max_pending=100):
+        """
+        :param tweets: Generator of tweet dictionaries
+        :param max_pending: Tweets that may wait for the consumer
+        """
+        self.tweets = tweets
+        self.max_pending = max(max_pending, 1)
+        self._stop = threading.Event()
+        self._error = None
+        self._loop = None
+        self._queue = None
+        self._thread = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._thread is None:
+            self._start()
+        if self._stop.is_set() and self._queue.empty():
+            raise StopAsyncIteration
+        tweet = await self._queue.get()
+        if tweet is _DONE:
+            self._stop.set()
+            if self._error is not None:
+                raise self._error
+            raise StopAsyncIteration
+        return tweet
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    def _start(self):
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(self.max_pending)
+        self._thread = threading.Thread(
+            target=self._produce, name="tweet-stream", daemon=True
+        )
+        self._thread.start()
+
+    def _put(self, item):
+        # Blocks while the queue is full (backpressure)
+        asyncio.run_coroutine_threadsafe(self._queue.put(item), self._loop).result()
+
+    def _produce(self):
+        try:
+            for tweet in self.tweets:
+                if self._stop.is_set():
+                    break
+                self._put(tweet)
+                if self._stop.is_set():
+                    break
+        except BaseException as e:
+            self._error = e
+        finally:
+            # Runs the generator's cleanup in this thread, where the driver is used
+            self.tweets.close()
+            if not self._stop.is_set():
+                self._put(_DONE)
+
+    async def aclose(self):
+        """
+        Stop the scrape and wait for the background thread to finish.
+        """
+        self._stop.set()
+        if self._thread is None:
+            self.tweets.close()
+            return
+        # Free the queue so a blocked put returns and the thread sees the flag
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        await self._loop.run_in_executor(None, self._thread.join)
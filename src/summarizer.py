@@ -1,6 +1,8 @@
 # src/summarizer.py
 import logging
 
+logger = logging.getLogger(__name__)
+
 
 def summarize_scraped_data(tweet_dicts):
     """
@@ -8,15 +10,15 @@ def summarize_scraped_data(tweet_dicts):
     Expects a list of tweet dictionaries (with 'content' key).
     """
     if not tweet_dicts:
-        logging.info("No tweets to summarize.")
+        logger.info("No tweets to summarize.")
         return
 
     # Naive approach: just combine contents & truncate for "summary"
     combined_text = " ".join(t.get("content", "") for t in tweet_dicts)
     summary = combined_text[:200] + "..." if len(combined_text) > 200 else combined_text
 
-    logging.info("----- TWEET SUMMARY START -----")
-    logging.info(summary)
-    logging.info("----- TWEET SUMMARY END -----")
+    logger.info("----- TWEET SUMMARY START -----")
+    logger.info(summary)
+    logger.info("----- TWEET SUMMARY END -----")
 
     return summary
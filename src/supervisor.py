@@ -0,0 +1,139 @@
+# src/supervisor.py
+import logging
+from time import sleep
+
+from selenium.common.exceptions import WebDriverException
+from urllib3.exceptions import HTTPError
+
+logger = logging.getLogger(__name__)
+
+# What a lost session looks like: WebDriver errors from the browser, and HTTP
+# or connection errors (e.g. urllib3's MaxRetryError) when the driver process
+# itself (geckodriver, chromedriver) is gone.
+SESSION_ERRORS = (WebDriverException, HTTPError, ConnectionError)
+
+
+class SessionLostError(RuntimeError):
+    """
+    Raised when the driver died and the restart budget is used up.
+    """
+
+
+class DriverSupervisor:
+    """
+    Wraps a TwitterScraper and recovers from browser crashes and dead sessions.
+
+    When the driver dies, the supervisor restarts it, restores the login
+    (from the cookie jar when available), and repeats the interrupted work;
+    `scrape_tweets` resumes from the tweets already collected. Restarts are
+    limited to `max_restarts` with exponential backoff between attempts.
+
+    Every other attribute is read from the wrapped scraper, so a supervisor
+    can be passed anywhere a scraper is expected.
+    """
+
+    def __init__(
+        self, scraper, max_restarts=3, backoff=5, max_backoff=120, cookie_file=None
+    ):
+        """
+        :param scraper: TwitterScraper to supervise
+        :param max_restarts: Driver restarts allowed over the supervisor's lifetime
+        :param backoff: Seconds to wait before the first restart; doubled each time
+        :param max_backoff: Upper bound for the wait between restarts
+        :param cookie_file: Cookie jar used to restore the login without the
+            login flow, if it exists
+        """
+        self.scraper = scraper
+        self.max_restarts = max_restarts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.cookie_file = cookie_file
+        self.restarts = 0
+
+    def __getattr__(self, name):
+        return getattr(self.scraper, name)
+
+    def recover(self):
+        """
+        Restart the driver and restore the login, retrying within the budget.
+
+        :raises SessionLostError: if the restart budget is exhausted
+        """
+        while True:
+            if self.restarts >= self.max_restarts:
+                raise SessionLostError(
+                    f"WebDriver session lost after {self.restarts} restarts."
+                )
+            delay = min(self.backoff * 2**self.restarts, self.max_backoff)
+            self.restarts += 1
+            logger.warning(
+                "WebDriver session lost; restart %s/%s in %ss.",
+                self.restarts,
+                self.max_restarts,
+                delay,
+            )
+            sleep(delay)
+
+            try:
+                self.scraper.restart_driver()
+                if not (
+                    self.cookie_file and self.scraper.load_cookies(self.cookie_file)
+                ):
+                    self.scraper.login(exit_on_failure=False)
+                logger.info("WebDriver session recovered.")
+                return
+            except Exception as e:
+                logger.error("Restart %s failed: %s", self.restarts, e, exc_info=True)
+
+    def scrape_tweets(self, **kwargs):
+        """
+        `TwitterScraper.scrape_tweets`, resumed after each driver restart
+        until the target is met, the user interrupts, or a non-crash error
+        ends the scrape.
+        """
+        for _ in self.iter_tweets(**kwargs):
+            pass
+        return self.scraper.data
+
+    def iter_tweets(self, **kwargs):
+        """
+        `TwitterScraper.iter_tweets`, resumed like `scrape_tweets`; tweets
+        already yielded before a restart are not yielded again.
+        """
+        resume = kwargs.pop("resume", False)
+        while True:
+            try:
+                yield from self.scraper.iter_tweets(resume=resume, **kwargs)
+            except SESSION_ERRORS:
+                # Raised outside the scrape loop, e.g. while navigating
+                if self.scraper.is_alive():
+                    raise
+            else:
+                if self.scraper.last_error is None or self.scraper.interrupted:
+                    return
+                if self.scraper.is_alive():
+                    return  # An ordinary error, not a dead session
+            self.recover()
+            logger.info("Resuming scrape after %s tweets...", len(self.scraper.data))
+            resume = True
+
+    def aiter_tweets(self, max_pending=100, **kwargs):
+        """
+        `iter_tweets` as an async iterator (see `TwitterScraper.aiter_tweets`).
+        """
+        from src.stream import AsyncTweetStream
+
+        return AsyncTweetStream(self.iter_tweets(**kwargs), max_pending)
+
+    def run(self, job):
+        """
+        Run `job(self)`, restarting the driver and re-running the job if it
+        fails because the session died.
+        """
+        while True:
+            try:
+                return job(self)
+            except SESSION_ERRORS:
+                if self.scraper.is_alive():
+                    raise
+                self.recover()
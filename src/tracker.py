@@ -0,0 +1,198 @@
+# src/tracker.py
+import csv
+import heapq
+import json
+import logging
+import os
+import time
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+from src.conversation import TWITTER_STATUS_URL, is_status_card
+from src.locators import SELECTORS
+from src.tweet import Tweet
+from src.utils import parse_count, parse_timestamp
+
+logger = logging.getLogger(__name__)
+
+STORE_FIELDS = ["tweet_id", "timestamp", "replies", "retweets", "likes", "views"]
+
+
+def load_series(store_file, tweet_id=None):
+    """
+    Read the time-series store; optionally only the rows of `tweet_id`.
+    """
+    with open(store_file, encoding="utf-8", newline="") as f:
+        rows = []
+        for row in csv.DictReader(f):
+            if tweet_id is None or row["tweet_id"] == tweet_id:
+                rows.append(
+                    {k: row[k] if k == "tweet_id" else int(row[k]) for k in row}
+                )
+        return rows
+
+
+class EngagementTracker:
+    """
+    Re-polls known tweets on a priority schedule and records their counts.
+
+    The polling interval grows with a tweet's age (`age * age_ratio`, clamped
+    to [min_interval, max_interval]), so fresh tweets are sampled often and
+    older ones rarely; tweets older than `max_age` are retired. Each cycle
+    visits at most `batch_size` status pages, which keeps the cost bounded
+    however many tweets are tracked. Counts are appended as one CSV row per
+    sample to `store_file`; the schedule lives next to it.
+    """
+
+    def __init__(
+        self,
+        scraper,
+        store_file="engagement.csv",
+        batch_size=20,
+        min_interval=300,
+        max_interval=86400,
+        age_ratio=0.1,
+        max_age=7 * 86400,
+    ):
+        """
+        :param scraper: Logged-in TwitterScraper
+        :param store_file: Append-only CSV of (tweet_id, timestamp, counts...)
+        :param batch_size: Status pages visited per polling cycle
+        :param min_interval: Shortest time between two polls of a tweet (s)
+        :param max_interval: Longest time between two polls of a tweet (s)
+        :param age_ratio: Interval as a fraction of the tweet's age
+        :param max_age: Stop tracking tweets older than this (s)
+        """
+        self.scraper = scraper
+        self.store_file = store_file
+        self.schedule_file = f"{store_file}.schedule.json"
+        self.batch_size = batch_size
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.age_ratio = age_ratio
+        self.max_age = max_age
+
+        self.posted = {}  # tweet_id -> posting timestamp
+        self.queue = []  # heap of (next_due, tweet_id)
+
+        if os.path.exists(self.schedule_file):
+            with open(self.schedule_file, encoding="utf-8") as f:
+                schedule = json.load(f)
+            self.posted = schedule["posted"]
+            self.queue = [tuple(item) for item in schedule["queue"]]
+            heapq.heapify(self.queue)
+            logger.info("Loaded schedule of %s tracked tweets.", len(self.posted))
+
+    def interval(self, tweet_id, now):
+        age = now - self.posted[tweet_id]
+        return min(max(age * self.age_ratio, self.min_interval), self.max_interval)
+
+    def track(self, tweets, now=None):
+        """
+        Start tracking `tweets` (scraped or exported dictionaries); they are
+        due for a first poll right away. Already tracked tweets are ignored.
+        """
+        now = now or time.time()
+        added = 0
+        for tweet in tweets:
+            tweet_id = tweet.get("tweet_id")
+            if not tweet_id or tweet_id in self.posted:
+                continue
+            self.posted[tweet_id] = parse_timestamp(tweet.get("date_time")) or now
+            heapq.heappush(self.queue, (now, tweet_id))
+            added += 1
+        logger.info("Tracking %s new tweets (%s total).", added, len(self.posted))
+        self._save_schedule()
+
+    def poll_due(self, now=None):
+        """
+        Poll up to `batch_size` tweets whose next poll is due.
+
+        :return: The samples appended to the store
+        """
+        now = now or time.time()
+        samples = []
+        while self.queue and self.queue[0][0] <= now and len(samples) < self.batch_size:
+            _, tweet_id = heapq.heappop(self.queue)
+            if now - self.posted[tweet_id] > self.max_age:
+                del self.posted[tweet_id]
+                continue
+
+            sample = self._sample(tweet_id)
+            if sample:
+                samples.append(sample)
+            heapq.heappush(self.queue, (now + self.interval(tweet_id, now), tweet_id))
+
+        self._append_samples(samples)
+        self._save_schedule()
+        logger.info(
+            "Polled %s tweets; %s tracked, next due in %.0fs.",
+            len(samples),
+            len(self.posted),
+            self.seconds_until_due(now),
+        )
+        return samples
+
+    def seconds_until_due(self, now=None):
+        if not self.queue:
+            return float("inf")
+        return max(self.queue[0][0] - (now or time.time()), 0)
+
+    def run(self, cycles=1, max_wait=600):
+        """
+        Run `cycles` polling cycles, sleeping (at most `max_wait` seconds)
+        until the next tweet is due between them.
+        """
+        for cycle in range(cycles):
+            if cycle:
+                wait = min(self.seconds_until_due(), max_wait)
+                if wait == float("inf"):
+                    break
+                time.sleep(wait)
+            self.poll_due()
+
+    def _sample(self, tweet_id):
+        """
+        Visit the status page and read the tweet's counts with `Tweet`.
+        """
+        self.scraper.driver.get(TWITTER_STATUS_URL.format(tweet_id))
+        time.sleep(2)
+
+        for card in SELECTORS.find_all(self.scraper.driver, "timeline.tweet_card"):
+            try:
+                if not is_status_card(card, tweet_id):
+                    continue
+                tweet_obj = Tweet(
+                    card=card, driver=self.scraper.driver, actions=self.scraper.actions
+                )
+            except StaleElementReferenceException:
+                continue
+            if tweet_obj.error:
+                break
+            return {
+                "tweet_id": tweet_id,
+                "timestamp": int(time.time()),
+                "replies": parse_count(tweet_obj.reply_cnt),
+                "retweets": parse_count(tweet_obj.retweet_cnt),
+                "likes": parse_count(tweet_obj.like_cnt),
+                "views": parse_count(tweet_obj.analytics_cnt),
+            }
+
+        logger.warning("Could not read counts of tweet %s.", tweet_id)
+        return None
+
+    def _append_samples(self, samples):
+        if not samples:
+            return
+        write_header = not os.path.exists(self.store_file)
+        with open(self.store_file, "a", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=STORE_FIELDS)
+            if write_header:
+                writer.writeheader()
+            writer.writerows(samples)
+
+    def _save_schedule(self):
+        tmp_file = f"{self.schedule_file}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"posted": self.posted, "queue": self.queue}, f)
+        os.replace(tmp_file, self.schedule_file)
@@ -7,6 +7,8 @@ from selenium.common.exceptions import (
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.remote.webelement import WebElement
 
+from src.locators import SELECTORS
+
 
 class Tweet:
     def __init__(
@@ -38,6 +40,7 @@ class Tweet:
         self.mentions = []
         self.emojis = []
         self.profile_img = ""
+        self.media = []
         self.tweet_link = ""
         self.tweet_id = ""
         self.user_id = None
@@ -58,23 +61,19 @@ class Tweet:
     def _extract_basic_info(self):
         # User
         try:
-            self.user = self.card.find_element(
-                "xpath", './/div[@data-testid="User-Name"]//span'
-            ).text
+            self.user = SELECTORS.find(self.card, "tweet.user_name").text
         except NoSuchElementException:
             self.error = True
 
         # Handle
         try:
-            self.handle = self.card.find_element(
-                "xpath", './/span[contains(text(), "@")]'
-            ).text
+            self.handle = SELECTORS.find(self.card, "tweet.handle").text
         except NoSuchElementException:
             self.error = True
 
         # Date/time
         try:
-            self.date_time = self.card.find_element("xpath", ".//time").get_attribute(
+            self.date_time = SELECTORS.find(self.card, "tweet.time").get_attribute(
                 "datetime"
             )
             if self.date_time is not None:
@@ -85,86 +84,66 @@ class Tweet:
 
         # Verified check
         if not self.error:
-            try:
-                self.card.find_element(
-                    "xpath", './/*[local-name()="svg" and @data-testid="icon-verified"]'
-                )
-                self.verified = True
-            except NoSuchElementException:
-                self.verified = False
+            self.verified = bool(SELECTORS.find_all(self.card, "tweet.verified"))
 
         # Tweet text
         if not self.error:
-            text_parts = self.card.find_elements(
-                "xpath",
-                '(.//div[@data-testid="tweetText"])[1]/span | (.//div[@data-testid="tweetText"])[1]/a',
-            )
+            text_parts = SELECTORS.find_all(self.card, "tweet.text_parts")
             self.content = "".join([part.text for part in text_parts])
 
         # Reply, retweet, like counts
         if not self.error:
-            self.reply_cnt = self._get_text_or_default(
-                './/button[@data-testid="reply"]//span', "0"
-            )
-            self.retweet_cnt = self._get_text_or_default(
-                './/button[@data-testid="retweet"]//span', "0"
-            )
-            self.like_cnt = self._get_text_or_default(
-                './/button[@data-testid="like"]//span', "0"
-            )
-            self.analytics_cnt = self._get_text_or_default(
-                './/a[contains(@href, "/analytics")]//span', "0"
-            )
+            self.reply_cnt = self._get_text_or_default("tweet.reply_count", "0")
+            self.retweet_cnt = self._get_text_or_default("tweet.retweet_count", "0")
+            self.like_cnt = self._get_text_or_default("tweet.like_count", "0")
+            self.analytics_cnt = self._get_text_or_default("tweet.analytics_count", "0")
 
         # Hashtags
         if not self.error:
-            try:
-                hashtag_elems = self.card.find_elements(
-                    "xpath", './/a[contains(@href, "src=hashtag_click")]'
-                )
-                self.tags = [tag.text for tag in hashtag_elems]
-            except NoSuchElementException:
-                self.tags = []
+            hashtag_elems = SELECTORS.find_all(self.card, "tweet.hashtags")
+            self.tags = [tag.text for tag in hashtag_elems]
 
         # Mentions
         if not self.error:
-            try:
-                mention_elems = self.card.find_elements(
-                    "xpath",
-                    '(.//div[@data-testid="tweetText"])[1]//a[contains(text(), "@")]',
-                )
-                self.mentions = [m.text for m in mention_elems]
-            except NoSuchElementException:
-                self.mentions = []
+            mention_elems = SELECTORS.find_all(self.card, "tweet.mentions")
+            self.mentions = [m.text for m in mention_elems]
 
         # Emojis
         if not self.error:
-            try:
-                raw_emojis = self.card.find_elements(
-                    "xpath",
-                    '(.//div[@data-testid="tweetText"])[1]/img[contains(@src, "emoji")]',
-                )
-                self.emojis = [
-                    e.get_attribute("alt").encode("unicode-escape").decode("ASCII")
-                    for e in raw_emojis
-                ]
-            except NoSuchElementException:
-                self.emojis = []
+            raw_emojis = SELECTORS.find_all(self.card, "tweet.emojis")
+            self.emojis = [
+                e.get_attribute("alt").encode("unicode-escape").decode("ASCII")
+                for e in raw_emojis
+            ]
 
         # Profile image
         if not self.error:
             try:
-                self.profile_img = self.card.find_element(
-                    "xpath", './/div[@data-testid="Tweet-User-Avatar"]//img'
+                self.profile_img = SELECTORS.find(
+                    self.card, "tweet.avatar"
                 ).get_attribute("src")
             except NoSuchElementException:
                 self.profile_img = ""
 
+        # Attached photos, video posters and GIFs. GIFs play from a plain
+        # .mp4 URL; other videos stream from a blob: URL, which cannot be
+        # downloaded, so only their poster image is kept.
+        if not self.error:
+            photos = SELECTORS.find_all(self.card, "tweet.photos")
+            videos = SELECTORS.find_all(self.card, "tweet.videos")
+            urls = [img.get_attribute("src") for img in photos]
+            for video in videos:
+                urls.append(video.get_attribute("poster"))
+                source = video.get_attribute("src") or ""
+                if source.startswith(("http://", "https://")):
+                    urls.append(source)
+            self.media = [url for url in urls if url]
+
         # Tweet link & tweet ID
         if not self.error:
             try:
-                self.tweet_link = self.card.find_element(
-                    "xpath", ".//a[contains(@href, '/status/')]"
+                self.tweet_link = SELECTORS.find(
+                    self.card, "tweet.status_link"
                 ).get_attribute("href")
                 self.tweet_id = (
                     self.tweet_link.split("/")[-1] if self.tweet_link else ""
@@ -176,9 +155,7 @@ class Tweet:
     def _extract_poster_details(self):
         # Hover over user name to get user_id, following/followers
         try:
-            el_name = self.card.find_element(
-                "xpath", './/div[@data-testid="User-Name"]//span'
-            )
+            el_name = SELECTORS.find(self.card, "tweet.user_name")
 
             hover_attempts = 0
             details_extracted = False
@@ -186,21 +163,17 @@ class Tweet:
             while hover_attempts < 3 and not details_extracted:
                 try:
                     self.actions.move_to_element(el_name).perform()
-                    hover_card = self.driver.find_element(
-                        "xpath", '//div[@data-testid="hoverCardParent"]'
-                    )
+                    hover_card = SELECTORS.find(self.driver, "hover.card")
 
                     # user_id from data-testid
                     self._extract_user_id(hover_card)
 
                     # following/followers
                     self.following_cnt = self._get_text_or_default(
-                        './/a[contains(@href, "/following")]//span', "0", hover_card
+                        "hover.following_count", "0", hover_card
                     )
                     self.followers_cnt = self._get_text_or_default(
-                        './/a[contains(@href, "/verified_followers")]//span',
-                        "0",
-                        hover_card,
+                        "hover.followers_count", "0", hover_card
                     )
                     details_extracted = True
                     self.actions.reset_actions()
@@ -214,22 +187,21 @@ class Tweet:
 
     def _extract_user_id(self, hover_card):
         try:
-            raw_user_id = hover_card.find_element(
-                "xpath",
-                '(.//div[contains(@data-testid, "-follow")]) | (.//div[contains(@data-testid, "-unfollow")])',
+            raw_user_id = SELECTORS.find(
+                hover_card, "hover.follow_button"
             ).get_attribute("data-testid")
             self.user_id = raw_user_id.split("-")[0] if raw_user_id else None
         except NoSuchElementException:
             pass
 
-    def _get_text_or_default(self, xpath_expr, default_val, parent=None):
+    def _get_text_or_default(self, selector_name, default_val, parent=None):
         if parent is None:
             parent = self.card
-        try:
-            val = parent.find_element("xpath", xpath_expr).text
-            return val if val else default_val
-        except NoSuchElementException:
+        elements = SELECTORS.find_all(parent, selector_name)
+        if not elements:
             return default_val
+        val = elements[0].text
+        return val if val else default_val
 
     def to_dict(self):
         """
@@ -249,6 +221,7 @@ class Tweet:
             "mentions": self.mentions,
             "emojis": self.emojis,
             "profile_img": self.profile_img,
+            "media": self.media,
             "tweet_link": self.tweet_link,
             "tweet_id": self.tweet_id,
             "user_id": self.user_id,
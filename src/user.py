@@ -3,6 +3,10 @@ import logging
 from time import sleep
 from selenium.webdriver.common.keys import Keys
 
+from src.locators import SELECTORS
+
+logger = logging.getLogger(__name__)
+
 TWITTER_POST_URL = "https://twitter.com/compose/tweet"
 
 
@@ -23,30 +27,32 @@ class TwitterUser:
         """
         Post a new tweet.
         """
-        logging.info("Navigating to tweet creation page...")
+        logger.info("Navigating to tweet creation page...")
         try:
             self.driver.get(TWITTER_POST_URL)
             sleep(3)
 
-            logging.info(f"Entering tweet content: {tweet_content}")
+            logger.info("Entering tweet content: %s", tweet_content)
             # Type the tweet
             self.actions.send_keys(tweet_content).perform()
             sleep(1)
 
             # Post the tweet (Ctrl+Enter or locate the Tweet button)
-            logging.info("Posting the tweet...")
+            logger.info("Posting the tweet...")
             self.actions.key_down(Keys.CONTROL).send_keys(Keys.RETURN).key_up(
                 Keys.CONTROL
             ).perform()
             sleep(2)
 
-            logging.info("Tweet posted successfully.")
+            logger.info("Tweet posted successfully.")
         except Exception as e:
-            logging.error(f"Failed to create tweet: {e}", exc_info=True)
+            logger.error("Failed to create tweet: %s", e, exc_info=True)
 
     def follow_user(self, username):
         """
         Follow a user by username.
+
+        :return: True if the follow button was clicked
         """
         try:
             username = username.lstrip("@")
@@ -54,17 +60,19 @@ class TwitterUser:
             self.driver.get(profile_url)
             sleep(3)
 
-            follow_button = self.driver.find_element(
-                "xpath", '//div[@data-testid="follow"]'
-            )
+            follow_button = SELECTORS.find(self.driver, "user.follow", handle=username)
             follow_button.click()
-            logging.info(f"Followed user: {username}")
+            logger.info("Followed user: %s", username)
+            return True
         except Exception as e:
-            logging.error(f"Could not follow user {username}: {e}", exc_info=True)
+            logger.error("Could not follow user %s: %s", username, e, exc_info=True)
+            return False
 
     def unfollow_user(self, username):
         """
         Unfollow a user by username.
+
+        :return: True if the unfollow was confirmed
         """
         try:
             username = username.lstrip("@")
@@ -72,20 +80,20 @@ class TwitterUser:
             self.driver.get(profile_url)
             sleep(3)
 
-            unfollow_button = self.driver.find_element(
-                "xpath", '//div[@data-testid="unfollow"]'
+            unfollow_button = SELECTORS.find(
+                self.driver, "user.unfollow", handle=username
             )
             unfollow_button.click()
             sleep(1)
 
-            confirm_btn = self.driver.find_element(
-                "xpath", '//div[@data-testid="confirmationSheetConfirm"]'
-            )
+            confirm_btn = SELECTORS.find(self.driver, "user.unfollow_confirm")
             confirm_btn.click()
 
-            logging.info(f"Unfollowed user: {username}")
+            logger.info("Unfollowed user: %s", username)
+            return True
         except Exception as e:
-            logging.error(f"Could not unfollow user {username}: {e}", exc_info=True)
+            logger.error("Could not unfollow user %s: %s", username, e, exc_info=True)
+            return False
 
     def open_profile_page(self):
         """
@@ -93,4 +101,4 @@ class TwitterUser:
         """
         self.driver.get("https://twitter.com/i/user")
         sleep(2)
-        logging.info("Opened profile page.")
+        logger.info("Opened profile page.")
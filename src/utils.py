@@ -2,6 +2,40 @@
 import logging
 import csv
 import json
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+COUNT_SUFFIXES = {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
+
+
+def parse_count(text):
+    """
+    Convert a displayed count ('0', '1,234', '1.2K', '3M') to an int; text
+    that is not a count gives 0.
+    """
+    text = (text or "").strip()
+    if not text:
+        return 0
+    multiplier = COUNT_SUFFIXES.get(text[-1].upper())
+    try:
+        if multiplier:
+            # Abbreviated counts may use a decimal comma ('1,2K')
+            return int(float(text[:-1].strip().replace(",", ".")) * multiplier)
+        return int(float(text.replace(",", "")))
+    except ValueError:
+        return 0
+
+
+def parse_timestamp(date_time):
+    """
+    Convert a tweet's ISO `date_time` ('2024-01-01T12:00:00.000Z') to a Unix
+    timestamp, or None if it is missing or malformed.
+    """
+    try:
+        return datetime.fromisoformat(date_time.replace("Z", "+00:00")).timestamp()
+    except (AttributeError, ValueError):
+        return None
 
 
 def save_to_csv(data, output_file="tweets.csv"):
@@ -9,15 +43,16 @@ def save_to_csv(data, output_file="tweets.csv"):
     Save a list of dictionaries (tweets) to a CSV file.
     """
     if not data:
-        logging.warning("No data to save to CSV.")
+        logger.warning("No data to save to CSV.")
         return
 
-    keys = list(data[0].keys())
+    # Union of all keys, in first-seen order; rows may lack some fields
+    keys = list(dict.fromkeys(key for row in data for key in row))
     with open(output_file, "w", encoding="utf-8", newline="") as f:
         writer = csv.DictWriter(f, fieldnames=keys)
         writer.writeheader()
         writer.writerows(data)
-    logging.info(f"Data saved to {output_file} (CSV).")
+    logger.info("Data saved to %s (CSV).", output_file)
 
 
 def save_to_json(data, output_file="tweets.json"):
@@ -26,4 +61,46 @@ def save_to_json(data, output_file="tweets.json"):
     """
     with open(output_file, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
-    logging.info(f"Data saved to {output_file} (JSON).")
+    logger.info("Data saved to %s (JSON).", output_file)
+
+
+def save_to_jsonl(data, output_file="tweets.jsonl"):
+    """
+    Save a list of dictionaries (tweets) as JSON Lines, one tweet per line.
+    Unlike a JSON array, the file can be appended to and streamed.
+    """
+    with open(output_file, "w", encoding="utf-8") as f:
+        for row in data:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    logger.info("Data saved to %s (JSONL).", output_file)
+
+
+def save_data(data, output_file="tweets.csv"):
+    """
+    Save a list of dictionaries (tweets) to CSV, JSON or JSONL, based on the
+    extension.
+    """
+    if output_file.lower().endswith(".csv"):
+        save_to_csv(data, output_file=output_file)
+    elif output_file.lower().endswith(".json"):
+        save_to_json(data, output_file=output_file)
+    elif output_file.lower().endswith((".jsonl", ".ndjson")):
+        save_to_jsonl(data, output_file=output_file)
+    else:
+        logger.warning("Unrecognized file extension, defaulting to .csv")
+        save_to_csv(data, output_file=output_file)
+
+
+def load_data(input_file):
+    """
+    Load a list of dictionaries (tweets) from a CSV, JSON or JSONL export.
+    """
+    with open(input_file, encoding="utf-8", newline="") as f:
+        if input_file.lower().endswith(".json"):
+            data = json.load(f)
+        elif input_file.lower().endswith((".jsonl", ".ndjson")):
+            data = [json.loads(line) for line in f if line.strip()]
+        else:
+            data = list(csv.DictReader(f))
+    logger.info("Loaded %s tweets from %s.", len(data), input_file)
+    return data
@@ -0,0 +1,169 @@
+# tests/test_accounts.py
+import pytest
+
+from src.accounts import MAX_ACCOUNT_FAILURES, Account, AccountBalancer
+
+
+class FakeDriver:
+    def __init__(self):
+        self.closed = False
+
+    def quit(self):
+        self.closed = True
+
+
+class FakeSession:
+    """
+    Stands in for a logged-in TwitterScraper.
+    """
+
+    def __init__(self, account, challenged=False):
+        self.account = account
+        self.challenged = challenged
+        self.alive = True
+        self.driver = FakeDriver()
+
+    def is_alive(self):
+        return self.alive
+
+
+def make_balancer(emails, fail_login=(), challenged=()):
+    accounts = [Account(email, "password") for email in emails]
+    started = []
+
+    def session_factory(account):
+        started.append(account.email)
+        if account.email in fail_login:
+            raise ValueError("Login failed: Could not find auth_token cookie.")
+        return FakeSession(account, challenged=account.email in challenged)
+
+    balancer = AccountBalancer(accounts, session_factory=session_factory)
+    return balancer, accounts, started
+
+
+def run_one(balancer, job, max_attempts=3):
+    return balancer.run([job], max_attempts=max_attempts)[0]
+
+
+def test_jobs_rotate_across_accounts():
+    balancer, accounts, started = make_balancer(["a", "b"])
+    used = [run_one(balancer, lambda s: s.account.email) for _ in range(4)]
+
+    assert used == ["a", "b", "a", "b"]
+    assert [account.used for account in accounts] == [2, 2]
+    # Sessions are pinned: one login per account
+    assert started == ["a", "b"]
+
+
+def test_concurrent_jobs_use_every_account():
+    balancer, accounts, _ = make_balancer(["a", "b", "c"])
+    results = balancer.run([lambda s: s.account.email for _ in range(9)])
+
+    assert len(results) == 9
+    assert set(results) == {"a", "b", "c"}
+    assert sum(account.used for account in accounts) == 9
+    assert not any(account.busy for account in accounts)
+
+
+def test_login_failure_moves_job_to_another_account():
+    balancer, accounts, started = make_balancer(["a", "b"], fail_login={"a"})
+    result = run_one(balancer, lambda s: s.account.email)
+
+    assert result == "b"
+    assert started == ["a", "b"]
+    assert accounts[0].failures == 1
+    assert accounts[1].failures == 0
+    assert [account.used for account in accounts] == [0, 1]
+    # The failed account ranks below the healthy one for the next job
+    assert run_one(balancer, lambda s: s.account.email) == "b"
+
+
+def test_dead_session_is_recreated_on_retry_elsewhere():
+    balancer, accounts, started = make_balancer(["a", "b"])
+    ran_on = []
+
+    def job(session):
+        ran_on.append(session.account.email)
+        if session.account.email == "a":
+            session.alive = False
+            raise RuntimeError("browser crashed")
+        return "done"
+
+    assert run_one(balancer, job) == "done"
+    assert ran_on == ["a", "b"]
+    assert accounts[0].failures == 1
+    assert [account.used for account in accounts] == [0, 1]
+    assert accounts[0].session is None  # Dropped, recreated on next use
+
+
+def test_job_error_is_not_blamed_on_the_account():
+    balancer, accounts, _ = make_balancer(["a", "b"])
+    calls = []
+
+    def job(session):
+        calls.append(session.account.email)
+        raise ValueError("bad tweet ID")
+
+    assert run_one(balancer, job) is None
+    assert calls == ["a"]  # Not retried on another account
+    assert accounts[0].failures == 0
+    assert accounts[0].used == 1  # The job ran, so it is charged
+    assert accounts[0].healthy
+
+
+def test_repeated_failures_take_account_out_of_rotation():
+    balancer, accounts, _ = make_balancer(["a", "b"], fail_login={"a"})
+    for _ in range(MAX_ACCOUNT_FAILURES):
+        accounts[1].busy = True  # Force the job onto "a"
+        assert run_one(balancer, lambda s: s.account.email, max_attempts=1) is None
+        accounts[1].busy = False
+
+    assert not accounts[0].healthy
+    assert [run_one(balancer, lambda s: s.account.email) for _ in range(3)] == ["b"] * 3
+
+
+def test_challenges_are_counted_and_lower_the_score():
+    balancer, accounts, _ = make_balancer(["a", "b"], challenged={"a"})
+    run_one(balancer, lambda s: None)  # Starts "a" (challenged)
+    run_one(balancer, lambda s: None)  # Starts "b"
+    run_one(balancer, lambda s: None)
+
+    assert accounts[0].challenges == 1
+    assert accounts[1].challenges == 0
+    assert accounts[0].score() < accounts[1].score()
+    # The challenge is counted once per session, not per job
+    assert accounts[1].used == 2
+
+
+def test_failed_runs_do_not_spend_the_budget():
+    balancer, accounts, _ = make_balancer(["a", "b"], fail_login={"a"})
+    accounts[0].budget = accounts[1].budget = 2
+    for _ in range(MAX_ACCOUNT_FAILURES - 1):
+        accounts[1].busy = True  # Force the job onto "a"
+        assert run_one(balancer, lambda s: "done", max_attempts=1) is None
+        accounts[1].busy = False
+
+    assert accounts[0].used == 0
+    assert accounts[0].remaining == 2
+    assert accounts[0].healthy
+
+
+def test_no_healthy_accounts_drops_the_job():
+    balancer, accounts, _ = make_balancer(["a"], fail_login={"a"})
+    assert run_one(balancer, lambda s: "never", max_attempts=5) is None
+    assert accounts[0].failures == MAX_ACCOUNT_FAILURES
+
+
+def test_close_quits_every_session():
+    balancer, accounts, _ = make_balancer(["a", "b"])
+    balancer.run([lambda s: None, lambda s: None])
+    drivers = [account.session.driver for account in accounts]
+    balancer.close()
+
+    assert all(driver.closed for driver in drivers)
+    assert all(account.session is None for account in accounts)
+
+
+def test_empty_account_list_is_rejected():
+    with pytest.raises(ValueError):
+        AccountBalancer([], session_factory=FakeSession)
@@ -0,0 +1,88 @@
+# tests/test_archive.py
+import io
+import json
+
+import pytest
+
+import src.archive
+from src.archive import iter_json_array, merge_exports, normalize
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1 << 16])
+def test_iter_json_array_reads_items_across_chunks(chunk_size):
+    items = [{"tweet_id": "1", "text": "a, [b]"}, 12345, "x]", [], {"n": -1.5e3}]
+    text = "  [\n" + ",\n".join(json.dumps(item) for item in items) + "\n]\n"
+    assert list(iter_json_array(io.StringIO(text), chunk_size=chunk_size)) == items
+
+
+def test_iter_json_array_handles_an_empty_array():
+    assert list(iter_json_array(io.StringIO(" [ ] "), chunk_size=2)) == []
+
+
+@pytest.mark.parametrize("text", ['{"tweet_id": "1"}', '[{"tweet_id": "1"}, {"tw'])
+def test_iter_json_array_rejects_non_arrays_and_truncated_input(text):
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO(text), chunk_size=4))
+
+
+def test_normalize_restores_csv_types():
+    record = normalize(
+        {
+            "tags": "['#a', '#b']",
+            "mentions": "",
+            "media": "[broken",
+            "verified": "True",
+        }
+    )
+    assert record == {
+        "tags": ["#a", "#b"],
+        "mentions": [],
+        "media": "[broken",  # Left as is rather than guessed
+        "verified": True,
+    }
+    assert normalize({"verified": "False"})["verified"] is False
+
+
+def write_exports(tmp_path):
+    first = tmp_path / "first.json"
+    first.write_text(
+        json.dumps(
+            [
+                {"tweet_id": "1", "content": "one", "likes": ""},
+                {"tweet_id": "2", "content": "two"},
+            ]
+        )
+    )
+    second = tmp_path / "second.jsonl"
+    second.write_text(
+        "\n".join(
+            json.dumps(record)
+            for record in [
+                {"tweet_id": "1", "content": "one (copy)", "likes": "5"},
+                {"tweet_id": "3", "content": "three", "views": "9"},
+            ]
+        )
+    )
+    return [str(first), str(second)]
+
+
+def test_merge_dedupes_fills_fields_and_keeps_input_order(tmp_path, monkeypatch):
+    # Force several partial flushes per worker
+    monkeypatch.setattr(src.archive, "PARTITION_BATCH", 1)
+    output = tmp_path / "merged.jsonl"
+    stats = merge_exports(write_exports(tmp_path), str(output), workers=1, buckets=5)
+
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [record["tweet_id"] for record in records] == ["1", "2", "3"]
+    assert records[0] == {"tweet_id": "1", "content": "one", "likes": "5"}
+    assert stats == {"files": 2, "read": 4, "written": 3, "duplicates": 1}
+
+
+def test_buckets_are_capped_below_the_open_file_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr(src.archive, "_open_file_limit", lambda: 100)
+    output = tmp_path / "merged.jsonl"
+    merge_exports(write_exports(tmp_path), str(output), workers=1, buckets=10_000)
+
+    assert len(output.read_text().splitlines()) == 3
+    with pytest.raises(ValueError):
+        merge_exports(write_exports(tmp_path), str(output), buckets=0)
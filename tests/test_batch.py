@@ -0,0 +1,69 @@
+# tests/test_batch.py
+import json
+
+import pytest
+
+from src.batch import load_manifest
+
+
+def test_json_manifest_with_targets_key(tmp_path):
+    manifest = tmp_path / "targets.json"
+    manifest.write_text(
+        json.dumps(
+            {
+                "targets": [
+                    {"type": "profile", "value": "@someone", "max_tweets": "20"},
+                    {"type": "home", "latest": "no"},
+                ]
+            }
+        )
+    )
+    profile, home = load_manifest(str(manifest))
+
+    assert profile.name == "profile-someone"
+    assert profile.scrape_kwargs()["scrape_username"] == "@someone"
+    assert profile.max_tweets == 20
+    assert home.name == "home-home"
+    assert home.latest is False
+
+
+def test_csv_manifest_and_colliding_names(tmp_path):
+    manifest = tmp_path / "targets.csv"
+    manifest.write_text(
+        "type,value,latest,top\n"
+        "hashtag,#python,true,\n"
+        "hashtag,#python,false,true\n"
+        "query,selenium tips,,\n"
+    )
+    targets = load_manifest(str(manifest))
+
+    assert [target.name for target in targets] == [
+        "hashtag-python",
+        "hashtag-python-2",
+        "query-selenium_tips",
+    ]
+    assert targets[1].top is True
+
+
+@pytest.mark.parametrize(
+    "entries, where, message",
+    [
+        ([{"type": "profile"}], "target 1", "needs a value"),
+        ([{"type": "home"}, {"type": "list", "value": "x"}], "target 2", "Unknown"),
+        ([{"type": "home", "limit": 5}], "target 1", "'limit'"),
+        (["home"], "target 1", "Expected a mapping"),
+    ],
+)
+def test_invalid_entries_name_their_position(tmp_path, entries, where, message):
+    manifest = tmp_path / "targets.json"
+    manifest.write_text(json.dumps(entries))
+    with pytest.raises(ValueError, match=where) as error:
+        load_manifest(str(manifest))
+    assert message in str(error.value)
+
+
+def test_csv_errors_name_the_line(tmp_path):
+    manifest = tmp_path / "targets.csv"
+    manifest.write_text("type,value\nhome,\nprofile,\n")
+    with pytest.raises(ValueError, match="line 3"):
+        load_manifest(str(manifest))
@@ -0,0 +1,99 @@
+# tests/test_composer.py
+import json
+
+import pytest
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from src.composer import (
+    UNCONFIRMED,
+    PostPublisher,
+    ScheduledPost,
+    load_post_queue,
+    run_post_queue,
+)
+
+
+class FakeDriver:
+    def __init__(self, error):
+        self.error = error
+
+    def get(self, url):
+        raise self.error
+
+
+class FakeScraper:
+    def __init__(self, error, alive=True):
+        self.driver = FakeDriver(error)
+        self.alive = alive
+
+    def is_alive(self):
+        return self.alive
+
+
+class FakePublisher:
+    """
+    Returns a status ID per post; raises or returns the values in `outcomes`
+    for the posts named there, once.
+    """
+
+    def __init__(self, outcomes=None):
+        self.outcomes = dict(outcomes or {})
+        self.published = []
+
+    def publish(self, post):
+        self.published.append(post.name)
+        outcome = self.outcomes.pop(post.name, f"id-{post.name}")
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def test_page_error_fails_only_the_post():
+    publisher = PostPublisher(FakeScraper(TimeoutException("slow")))
+    assert publisher.publish(ScheduledPost("hello")) is None
+
+
+def test_dead_session_is_raised_for_recovery():
+    publisher = PostPublisher(FakeScraper(WebDriverException("gone"), alive=False))
+    with pytest.raises(WebDriverException):
+        publisher.publish(ScheduledPost("hello"))
+
+    publisher = PostPublisher(FakeScraper(TimeoutException("slow"), alive=False))
+    with pytest.raises(TimeoutException):
+        publisher.publish(ScheduledPost("hello"))
+
+
+def test_rerun_after_a_lost_session_publishes_only_pending_posts():
+    posts = [ScheduledPost(name, name=name) for name in ("a", "b", "c")]
+    publisher = FakePublisher({"b": WebDriverException("gone")})
+    with pytest.raises(WebDriverException):
+        run_post_queue(publisher, posts, pace=0)
+
+    report = run_post_queue(publisher, posts, pace=0)
+    assert publisher.published == ["a", "b", "b", "c"]
+    assert report["published"] == [("a", "id-a"), ("b", "id-b"), ("c", "id-c")]
+
+
+def test_report_separates_unconfirmed_and_failed_posts():
+    posts = [ScheduledPost(name, name=name) for name in ("a", "b", "c")]
+    report = run_post_queue(FakePublisher({"b": UNCONFIRMED, "c": None}), posts, pace=0)
+
+    assert report["published"] == [("a", "id-a")]
+    assert report["unconfirmed"] == ["b"]
+    assert report["failed"] == ["c"]
+
+
+def test_invalid_entries_are_skipped(tmp_path):
+    queue_file = tmp_path / "posts.json"
+    entries = [
+        {"text": "bad time", "publish_at": "tomorrow"},
+        {"text": "ok", "publish_at": "2024-05-01T09:30:00+02:00"},
+        {"thread": ["one", 2]},
+        "not a mapping",
+        {"text": "   "},
+    ]
+    queue_file.write_text(json.dumps(entries), encoding="utf-8")
+    posts = load_post_queue(str(queue_file))
+
+    assert [post.name for post in posts] == ["ok"]
+    assert posts[0].publish_at == 1714548600
@@ -0,0 +1,25 @@
+# tests/test_index.py
+from src.index import parse_query
+
+
+def test_filters_are_split_from_the_terms():
+    assert parse_query(
+        'selenium OR "web scraping" #Python @user from:someone since:2024-01-01'
+    ) == {
+        "terms": 'selenium OR "web scraping"',
+        "tags": ["#Python"],
+        "mentions": ["@user"],
+        "handle": "someone",
+        "since": "2024-01-01",
+    }
+
+
+def test_operators_parentheses_and_prefixes_stay_in_the_terms():
+    options = parse_query("(python OR rust) NOT java scrap* until:2024-02-01")
+    assert options["terms"] == "( python OR rust ) NOT java scrap*"
+    assert options["until"] == "2024-02-01"
+    assert options["tags"] == options["mentions"] == []
+
+
+def test_lone_symbols_are_terms():
+    assert parse_query("# @")["terms"] == "# @"
@@ -0,0 +1,125 @@
+# tests/test_media.py
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.media import MediaCache, collect_media_urls, download_media
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"fake image"
+JPEG = b"\xff\xd8\xff" + b"other image"
+
+# path -> (status, content type, body); two paths serve identical content
+ROUTES = {
+    "/a.png": (200, "image/png", PNG),
+    "/copy-of-a": (200, "image/png", PNG),
+    "/photo?format=jpg&name=small": (200, "application/octet-stream", JPEG),
+    "/missing.png": (404, "text/plain", b"not found"),
+}
+
+
+class MediaHandler(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def do_GET(self):
+        self.requests_seen.append(self.path)
+        status, content_type, body = ROUTES.get(self.path, (404, "text/plain", b""))
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    MediaHandler.requests_seen = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), MediaHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def objects(cache_dir):
+    return sorted(
+        name
+        for _, _, names in os.walk(os.path.join(cache_dir, "objects"))
+        for name in names
+    )
+
+
+def test_identical_content_is_stored_once(server, tmp_path):
+    cache = MediaCache(str(tmp_path))
+    urls = [f"{server}/a.png", f"{server}/copy-of-a"]
+    paths = download_media(urls, cache, max_workers=2)
+
+    assert paths[urls[0]] == paths[urls[1]]
+    assert len(objects(str(tmp_path))) == 1
+    with open(paths[urls[0]], "rb") as f:
+        assert f.read() == PNG
+
+
+def test_second_run_is_served_from_the_cache(server, tmp_path):
+    urls = [f"{server}/a.png", f"{server}/photo?format=jpg&name=small"]
+    first = download_media(urls, MediaCache(str(tmp_path)))
+    assert len(MediaHandler.requests_seen) == 2
+
+    # A new cache object reads the index written by the first run
+    second = download_media(urls, MediaCache(str(tmp_path)))
+    assert second == first
+    assert len(MediaHandler.requests_seen) == 2
+
+
+def test_extension_comes_from_whitelisted_sources(server, tmp_path):
+    url = f"{server}/photo?format=jpg&name=small"
+    paths = download_media([url], MediaCache(str(tmp_path)))
+    assert paths[url].endswith(".jpg")
+
+
+def test_failed_download_does_not_stop_the_others(server, tmp_path):
+    urls = [f"{server}/missing.png", f"{server}/a.png"]
+    paths = download_media(urls, MediaCache(str(tmp_path)))
+
+    assert list(paths) == [urls[1]]
+    assert not MediaCache(str(tmp_path)).path_for(urls[0])
+
+
+def test_collect_media_urls_dedupes_and_reads_csv_lists():
+    tweets = [
+        {
+            "media": ["https://x/1.jpg", "https://x/2.jpg"],
+            "profile_img": "https://x/me",
+        },
+        {"media": "['https://x/2.jpg', 'https://x/3.jpg']", "profile_img": ""},
+        {"media": "['https://x/broken.jpg'", "profile_img": "https://x/me"},
+        {"media": "", "profile_img": "data:image/png;base64,AAAA"},
+    ]
+    assert collect_media_urls(tweets) == [
+        "https://x/1.jpg",
+        "https://x/2.jpg",
+        "https://x/me",
+        "https://x/3.jpg",
+    ]
+    assert "https://x/me" not in collect_media_urls(tweets, include_avatars=False)
+
+
+def test_cache_write_error_is_a_failed_download(server, tmp_path, monkeypatch):
+    cache = MediaCache(str(tmp_path))
+    store = cache.store
+
+    def store_or_fail(url, content, content_type=None):
+        if url.endswith("/a.png"):
+            raise OSError(28, "No space left on device")
+        return store(url, content, content_type)
+
+    monkeypatch.setattr(cache, "store", store_or_fail)
+    urls = [f"{server}/a.png", f"{server}/photo?format=jpg&name=small"]
+    paths = download_media(urls, cache)
+
+    assert list(paths) == [urls[1]]
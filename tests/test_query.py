@@ -0,0 +1,156 @@
+# tests/test_query.py
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.query import SearchQuery, ShardPlanner, parse_date
+
+
+class FakeScraper:
+    """
+    Returns `density` tweets per hour of the searched window, up to
+    max_tweets; windows starting at a time in `failing` end with an error.
+    """
+
+    def __init__(self, density=10, failing=()):
+        self.density = density
+        self.failing = set(failing)
+        self.last_error = None
+        self.windows = []
+
+    def scrape_tweets(self, max_tweets, scrape_query, **options):
+        since, until = (bound(part) for part in scrape_query.split()[-2:])
+        self.windows.append((since, until))
+        self.last_error = RuntimeError("boom") if since in self.failing else None
+        count = min(int((until - since) / 3600 * self.density), max_tweets)
+        return [{"tweet_id": f"{since}-{i}"} for i in range(count)]
+
+
+def epoch(value):
+    return int(value.replace(tzinfo=timezone.utc).timestamp())
+
+
+def bound(operator):
+    # since:YYYY-MM-DD or since_time:<Unix seconds>
+    value = operator.split(":", 1)[1]
+    if "_time:" in operator:
+        return int(value)
+    return epoch(datetime.fromisoformat(value))
+
+
+def test_aware_times_are_converted_not_relabelled():
+    paris = timezone(timedelta(hours=2))
+    query = SearchQuery("python", since=datetime(2024, 5, 1, 9, 30, tzinfo=paris))
+    assert query.build() == f"python since_time:{epoch(datetime(2024, 5, 1, 7, 30))}"
+    assert parse_date("2024-05-01T02:00:00+02:00") == datetime(2024, 5, 1)
+    assert SearchQuery(since="2024-05-01T02:00:00+02:00").build() == (
+        "since:2024-05-01"
+    )
+
+
+def test_invalid_date_is_a_value_error():
+    with pytest.raises(ValueError, match="invalid date"):
+        parse_date("yesterday")
+
+
+def test_failed_shard_is_reported_not_counted_as_done():
+    since = datetime(2024, 1, 1, 0, 0)
+    scraper = FakeScraper(density=1, failing={epoch(since) + 3600 * 4})
+    planner = ShardPlanner(
+        SearchQuery("python"),
+        since,
+        since + timedelta(hours=12),
+        max_tweets_per_shard=100,
+        initial_window=timedelta(hours=4),
+        max_window=timedelta(hours=4),
+    )
+    planner.run(scraper)
+
+    assert planner.failed == [(since + timedelta(hours=4), since + timedelta(hours=8))]
+    # The failed shard's partial tweets are still kept
+    assert len(planner.data) == 12
+
+
+def test_parallel_run_reports_shards_the_balancer_gave_up_on():
+    since = datetime(2024, 1, 1)
+
+    class Balancer:
+        def run(self, jobs):
+            results = [job(FakeScraper(density=1)) for job in jobs]
+            results[1] = None
+            return results
+
+    planner = ShardPlanner(
+        SearchQuery("python"),
+        since,
+        since + timedelta(hours=3),
+        max_tweets_per_shard=100,
+        initial_window=timedelta(hours=1),
+    )
+    planner.run_parallel(Balancer())
+
+    assert planner.failed == [(since + timedelta(hours=1), since + timedelta(hours=2))]
+    assert len(planner.data) == 2
+
+
+def planner(**options):
+    since = datetime(2024, 1, 1)
+    return ShardPlanner(
+        SearchQuery("python"),
+        since,
+        since + timedelta(days=1),
+        max_tweets_per_shard=100,
+        **options,
+    )
+
+
+def test_split_halves_only_full_shards():
+    shards = planner(min_window=timedelta(hours=1))
+    since = datetime(2024, 1, 1)
+    until = since + timedelta(hours=4)
+
+    assert shards._split(99, since, until) == []
+    assert shards._split(100, since, until) == [
+        (since, since + timedelta(hours=2)),
+        (since + timedelta(hours=2), until),
+    ]
+    assert shards.truncated == []
+
+
+def test_full_shard_at_the_minimum_window_is_truncated():
+    shards = planner(min_window=timedelta(hours=1))
+    since = datetime(2024, 1, 1)
+    until = since + timedelta(minutes=90)
+
+    assert shards._split(100, since, until) == []
+    assert shards.truncated == [(since, until)]
+
+
+def test_next_window_follows_density_within_bounds():
+    shards = planner(min_window=timedelta(hours=1), max_window=timedelta(days=2))
+
+    # 25 tweets in 4 h: aim for 50 (half a shard) -> 8 h
+    assert shards._next_window(timedelta(hours=4), 25) == timedelta(hours=8)
+    assert shards._next_window(timedelta(hours=4), 0) == timedelta(hours=8)
+    assert shards._next_window(timedelta(hours=4), 1000) == timedelta(hours=1)
+    assert shards._next_window(timedelta(days=1), 1) == timedelta(days=2)
+
+
+def test_sequential_run_splits_dense_windows_and_merges_once():
+    scraper = FakeScraper(density=60)  # 60 tweets per hour
+    shards = planner(
+        initial_window=timedelta(hours=4), min_window=timedelta(minutes=30)
+    )
+    data = shards.run(scraper)
+
+    assert shards.truncated == []
+    # The windows that were not full tile the whole day
+    complete = sorted(
+        (since, until)
+        for since, until in scraper.windows
+        if (until - since) / 3600 * 60 < 100
+    )
+    assert complete[0][0] == epoch(datetime(2024, 1, 1))
+    assert complete[-1][1] == epoch(datetime(2024, 1, 2))
+    assert all(a[1] == b[0] for a, b in zip(complete, complete[1:]))
+    assert len({tweet["tweet_id"] for tweet in data}) == len(data)
@@ -0,0 +1,20 @@
+# tests/test_reconciler.py
+from src.reconciler import load_follow_targets
+
+
+def test_csv_header_is_skipped_only_in_the_first_row(tmp_path):
+    target_file = tmp_path / "targets.csv"
+    target_file.write_text("Username,note\n@Alice,x\nusername,real account\n")
+    assert load_follow_targets(str(target_file)) == {"alice", "username"}
+
+
+def test_csv_without_header_keeps_every_row(tmp_path):
+    target_file = tmp_path / "targets.csv"
+    target_file.write_text("alice\nbob\n")
+    assert load_follow_targets(str(target_file)) == {"alice", "bob"}
+
+
+def test_text_list_keeps_an_account_named_username(tmp_path):
+    target_file = tmp_path / "targets.txt"
+    target_file.write_text("username\n@Bob  # a comment\n\n# only a comment\n")
+    assert load_follow_targets(str(target_file)) == {"username", "bob"}
@@ -0,0 +1,138 @@
+# tests/test_supervisor.py
+import pytest
+from urllib3.exceptions import MaxRetryError
+
+import src.supervisor
+from src.scraper import TwitterScraper
+from src.supervisor import DriverSupervisor, SessionLostError
+
+
+class DeadDriver:
+    """
+    A driver whose driver process is gone: every command raises `error`.
+    """
+
+    def __init__(self, error):
+        self.error = error
+
+    @property
+    def window_handles(self):
+        raise self.error
+
+    def quit(self):
+        raise self.error
+
+
+class LiveDriver:
+    window_handles = ["main"]
+
+    def execute_script(self, script, *args):
+        return 0
+
+    def quit(self):
+        pass
+
+
+DRIVER_ERRORS = [
+    MaxRetryError(None, "/session/1/window/handles", "Connection refused"),
+    ConnectionRefusedError(111, "Connection refused"),
+]
+
+
+class FakeScraper:
+    """
+    Fails `failures` times with `error` (killing the driver) before
+    returning tweets.
+    """
+
+    def __init__(self, error, failures=1, during_scrape=False):
+        self.error = error
+        self.failures = failures
+        self.during_scrape = during_scrape
+        self.driver = LiveDriver()
+        self.data = []
+        self.last_error = None
+        self.interrupted = False
+        self.restarted = 0
+
+    is_alive = TwitterScraper.is_alive
+
+    def restart_driver(self):
+        self.restarted += 1
+        self.driver = LiveDriver()
+
+    def login(self, exit_on_failure=True):
+        pass
+
+    def iter_tweets(self, resume=False, **kwargs):
+        self.last_error = None
+        if not resume:
+            self.data = []
+        if self.failures:
+            self.failures -= 1
+            self.driver = DeadDriver(self.error)
+            if not self.during_scrape:
+                raise self.error  # e.g. from driver.get while navigating
+            self.last_error = self.error
+            return
+        for tweet_id in ("1", "2"):
+            self.data.append({"tweet_id": tweet_id})
+            yield self.data[-1]
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(src.supervisor, "sleep", lambda seconds: None)
+
+
+@pytest.mark.parametrize("error", DRIVER_ERRORS)
+def test_is_alive_and_restart_treat_driver_errors_as_a_dead_session(error, monkeypatch):
+    scraper = TwitterScraper.__new__(TwitterScraper)
+    scraper.driver = DeadDriver(error)
+    scraper.headless = None
+    assert not scraper.is_alive()
+
+    monkeypatch.setattr(scraper, "_get_driver", lambda *args, **kwargs: LiveDriver())
+    scraper.restart_driver()
+    assert scraper.is_alive()
+
+
+@pytest.mark.parametrize("during_scrape", [False, True])
+@pytest.mark.parametrize("error", DRIVER_ERRORS)
+def test_iter_tweets_recovers_from_driver_errors(error, during_scrape):
+    scraper = FakeScraper(error, during_scrape=during_scrape)
+    supervisor = DriverSupervisor(scraper, backoff=0)
+
+    assert [tweet["tweet_id"] for tweet in supervisor.iter_tweets()] == ["1", "2"]
+    assert scraper.restarted == 1
+
+
+@pytest.mark.parametrize("error", DRIVER_ERRORS)
+def test_run_recovers_from_driver_errors(error):
+    scraper = FakeScraper(error)
+    supervisor = DriverSupervisor(scraper, backoff=0)
+
+    def job(session):
+        return list(session.scraper.iter_tweets())
+
+    assert len(supervisor.run(job)) == 2
+    assert scraper.restarted == 1
+
+
+def test_restart_budget_is_enforced():
+    scraper = FakeScraper(DRIVER_ERRORS[0], failures=5)
+    supervisor = DriverSupervisor(scraper, max_restarts=2, backoff=0)
+
+    with pytest.raises(SessionLostError):
+        list(supervisor.iter_tweets())
+    assert scraper.restarted == 2
+
+
+def test_errors_of_a_live_session_are_not_recovered():
+    scraper = FakeScraper(MaxRetryError(None, "https://twitter.com", "timeout"))
+    scraper.is_alive = lambda: True
+    supervisor = DriverSupervisor(scraper, backoff=0)
+
+    with pytest.raises(MaxRetryError):
+        list(supervisor.iter_tweets())
+    assert scraper.restarted == 0
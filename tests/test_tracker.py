@@ -0,0 +1,124 @@
+# tests/test_tracker.py
+import pytest
+
+import src.tracker
+from src.tracker import EngagementTracker, load_series
+from src.utils import parse_count
+
+HOUR = 3600
+START = 1_700_000_000.0
+
+
+class FakeClock:
+    def __init__(self, now=START):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(src.tracker, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def tracker(tmp_path, clock, monkeypatch):
+    tracker = EngagementTracker(
+        None,
+        store_file=str(tmp_path / "engagement.csv"),
+        batch_size=2,
+        min_interval=300,
+        max_interval=6 * HOUR,
+        age_ratio=0.1,
+        max_age=2 * 86400,
+    )
+    tracker.polled = []
+
+    def sample(tweet_id):
+        tracker.polled.append((clock.now, tweet_id))
+        return {
+            "tweet_id": tweet_id,
+            "timestamp": int(clock.now),
+            "replies": 1,
+            "retweets": 2,
+            "likes": len(tracker.polled),
+            "views": 4,
+        }
+
+    monkeypatch.setattr(tracker, "_sample", sample)
+    return tracker
+
+
+def iso(timestamp):
+    from datetime import datetime, timezone
+
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+def test_interval_grows_with_age_within_bounds(tracker):
+    tracker.posted = {"new": START, "day": START - 86400, "old": START - 30 * 86400}
+
+    assert tracker.interval("new", START + 60) == 300  # Clamped to min_interval
+    assert tracker.interval("day", START) == pytest.approx(0.1 * 86400)
+    assert tracker.interval("old", START) == 6 * HOUR  # Clamped to max_interval
+
+
+def test_new_tweets_are_due_at_once_and_polled_in_batches(tracker, clock):
+    tracker.track(
+        [{"tweet_id": str(i), "date_time": iso(START - HOUR)} for i in range(3)]
+    )
+    tracker.track([{"tweet_id": "0"}])  # Already tracked
+
+    assert len(tracker.poll_due()) == 2  # batch_size
+    assert len(tracker.poll_due()) == 1
+    assert tracker.poll_due() == []
+    # One hour old: next poll after max(0.1 * age, min_interval) = 360 s
+    assert tracker.seconds_until_due() == pytest.approx(360)
+
+
+def test_run_sleeps_until_the_next_tweet_is_due(tracker, clock):
+    tracker.track([{"tweet_id": "1", "date_time": iso(START - 10 * HOUR)}])
+    tracker.run(cycles=3, max_wait=6 * HOUR)
+
+    times = [when - START for when, _ in tracker.polled]
+    # 10 h old: 3600 s, then 11 h old: 3960 s
+    assert times == [0, 3600, 3600 + 3960]
+    assert [row["likes"] for row in load_series(tracker.store_file, "1")] == [1, 2, 3]
+
+
+def test_tweets_older_than_max_age_are_retired(tracker, clock):
+    tracker.track([{"tweet_id": "1", "date_time": iso(START - 3 * 86400)}])
+    assert tracker.poll_due() == []
+    assert tracker.posted == {}
+
+
+def test_schedule_survives_a_restart(tracker, clock, tmp_path):
+    tracker.track([{"tweet_id": "1", "date_time": iso(START - HOUR)}])
+    tracker.poll_due()
+
+    reloaded = EngagementTracker(None, store_file=tracker.store_file)
+    assert reloaded.posted == tracker.posted
+    assert reloaded.seconds_until_due() == pytest.approx(360)
+
+
+@pytest.mark.parametrize(
+    "text, count",
+    [
+        ("", 0),
+        ("1,234", 1234),
+        ("1.2K", 1200),
+        ("1,2K", 1200),
+        ("3M", 3_000_000),
+        ("1.2.3K", 0),
+        ("K", 0),
+        ("n/a", 0),
+    ],
+)
+def test_parse_count(text, count):
+    assert parse_count(text) == count